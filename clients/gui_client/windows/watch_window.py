@@ -42,7 +42,7 @@ def timesec():
 	return time.time() - _start
 
 def do_print(r):
-	print 'ret: %r' % (r, )
+	print('ret: %r' % (r, ))
 
 class WatchWindow(qtwindow.QTWindow):
 
@@ -56,6 +56,7 @@ class WatchWindow(qtwindow.QTWindow):
 
 		self._watch = {}
 		self._paused = False
+		self._poll_hid = None
 
 		self._frame = gtk.Frame()
 		self._frame.set_label(_L('Add variable'))
@@ -144,7 +145,16 @@ class WatchWindow(qtwindow.QTWindow):
 	def set_paused(self, paused):
 		logging.info('Watch win: setting paused to %s', paused)
 		self._pause_button.set_active(paused)
+		if paused == self._paused:
+			return
 		self._paused = paused
+		for ins_param, info in self._watch.items():
+			if info['delay'] == 0:
+				continue
+			if paused:
+				self._unsubscribe(ins_param)
+			else:
+				self._subscribe(ins_param)
 
 	def get_paused(self):
 		return self._paused
@@ -173,33 +183,42 @@ class WatchWindow(qtwindow.QTWindow):
 		active = self._ma_check.get_active()
 		self._ma_const.set_sensitive(active)
 
-	def _receive_reply(self, ins_param, result):
-		if ins_param not in self._watch:
-			return
-
-		# Update delay if we're querying too fast
-		info = self._watch[ins_param]
-		delta = time.time() - info['req_t']
-		info['avgtime'] = info['avgtime'] * 0.9 + delta * 0.1
-		if info['avgtime'] > info['delay'] / 1000.0:
-			self._set_delay(ins_param, info['delay'] * 2)
-		info['reply_received'] = True
-		self._update_cb(None, ins_param, result)
-
-	def _query_ins(self, ins_param):
+	def _subscribe(self, ins_param):
+		'''
+		Let the poller in the server read the parameter; values from all
+		watched parameters are collected by a single timer.
+		'''
 		info = self._watch[ins_param]
-		if not info['reply_received'] or self._paused:
-			logging.info('Not querying...')
-			return True
-
-		info['reply_received']= False
-		info['req_t']= time.time()
-		ins = info['instrument']
-		param = info['parameter']
-		ins.get(param, callback=lambda x: self._receive_reply(ins_param, x))
+		info['hid'] = qt.poller.subscribe(info['instrument'].get_name(),
+				info['parameter'], info['delay'] / 1000.0)
+		if self._poll_hid is None:
+			self._poll_hid = gobject.timeout_add(100, self._poll_cb)
 
+	def _unsubscribe(self, ins_param):
+		info = self._watch[ins_param]
+		if info['hid'] is not None:
+			qt.poller.unsubscribe(info['hid'])
+			info['hid'] = None
+
+	def _poll_cb(self):
+		names = [k for k, v in self._watch.items() if v['delay'] != 0]
+		if len(names) == 0:
+			self._poll_hid = None
+			return False
+		if not self._paused:
+			qt.poller.get_values(names, callback=self._receive_values)
 		return True
 
+	def _receive_values(self, values):
+		for ins_param, (t, val) in values.items():
+			if ins_param not in self._watch:
+				continue
+			info = self._watch[ins_param]
+			if t == info.get('last_t'):
+				continue
+			info['last_t'] = t
+			self._update_cb(None, ins_param, val)
+
 	def _ins_changed_cb(self, sender, changes, param, ins_param):
 		if ins_param not in self._watch or param not in changes:
 			return
@@ -221,8 +240,7 @@ class WatchWindow(qtwindow.QTWindow):
 			'instrument': ins,
 			'parameter': param,
 			'delay': delay,
-			'avgtime': delay / 1000.0,
-			'reply_received': True,
+			'hid': None,
 			'iter': iter,
 			'options': ins.get_shared_parameter_options(param),
 			'graph': self._graph_check.get_active(),
@@ -233,13 +251,12 @@ class WatchWindow(qtwindow.QTWindow):
 
 		self._watch[ins_param] = info
 		if delay != 0:
-			hid = gobject.timeout_add(int(delay), self._query_ins, ins_param)
+			if not self._paused:
+				self._subscribe(ins_param)
 		else:
-			hid = ins.connect('changed', lambda sender, changes: \
+			info['hid'] = ins.connect('changed', lambda sender, changes: \
 					self._ins_changed_cb(sender, changes, param, ins_param))
 
-		self._watch[ins_param]['hid'] = hid
-
 	def _get_ncols(self, info, val):
 		nvals = 1
 		try:
@@ -319,8 +336,8 @@ class WatchWindow(qtwindow.QTWindow):
 
 	def _set_delay(self, ins_param, delay):
 		info = self._watch[ins_param]
-		gobject.source_remove(info['hid'])
-		info['hid'] = gobject.timeout_add(int(delay), self._query_ins, ins_param)
+		if info['hid'] is not None:
+			qt.poller.set_interval(info['hid'], delay / 1000.0)
 		info['delay'] = delay
 		strval = '%d ms' % (delay,)
 		self._tree_model.set(info['iter'], 1, strval)
@@ -334,9 +351,9 @@ class WatchWindow(qtwindow.QTWindow):
 
 			info = self._watch[ins_param]
 			if info['delay'] != 0:
-				gobject.source_remove(info['hid'])
+				self._unsubscribe(ins_param)
 			else:
-				info['ins'].disconnect(info['hid'])
+				info['instrument'].disconnect(info['hid'])
 			del self._watch[ins_param]
 
 	def _apply_clicked_cb(self, widget):
@@ -0,0 +1,33 @@
+# Script to test the speed of adding points to an in-memory Data object
+#
+# This example should be run with "execfile('test_data_speed.py')"
+
+import time
+import numpy as np
+import qt
+
+N = 1000000
+
+d = qt.Data(name='speedtest', infile=False, inmem=True)
+d.add_coordinate('x')
+d.add_value('y')
+
+start = time.time()
+for i in range(N):
+    d.add_data_point(i, 0.5 * i)
+stop = time.time()
+print('add_data_point, %d points: %s sec' % (N, stop - start))
+
+start = time.time()
+data = d.get_data()
+stop = time.time()
+print('get_data, shape %s: %s sec' % (data.shape, stop - start))
+
+# Reference: the old implementation, copying the array for every point
+M = 20000
+a = np.zeros((0, 2))
+start = time.time()
+for i in range(M):
+    a = np.append(a, [(i, 0.5 * i)], axis=0)
+stop = time.time()
+print('np.append, %d points: %s sec' % (M, stop - start))
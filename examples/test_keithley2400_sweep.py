@@ -0,0 +1,33 @@
+# Script to compare the speed of an IV curve measured point by point with
+# set_current and read_val to the built-in sweep of the Keithley 2400,
+# which fetches all readings in one transfer.
+#
+# Change the address, currents and compliance for your sample.
+# This example should be run with "execfile('test_keithley2400_sweep.py')"
+
+import time
+import numpy as np
+import qt
+
+k = qt.instruments.create('k2400_test', 'Keithley_2400', address='GPIB::24')
+currents = np.linspace(-1e-6, 1e-6, 101)
+
+k.set_current_source(1e-6)
+k.set_voltage_comp(2.0)
+
+start = time.time()
+for i in currents:
+    k.set_current(i)
+    k.read_val()
+print('set_current/read_val: %.2f s for %d points' % (time.time() - start, len(currents)))
+
+start = time.time()
+data = k.sweep_linear(currents[0], currents[-1], len(currents), source='CURR')
+print('sweep_linear: %.2f s for %d points' % (time.time() - start, len(data)))
+
+start = time.time()
+data = k.sweep_list(currents, source='CURR')
+print('sweep_list: %.2f s for %d points' % (time.time() - start, len(data)))
+
+k.set_current(0)
+k.disable_source()
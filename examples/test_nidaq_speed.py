@@ -0,0 +1,26 @@
+# Script to test the speed of NI DAQ reads on the simulated DAQmx library,
+# which takes 2 ms to start a task. Single point reads that set up a task
+# every time are compared to reads from the task pool.
+#
+# This example should be run with "execfile('test_nidaq_speed.py')"
+
+import time
+from lib.dll_support import nidaq
+
+mock = nidaq.use_mock()
+mock.start_delay = 2e-3
+pool = nidaq.get_task_pool()
+N = 200
+
+def timeit(name, func, *args):
+    mock.reset_calls()
+    start = time.time()
+    for i in range(N):
+        func(*args)
+    stop = time.time()
+    print('%s: %.3f ms per call, %.1f DAQmx calls' % \
+        (name, (stop - start) / N * 1e3, mock.get_ncalls() / float(N)))
+
+timeit('read', nidaq.read, 'Dev1/ai0', 1, 10000.0, -10.0, 10.0, 10.0, 'RSE')
+timeit('TaskPool.read_ai', pool.read_ai, 'Dev1/ai0', 'RSE')
+
@@ -0,0 +1,78 @@
+# Script to test the throughput of the object sharer over localhost, by
+# requesting numpy traces from a shared object in a separate process.
+# Both protocol 1 (plain pickle) and protocol 2 (out-of-band buffers) are
+# measured.
+#
+# Run from the qtlab directory with "python examples/test_object_sharer_speed.py"
+
+import os
+import socket
+import subprocess
+import sys
+import time
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', 'source'))
+from lib.network import object_sharer as objsh
+
+PORT = 12099
+SIZES = (1000, 100000, 1000000, 10000000)
+NREPEAT = 5
+
+class TraceSource(objsh.SharedObject):
+
+    def __init__(self):
+        objsh.SharedObject.__init__(self, 'trace')
+
+    def get_trace(self, n):
+        return numpy.random.rand(n)
+
+def run_server(port):
+    TraceSource()
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(('127.0.0.1', port))
+    server.listen(1)
+    conn, addr = server.accept()
+    while objsh.helper.receive(conn):
+        pass
+    server.close()
+
+def connect(port):
+    for i in range(50):
+        try:
+            return socket.create_connection(('127.0.0.1', port))
+        except socket.error:
+            time.sleep(0.1)
+    raise Exception('Unable to connect to server')
+
+def run_client(port, protocol):
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+        'server', str(port)])
+    try:
+        objsh.helper.set_max_protocol(protocol)
+        conn = connect(port)
+        client = objsh.helper.add_client(conn, None)
+        trace = objsh.ObjectProxy(conn, client.get_object_info('trace'))
+
+        print('Protocol %d:' % protocol)
+        for n in SIZES:
+            start = time.time()
+            for i in range(NREPEAT):
+                data = trace.get_trace(n, timeout=60)
+            dt = (time.time() - start) / NREPEAT
+            assert len(data) == n
+            print('  %8d points: %8.2f ms, %7.1f MB/s' % \
+                (n, dt * 1000, data.nbytes / dt / 1e6))
+
+        conn.close()
+    finally:
+        proc.wait()
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2 and sys.argv[1] == 'server':
+        run_server(int(sys.argv[2]))
+    else:
+        run_client(PORT, 1)
+        run_client(PORT + 1, objsh.PROTOCOL_VERSION)
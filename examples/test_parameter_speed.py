@@ -0,0 +1,44 @@
+# Script to test the overhead of Instrument parameter get / set functions,
+# using a driver that does nothing.
+#
+# This example should be run with "execfile('test_parameter_speed.py')"
+
+import time
+from instrument import Instrument
+
+class NoOp(Instrument):
+
+    def __init__(self, name):
+        Instrument.__init__(self, name)
+        self.add_parameter('x', type=float,
+            flags=Instrument.FLAG_GETSET, minval=-10, maxval=10)
+        self.add_parameter('y', type=float, flags=Instrument.FLAG_GET)
+        self._x = 0
+
+    def do_set_x(self, val):
+        self._x = val
+
+    def do_get_x(self):
+        return self._x
+
+    def do_get_y(self):
+        return 1.0
+
+ins = NoOp('noop')
+N = 1000000
+
+def timeit(name, func, *args):
+    start = time.time()
+    i = 0
+    while i < N:
+        func(*args)
+        i += 1
+    stop = time.time()
+    print('%s: %.3f us per call' % (name, (stop - start) / N * 1e6))
+
+timeit('do_set_x', ins.do_set_x, 0.1)
+timeit('set_x', ins.set_x, 0.1)
+timeit('set_x(fast=True)', lambda v: ins.set_x(v, fast=True), 0.1)
+timeit('do_get_y', ins.do_get_y)
+timeit('get_y', ins.get_y)
+timeit("get('y')", ins.get, 'y')
@@ -0,0 +1,49 @@
+# Script to test the speed of the QDevilQdac serial communication, using a
+# fake serial port that answers like a QDAC at 460800 baud. Reading the
+# currents of 24 channels one command at a time is compared to the
+# pipelined getCurrentReadings, and the old per-byte reader to the
+# buffered one.
+#
+# This example should be run with "execfile('test_qdac_speed.py')"
+
+import time
+import QDevilQdac
+from _QDevilQdac.fake_serial import FakeQdacSerial
+
+fake = FakeQdacSerial()
+ins = QDevilQdac.QDevilQdac('qdac_fake', None, sport=fake)
+channels = list(range(1, 25))
+N = 100
+
+def read_line_per_byte():
+    out = b''
+    while True:
+        c = fake.read(1)
+        if not c or c == b'\n':
+            return out
+        out += c
+
+def timeit(name, func, *args):
+    fake.nreads = 0
+    start = time.time()
+    for i in range(N):
+        func(*args)
+    stop = time.time()
+    print('%s: %.3f ms per call, %.1f reads' % \
+        (name, (stop - start) / N * 1e3, fake.nreads / float(N)))
+
+def currents_per_byte():
+    for ch in channels:
+        fake.write(b'get %d\n' % ch)
+        read_line_per_byte()
+
+def currents_sequential():
+    for ch in channels:
+        ins.getCurrentReading(ch)
+
+for baudrate in (460800, None):
+    fake.baudrate = baudrate
+    print('Baud rate %s' % baudrate)
+    timeit('24 currents, per-byte reads', currents_per_byte)
+    timeit('24 currents, getCurrentReading', currents_sequential)
+    timeit('24 currents, getCurrentReadings', ins.getCurrentReadings, channels)
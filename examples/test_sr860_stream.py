@@ -0,0 +1,32 @@
+# Script to test the SR860 stream receiver with a fake instrument sending
+# UDP packets over localhost. For several sample rates the number of
+# received and lost packets is reported.
+#
+# Run from the qtlab directory with "python examples/test_sr860_stream.py"
+
+import os
+import sys
+import time
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    '..', 'instrument_plugins'))
+from _SR860.stream import StreamReceiver, FakeSR860Sender
+
+RATES = (1250, 10000, 78125, 312500)
+DURATION = 2.0
+
+for rate in RATES:
+    receiver = StreamReceiver(port=0, nchannels=2)
+    receiver.start()
+    sender = FakeSR860Sender(receiver.get_port(), content=1, rate=rate)
+    sender.run(DURATION).join()
+    time.sleep(0.2)
+    sender.stop()
+    receiver.stop()
+
+    stats = receiver.get_stats()
+    samples = receiver.get_last(receiver.get_total())
+    nan = numpy.isnan(samples[:,0]).sum()
+    print('%7d Hz: %8d samples, %5d packets, %d lost, %d NaN samples' % \
+        (rate, len(samples), stats['packets'], stats['lost'], nan))
@@ -13,18 +13,21 @@ import source.qt as qt
 # GS610 = qt.instruments.create('gs610', 'GS610', address='GPIB::1')
 print("Successfully connected to a GS610 on GP-IB address 1.")
 
-# lock-in amplifiers
-SR830 = qt.instruments.create("sr830", "SR830", address="GPIB::9")
+# Instruments are created with create_many, which creates instruments on
+# different buses in parallel. Add GPIB instruments to the list below.
+# GS610 on GP-IB address 1: ("gs610", "GS610", {"address": "GPIB::1"})
+# SR860 on GP-IB address 4: ("sr860", "SR860", {"address": "GPIB::4"})
+print("Setting up SR830 and K2400...")
+_ins = qt.instruments.create_many([
+    # lock-in amplifiers
+    ("sr830", "SR830", {"address": "GPIB::9"}),
+    ##K2400
+    ("keithley1", "Keithley_2400", {"address": "GPIB::24", "change_display": False}),
+])
+SR830 = _ins["sr830"]
 print("Successfully connected to an SR830 on GP-IB address 9.")
-# SR860 = qt.instruments.create('sr860', 'SR860', address='GPIB::4')
-# print("Successfully connected to an SR860 on GP-IB address 4.")
-
-# ---
-
-##K2400
-print("Setting up K2400...")
-KEITH = qt.instruments.create(
-    "keithley1", "Keithley_2400", address="GPIB::24", change_display=False
-)
+KEITH = _ins["keithley1"]
 
+for _name, _t in sorted(qt.instruments.get_create_times().items()):
+    print("  %s created in %.2f s" % (_name, _t))
 print("All instruments set up and good to go!")
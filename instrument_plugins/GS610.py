@@ -4,7 +4,7 @@ TODO add docstring
 
 # import logging
 
-import visa
+import myVisa
 import numpy as np
 import source.qt as qt
 from source.instrument import Instrument
@@ -31,7 +31,7 @@ class GS610(Instrument):
         add docstring
         """
         Instrument.__init__(self, name, tags=["physical"])
-        self._visainstrument = visa.ResourceManager().get_instrument(address)
+        self._visainstrument = myVisa.get_resource_manager().get_instrument(address)
 
         # output commands (output group)
         # TODO add 1/0 options
@@ -64,14 +64,17 @@ class IVVI(Instrument):
             self._numdacs = int(numdacs)
         else:
             logging.error('Number of dacs needs to be multiple of 4')
-        self.pol_num = range(self._numdacs)
+        self.pol_num = list(range(self._numdacs))
+        self._dac_cache = None
         
         
         # Add functions
         self.add_function('reset')
         self.add_function('get_all')
         self.add_function('set_dacs_zero')
+        self.add_function('set_dacs')
         self.add_function('get_numdacs')
+        self.add_function('invalidate_cache')
 
         # Add parameters
         self.add_parameter('pol_dacrack',
@@ -175,12 +178,32 @@ class IVVI(Instrument):
             None
         '''
         logging.info('Get all')
-        for i in range(self._numdacs):
-            self.get('dac%d' % (i+1))
+        self.get(['dac%d' % (i+1) for i in range(self._numdacs)])
 
     def set_dacs_zero(self):
-        for i in range(self._numdacs):
-            self.set('dac%d' % (i+1), 0)
+        self.set(dict(('dac%d' % (i+1), 0) for i in range(self._numdacs)))
+
+    def set_dacs(self, dacnrs, mvoltages):
+        '''
+        Sets several dacs at once: the messages are sent in a single write
+        and the replies read in a single read. Steps larger than maxstep
+        are taken together for all dacs.
+
+        Input:
+            dacnrs (int[])      : 1 based indices of the dacs
+            mvoltages (float[]) : output voltages in mV
+
+        Output:
+            None
+        '''
+        self.set(dict(('dac%d' % dacnr, float(mvoltage))
+            for dacnr, mvoltage in zip(dacnrs, mvoltages)))
+
+    def invalidate_cache(self):
+        '''
+        Forget the stored dac values, so the next get reads the rack.
+        '''
+        self._dac_cache = None
 
     # Conversion of data
     def _mvoltage_to_bytes(self, mvoltage):
@@ -204,15 +227,16 @@ class IVVI(Instrument):
         Converts a list of bytes to a list containing
         the corresponding mvoltages
         '''
-        values = range(self._numdacs)
-        for i in range(self._numdacs):
-            values[i] = ((numbers[2 + 2*i]*256 + numbers[3 + 2*i])/65535.0*4000.0) + self.pol_num[i]
-        return values
+        data = numpy.array(numbers[2:2 + 2*self._numdacs]).reshape(-1, 2)
+        values = (data[:,0]*256 + data[:,1]) / 65535.0 * 4000.0
+        return list(values + numpy.array(self.pol_num))
 
     # Communication with device
     def do_get_dac(self, channel):
         '''
-        Returns the value of the specified dac
+        Returns the value of the specified dac. All dacs are read at once
+        and kept until the next write, so getting several dacs in a row
+        reads the rack only once.
 
         Input:
             channel (int) : 1 based index of the dac
@@ -221,7 +245,7 @@ class IVVI(Instrument):
             voltage (float) : dacvalue in mV
         '''
         logging.debug('Reading dac%s', channel)
-        mvoltages = self._get_dacs()
+        mvoltages = self._get_dacs(cached=True)
         return mvoltages[channel - 1]
 
     def do_set_dac(self, mvoltage, channel):
@@ -236,25 +260,79 @@ class IVVI(Instrument):
             reply (string) : errormessage
         '''
         logging.debug('Setting dac%s to %.02f mV', channel, mvoltage)
-        (DataH, DataL) = self._mvoltage_to_bytes(mvoltage - self.pol_num[channel-1])
-        message = "%c%c%c%c%c%c%c" % (7, 0, 2, 1, channel, DataH, DataL)
+        self._dac_cache = None
+        message = self._dac_message(mvoltage, channel)
         reply = self._send_and_read(message)
         return reply
 
-    def _get_dacs(self):
+    def _dac_message(self, mvoltage, channel):
+        (DataH, DataL) = self._mvoltage_to_bytes(mvoltage - self.pol_num[channel-1])
+        return "%c%c%c%c%c%c%c" % (7, 0, 2, 1, channel, DataH, DataL)
+
+    def _do_get_many(self, names, **kwargs):
+        '''
+        Reads all dacs with a single message, used by get() when getting
+        a list of parameters.
+
+        Input:
+            names (string[]) : parameter names
+
+        Output:
+            values (dict) : parameter name -> mvoltage for the dacs in names
+        '''
+        mvoltages = self._get_dacs()
+        values = {}
+        for name in names:
+            if name.startswith('dac'):
+                channel = self.get_parameter_options(name)['channel']
+                values[name] = mvoltages[channel - 1]
+        return values
+
+    def _do_set_many(self, values, **kwargs):
+        '''
+        Sets several dacs, sending the messages in a single write and
+        reading the replies afterwards. Used by set() when setting a
+        dictionary of parameters.
+
+        Input:
+            values (dict) : parameter name -> mvoltage
+
+        Output:
+            names (string[]) : names of the dacs that were set
+        '''
+        names = []
+        messages = []
+        for name, mvoltage in values.items():
+            if name.startswith('dac'):
+                channel = self.get_parameter_options(name)['channel']
+                names.append(name)
+                messages.append(self._dac_message(mvoltage, channel))
+
+        if len(messages) > 0:
+            logging.debug('Setting %d dacs', len(messages))
+            self._dac_cache = None
+            self._send_and_read_many(messages)
+        return names
+
+    def _get_dacs(self, cached=False):
         '''
         Reads from device and returns all dacvoltages in a list
 
         Input:
-            None
+            cached (bool) : return the values of the last read if no dac
+                            was set since
 
         Output:
             voltages (float[]) : list containing all dacvoltages (in mV)
         '''
+        if cached and self._dac_cache is not None:
+            return self._dac_cache
+
         logging.debug('Getting dac voltages from instrument')
         message = "%c%c%c%c" % (4, 0, self._numdacs*2+2, 2)
         reply = self._send_and_read(message)
         mvoltages = self._numbers_to_mvoltages(reply)
+        self._dac_cache = mvoltages
         return mvoltages
         
     def _send_and_read(self, message):
@@ -281,18 +359,67 @@ class IVVI(Instrument):
 #            logging.error('Failed to receive reply from IVVI rack')
 #            return False
 
+        return self._read_reply()
+
+    def _send_and_read_many(self, messages):
+        '''
+        Send several messages to the device in a single write and read
+        the answers in order. The third byte of each message is the length
+        of its reply, so all replies are read at once.
+
+        Input:
+            messages (string[]) : strings conform the IVVI protocol
+
+        Output:
+            replies (int[][]) : list of return messages
+        '''
+        logging.debug('Sending %d messages', len(messages))
+
+        # clear input buffer
+        visafunc.read_all(self._vi)
+        vpp43.write(self._vi, ''.join(messages))
+
+        sizes = [ord(message[2]) for message in messages]
+        data = [ord(s) for s in visafunc.readn(self._vi, sum(sizes))]
+        replies = []
+        pos = 0
+        for size in sizes:
+            reply = data[pos:pos+size]
+            pos += size
+            if len(reply) != size or reply[0] != size:
+                logging.error('Unexpected reply %s, expected %d bytes',
+                    reply, size)
+                continue
+            self._check_reply(reply)
+            replies.append(reply)
+        return replies
+
+    def _read_reply(self):
+        '''
+        Read a single answer from the device.
+
+        Output:
+            data_out_numbers (int[]) : return message
+        '''
         data1 = visafunc.readn(self._vi, 2)
         data1 = [ord(s) for s in data1]
-
-        # 0 = no error, 32 = watchdog reset
-        if data1[1] not in (0, 32):
-            logging.error('Error while reading: %s', data1)
+        self._check_reply(data1)
 
         data2 = visafunc.readn(self._vi, data1[0] - 2)
         data2 = [ord(s) for s in data2]
 
         return data1 + data2
 
+    def _check_reply(self, reply):
+        '''
+        Check the status byte of a reply.
+        '''
+        # 0 = no error, 32 = watchdog reset
+        if reply[1] == 32:
+            self._dac_cache = None
+        elif reply[1] != 0:
+            logging.error('Error while reading: %s', reply)
+
     def do_set_pol_dacrack(self, flag, channel, getall=True):
         '''
         Changes the polarity of the specified set of dacs
@@ -312,6 +439,7 @@ class IVVI(Instrument):
 
         logging.debug('Setting polarity of rack %d to %s', channel, flag)
         val = flagmap[flag.upper()]
+        self._dac_cache = None
         for i in range(4*(channel-1),4*(channel)):
             self.pol_num[i] = val
             self.set_parameter_bounds('dac%d' % (i+1), val, val + 4000.0)
@@ -345,27 +473,67 @@ class IVVI(Instrument):
         '''
         Creates array of mvoltages, in integer steps of the dac resolution. Either
         the dac polarity, or the dacnr needs to be specified.
+
+        For a single dac this is numpy.arange(start, stop + 1, step) in dac
+        units, as before: a negative step is needed to sweep down, and then
+        stop is not included.
+
+        To build a sweep table for several dacs at once, give lists for start,
+        stop and dacnr (or pol). The dac with the largest range then moves
+        abs(step) dac units per point, the others move proportionally,
+        rounded to their resolution. Each dac goes from its start to its stop
+        value, the sign of step is ignored. The table can be set row by row
+        with set_dacs.
+
+        Input:
+            start (float or float[]) : start mvoltage(s)
+            stop (float or float[])  : stop mvoltage(s)
+            step (int)               : step size in dac units
+            pol (string or string[]) : 'BIP', 'POS' or 'NEG'
+            dacnr (int or int[])     : 1 based index of the dac(s)
+
+        Output:
+            mvoltages (numpy.ndarray) : shape (npoints,) or (npoints, ndacs)
         '''
+        flagmap = {'NEG': -4000, 'BIP': -2000, 'POS': 0}
         if pol is not None and dacnr is not None:
             logging.error('byte_limited_arange: speficy "pol" OR "dacnr", NOT both!')
+            return None
         elif pol is None and dacnr is None:
             logging.error('byte_limited_arange: need to specify "pol" or "dacnr"')
+            return None
         elif dacnr is not None:
-            pol = self.get_pol_dac(dacnr)
-
-        if (pol.upper() == 'NEG'):
-            polnum = -4000
-        elif (pol.upper() == 'BIP'):
-            polnum = -2000
-        elif (pol.upper() == 'POS'):
-            polnum = 0
+            polnum = numpy.array([self.pol_num[i-1] for i in numpy.ravel(dacnr)])
         else:
-            logging.error('Try to set invalid dacpolarity')
-
-        start_byte = int(round((start-polnum)/4000.0*65535))
-        stop_byte = int(round((stop-polnum)/4000.0*65535))
-        byte_vec = numpy.arange(start_byte, stop_byte+1, step)
-        mvolt_vec = byte_vec/65535.0 * 4000.0 + polnum
+            try:
+                polnum = numpy.array([flagmap[p.upper()] for p in numpy.ravel(pol)])
+            except KeyError:
+                logging.error('Try to set invalid dacpolarity')
+                return None
+
+        if numpy.ndim(start) == 0 and numpy.ndim(stop) == 0 and len(polnum) == 1:
+            polnum = polnum[0]
+            start_byte = int(round((start-polnum)/4000.0*65535))
+            stop_byte = int(round((stop-polnum)/4000.0*65535))
+            byte_vec = numpy.arange(start_byte, stop_byte+1, step)
+            return byte_vec/65535.0 * 4000.0 + polnum
+
+        if step == 0:
+            logging.error('byte_limited_arange: step should not be 0')
+            return None
+        step = abs(step)
+        start_byte = numpy.round((numpy.atleast_1d(start) - polnum) / 4000.0 * 65535)
+        stop_byte = numpy.round((numpy.atleast_1d(stop) - polnum) / 4000.0 * 65535)
+        span = stop_byte - start_byte
+        maxspan = numpy.max(numpy.abs(span))
+        nsteps = int(maxspan // step)
+
+        k = numpy.arange(nsteps + 1)[:, numpy.newaxis] * step
+        if maxspan > 0:
+            byte_vec = numpy.round(start_byte + span * k / maxspan)
+        else:
+            byte_vec = start_byte + 0 * k
+        mvolt_vec = byte_vec / 65535.0 * 4000.0 + polnum
         return mvolt_vec
 
     def get_numdacs(self):
@@ -21,7 +21,7 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 from instrument import Instrument
-import visa
+import myVisa
 import types
 import logging
 import numpy
@@ -74,7 +74,7 @@ class Keithley_2000(Instrument):
         
         self._address = address
         #self._visainstrument = visa.instrument(self._address)
-        rm = visa.ResourceManager()
+        rm = myVisa.get_resource_manager()
         self._visainstrument = rm.get_instrument(self._address)
         
         
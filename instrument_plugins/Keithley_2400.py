@@ -5,7 +5,7 @@ TODO add docstring
 import logging
 from time import time, sleep
 
-import visa
+import myVisa
 import numpy as np
 import source.qt as qt
 from source.instrument import Instrument
@@ -61,7 +61,7 @@ class Keithley_2400(Instrument):
         self._address = address
         self.name = name
         # self._visainstrument = visa.instrument(self._address)
-        rm = visa.ResourceManager()
+        rm = myVisa.get_resource_manager()
         self._visainstrument = rm.get_instrument(self._address)
 
         self.modes = [
@@ -102,6 +102,10 @@ class Keithley_2400(Instrument):
         self.add_function("reset")
         self.add_function("ramp_to_current")
         self.add_function("ramp_to_voltage")
+        self.add_function("sweep_linear")
+        self.add_function("sweep_list")
+        self.add_function("RvsI")
+        self.add_function("RvsIaboutZero")
         self.add_function("trigger")
         self.add_function("trigger_immediately")
         self.add_function("trigger_on_bus")
@@ -384,6 +388,118 @@ class Keithley_2400(Instrument):
             self._visainstrument.write(":SOUR:VOLT:LEV {}".format(i))
             qt.msleep(0.001)
 
+    def sweep_linear(
+        self,
+        start,
+        stop,
+        points,
+        source="CURR",
+        delay=0.0,
+        elements=("VOLT", "CURR"),
+        data=None,
+        timeout=60.0,
+    ):
+        """Runs a linear sweep of the source with the built-in sweep of
+        the 2400. The instrument sources and measures all points by itself,
+        the readings are fetched from its buffer in a single transfer.
+
+        :param start: First source value in Amps or Volts
+        :param stop: Last source value in Amps or Volts
+        :param points: Number of points, at most 2500
+        :param source: Source function, "CURR" or "VOLT"
+        :param delay: Source delay in seconds before each measurement
+        :param elements: Reading elements to return, see :FORM:ELEM
+        :param data: Optional Data object to add all readings to
+        :param timeout: Maximum time in seconds to wait for the sweep
+        :return: Array of shape (points, len(elements))
+        """
+        self._setup_sweep(source, points)
+        self._visainstrument.write(
+            ":SOUR:%s:STAR %g;:SOUR:%s:STOP %g;:SOUR:SWE:POIN %d;:SOUR:SWE:SPAC LIN"
+            % (source, start, source, stop, points)
+        )
+        self._visainstrument.write(":SOUR:%s:MODE SWE" % source)
+        return self._run_sweep(source, stop, points, delay, elements, data, timeout)
+
+    def sweep_list(
+        self,
+        values,
+        source="CURR",
+        delay=0.0,
+        elements=("VOLT", "CURR"),
+        data=None,
+        timeout=60.0,
+    ):
+        """Runs a list sweep of the source with the built-in sweep of the
+        2400, see :meth:`~.sweep_linear`.
+
+        :param values: Source values in Amps or Volts, at most 2500
+        :return: Array of shape (len(values), len(elements))
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        self._setup_sweep(source, len(values))
+
+        # The list is sent in chunks of 100 points
+        for i in range(0, len(values), 100):
+            cmd = ":SOUR:LIST:%s" % source
+            if i > 0:
+                cmd += ":APP"
+            chunk = ",".join("%g" % v for v in values[i : i + 100])
+            self._visainstrument.write("%s %s" % (cmd, chunk))
+        self._visainstrument.write(":SOUR:%s:MODE LIST" % source)
+        return self._run_sweep(
+            source, values[-1], len(values), delay, elements, data, timeout
+        )
+
+    def _setup_sweep(self, source, points):
+        if source not in ("CURR", "VOLT"):
+            raise Exception("Keithley 2400 can only sweep CURR or VOLT")
+        if points < 1 or points > 2500:
+            raise Exception("Keithley 2400 sweeps have 1 to 2500 points")
+        self._visainstrument.write(":SOUR:FUNC %s" % source)
+
+    def _run_sweep(self, source, last, points, delay, elements, data, timeout):
+        """Arms a programmed sweep, waits until it finishes and reads the
+        buffer. Afterwards the source is left at the last sweep value and
+        the data format is restored for read_val."""
+        ins = self._visainstrument
+        form_data = ins.query(":FORM:DATA?").strip()
+        form_elem = ins.query(":FORM:ELEM?").strip()
+        ins.write(
+            ":SOUR:DEL %g;:ARM:COUN 1;:ARM:SOUR IMM;:TRIG:SOUR IMM;:TRIG:COUN %d"
+            % (delay, points)
+        )
+        ins.write(":FORM:DATA ASC;:FORM:ELEM %s" % ",".join(elements))
+        ins.write(":TRAC:CLE;:TRAC:POIN %d;:TRAC:FEED SENS;:TRAC:FEED:CONT NEXT" % points)
+
+        # Operation complete sets the event summary bit of the status byte
+        ins.write("*CLS;*ESE 1;*SRE 32")
+        ins.write(":OUTP ON;:INIT;*OPC")
+        try:
+            self._wait_for_sweep(timeout)
+            text = ins.query(":TRAC:DATA?")
+        finally:
+            ins.write(
+                ":TRAC:FEED:CONT NEV;:TRIG:COUN 1;*SRE 0;:SOUR:%s:LEV %g;:SOUR:%s:MODE FIX"
+                % (source, last, source)
+            )
+            ins.write(":FORM:DATA %s;:FORM:ELEM %s" % (form_data, form_elem))
+
+        values = np.fromstring(text, sep=",").reshape(-1, len(elements))
+        self.check_errors()
+
+        if data is not None:
+            data.add_data_point(values)
+        return values
+
+    def _wait_for_sweep(self, timeout):
+        start = time()
+        while not self._visainstrument.read_stb() & 32:
+            if (time() - start) > timeout:
+                self._visainstrument.write(":ABOR")
+                raise Exception("Keithley 2400 sweep timed out")
+            qt.msleep(0.01)
+
     def get_resistance(self):
         self.measure_resistance()
         return self.read_val()
@@ -479,44 +595,57 @@ class Keithley_2400(Instrument):
     def status(self):
         return self._visainstrument.query("status:queue?;")
 
-    """
-    def RvsI(self, startI, stopI, stepI, compliance, delay=10.0e-3, backward=False):
-        num = int(float(stopI-startI)/float(stepI)) + 1
-        currRange = 1.2*max(abs(stopI),abs(startI))
-        # self.write(":SOUR:CURR 0.0")
-        self.write(":SENS:VOLT:PROT %g" % compliance)
-        self.write(":SOUR:DEL %g" % delay)
-        self.write(":SOUR:CURR:RANG %g" % currRange )
-        self.write(":SOUR:SWE:RANG FIX")
-        self.write(":SOUR:CURR:MODE SWE")
-        self.write(":SOUR:SWE:SPAC LIN")
-        self.write(":SOUR:CURR:STAR %g" % startI)
-        self.write(":SOUR:CURR:STOP %g" % stopI)
-        self.write(":SOUR:CURR:STEP %g" % stepI)
-        self.write(":TRIG:COUN %d" % num)
+    def RvsI(
+        self, startI, stopI, stepI, compliance, delay=10.0e-3, backward=False, data=None
+    ):
+        """Measures the voltage during a linear current sweep, using the
+        built-in sweep of the 2400 (see :meth:`~.sweep_linear`).
+
+        :param startI: First current in Amps
+        :param stopI: Last current in Amps
+        :param stepI: Current step in Amps
+        :param compliance: Voltage compliance in Volts
+        :param delay: Source delay in seconds before each measurement
+        :param backward: If True sweep from stopI to startI
+        :param data: Optional Data object to add the (current, voltage) rows to
+        :return: Array of (current, voltage) rows
+        """
+        num = int(round(float(stopI - startI) / float(stepI))) + 1
+        self.set_voltage_comp(compliance)
+        self.set_current_source(1.2 * max(abs(stopI), abs(startI)))
+        self._visainstrument.write(":SOUR:SWE:RANG FIX")
         if backward:
-            currents = np.linspace(stopI, startI, num)
-            self.write(":SOUR:SWE:DIR DOWN")
-        else:
-            currents = np.linspace(startI, stopI, num)
-            self.write(":SOUR:SWE:DIR UP")
-        self.connection.timeout = 30.0
-        self.enable_source()
-        data = self.values(":READ?") 
-
-        self.check_errors()
-        return zip(currents,data)
+            startI, stopI = stopI, startI
+        return self.sweep_linear(
+            startI,
+            stopI,
+            num,
+            source="CURR",
+            delay=delay,
+            elements=("CURR", "VOLT"),
+            data=data,
+        )
 
     def RvsIaboutZero(self, minI, maxI, stepI, compliance, delay=10.0e-3):
+        """Measures RvsI up and down for positive and negative currents."""
         data = []
-        data.extend(self.RvsI(minI, maxI, stepI, compliance=compliance, delay=delay))
-        data.extend(self.RvsI(minI, maxI, stepI, compliance=compliance, delay=delay, backward=True))
-        self.disable_source()    
-        data.extend(self.RvsI(-minI, -maxI, -stepI, compliance=compliance, delay=delay))
-        data.extend(self.RvsI(-minI, -maxI, -stepI, compliance=compliance, delay=delay, backward=True))
+        data.append(self.RvsI(minI, maxI, stepI, compliance=compliance, delay=delay))
+        data.append(
+            self.RvsI(
+                minI, maxI, stepI, compliance=compliance, delay=delay, backward=True
+            )
+        )
         self.disable_source()
-        return data 
-    """
+        data.append(
+            self.RvsI(-minI, -maxI, -stepI, compliance=compliance, delay=delay)
+        )
+        data.append(
+            self.RvsI(
+                -minI, -maxI, -stepI, compliance=compliance, delay=delay, backward=True
+            )
+        )
+        self.disable_source()
+        return np.vstack(data)
 
     def use_rear_terminals(self):
         """Enables the rear terminals for measurement, and
@@ -15,7 +15,6 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
-import types
 from lib.dll_support import nidaq
 from instrument import Instrument
 import qt
@@ -29,17 +28,31 @@ def _get_channel(devchan):
     return parts[1]
 
 class NI_DAQ(Instrument):
-
-    def __init__(self, name, id):
+    '''
+    National Instruments DAQ card. Single point reads and writes use tasks
+    from the nidaq task pool, which stay configured between calls.
+
+    For fast measurements there is a continuous, hardware-timed acquisition
+    (start_acquisition) and a hardware-timed output sweep with synchronized
+    input readout (sweep). Use simulate=True to run on the simulated
+    DAQmx library; all simulated devices share it, and simulating is not
+    possible when the real DAQmx library is loaded.
+    '''
+
+    def __init__(self, name, id, simulate=False):
         Instrument.__init__(self, name, tags=['physical'])
 
+        if simulate:
+            nidaq.use_mock()
         self._id = id
+        self._pool = nidaq.get_task_pool()
+        self._acquisition = None
 
         for ch_in in self._get_input_channels():
             ch_in = _get_channel(ch_in)
             self.add_parameter(ch_in,
                 flags=Instrument.FLAG_GET,
-                type=types.FloatType,
+                type=float,
                 units='V',
                 tags=['measure'],
                 get_func=self.do_get_input,
@@ -49,7 +62,7 @@ class NI_DAQ(Instrument):
             ch_out = _get_channel(ch_out)
             self.add_parameter(ch_out,
                 flags=Instrument.FLAG_SET,
-                type=types.FloatType,
+                type=float,
                 units='V',
                 tags=['sweep'],
                 set_func=self.do_set_output,
@@ -59,29 +72,33 @@ class NI_DAQ(Instrument):
             ch_ctr = _get_channel(ch_ctr)
             self.add_parameter(ch_ctr,
                 flags=Instrument.FLAG_GET,
-                type=types.IntType,
+                type=int,
                 units='#',
                 tags=['measure'],
                 get_func=self.do_get_counter,
                 channel=ch_ctr)
             self.add_parameter(ch_ctr + "_src",
                 flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET,
-                type=types.StringType,
+                type=str,
                 set_func=self.do_set_counter_src,
                 channel=ch_ctr)
 
         self.add_parameter('chan_config',
             flags=Instrument.FLAG_SET|Instrument.FLAG_SOFTGET,
-            type=types.StringType,
+            type=str,
             option_list=('Default', 'RSE', 'NRSE', 'Diff', 'PseudoDiff'))
 
         self.add_parameter('count_time',
             flags=Instrument.FLAG_SET|Instrument.FLAG_SOFTGET,
-            type=types.FloatType,
+            type=float,
             units='s')
 
         self.add_function('reset')
         self.add_function('digital_out')
+        self.add_function('start_acquisition')
+        self.add_function('stop_acquisition')
+        self.add_function('get_acquisition_data')
+        self.add_function('sweep')
 
         self.reset()
         self.set_chan_config('RSE')
@@ -94,6 +111,8 @@ class NI_DAQ(Instrument):
 
     def reset(self):
         '''Reset device.'''
+        self.stop_acquisition()
+        self._pool.release(self._id)
         nidaq.reset_device(self._id)
 
     def _get_input_channels(self):
@@ -107,11 +126,11 @@ class NI_DAQ(Instrument):
 
     def do_get_input(self, channel):
         devchan = '%s/%s' % (self._id, channel)
-        return nidaq.read(devchan, config=self._chan_config)
+        return self._pool.read_ai(devchan, config=self._chan_config)
 
     def do_set_output(self, val, channel):
         devchan = '%s/%s' % (self._id, channel)
-        return nidaq.write(devchan, val)
+        return self._pool.write_ao(devchan, val)
 
     def do_set_chan_config(self, val):
         self._chan_config = val
@@ -124,7 +143,8 @@ class NI_DAQ(Instrument):
         src = self.get(channel + "_src")
         if src is not None and src != '':
             src = '/%s/%s' % (self._id, src)
-        return nidaq.read_counter(devchan, src=src, freq=1/self._count_time)
+        return self._pool.read_counter(devchan, src=src,
+            count_time=self._count_time)
 
     def read_counters(self, channels):
         chans = []
@@ -142,6 +162,72 @@ class NI_DAQ(Instrument):
         devchan = '%s/%s' % (self._id, lines)
         return nidaq.write_dig_port8(devchan, val)
 
+    def start_acquisition(self, channels, freq, bufsize=1<<20):
+        '''
+        Start a continuous, hardware-timed acquisition of analog inputs.
+        Single point reads of the inputs are not possible until
+        stop_acquisition() is called.
+
+        Input:
+            channels (list of strings): input channels, such as ['ai0']
+            freq (float): the sampling frequency
+            bufsize (int): number of samples per channel to keep
+
+        Output:
+            None
+        '''
+        self.stop_acquisition()
+        devchans = ['%s/%s' % (self._id, ch) for ch in channels]
+        self._acquisition = nidaq.ContinuousAcquisition(devchans, freq,
+            config=self._chan_config, bufsize=bufsize)
+        self._acquisition.start()
+
+    def stop_acquisition(self):
+        '''Stop the continuous acquisition.'''
+        if self._acquisition is not None:
+            self._acquisition.stop()
+
+    def get_acquisition_data(self, n=None, cursor=None, timeout=None):
+        '''
+        Get data of the continuous acquisition.
+
+        Input:
+            n (int): return the last n samples
+            cursor (int): instead, return the samples since 'cursor',
+                see nidaq.ContinuousAcquisition.read_new
+            timeout (float): time to wait for new samples
+
+        Output:
+            array of shape (nsamples, nchannels), or with a cursor the
+            tuple (samples, cursor, skipped)
+        '''
+        if self._acquisition is None:
+            return None
+        if cursor is not None:
+            return self._acquisition.read_new(cursor, timeout)
+        if n is None:
+            n = self._acquisition.get_total()
+        return self._acquisition.get_last(n)
+
+    def sweep(self, out_channel, values, in_channels, freq=1000.0):
+        '''
+        Sweep an analog output through 'values' and read analog inputs at
+        every point, in one hardware-timed operation.
+
+        Input:
+            out_channel (string): output channel, such as 'ao0'
+            values (numpy.array): output values
+            in_channels (list of strings): input channels
+            freq (float): point rate
+
+        Output:
+            numpy.array of shape (len(values), len(in_channels))
+        '''
+        self.stop_acquisition()
+        return nidaq.sweep('%s/%s' % (self._id, out_channel), values,
+            ['%s/%s' % (self._id, ch) for ch in in_channels], freq=freq,
+            config=self._chan_config)
+
 def detect_instruments():
     '''Refresh NI DAQ instrument list.'''
 
@@ -17,49 +17,91 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 from lib.dll_support import picoquant_ph
+from lib import tttr
 from instrument import Instrument
-import types
+import numpy as np
 import logging
 
 class Picoharp(Instrument):
     '''
     This is the python driver for the Picoquant Picoharp
+
+    Besides histogramming mode, time-tagged (T2/T3) acquisition is
+    supported with start_tttr(): records are read from the FIFO in the
+    background and the lifetime and g2 histograms are updated while the
+    measurement runs. Use simulate=True to run without hardware.
     '''
 
-    def __init__(self, name, devid, reset=False):
+    def __init__(self, name, devid, reset=False, simulate=False):
         Instrument.__init__(self, name, tags=['physical'])
 
         self._devid = devid
+        self._simulate = simulate
+        self._acq = None
+        self._hist = None
         self._create_dev()
 
-        self.add_parameter('resolution', type=types.IntType,
+        self.add_parameter('resolution', type=int,
             flags=Instrument.FLAG_GET,
             units='ps',
             doc='''Bin size''')
 
-        self.add_parameter('range', type=types.IntType,
+        self.add_parameter('range', type=int,
             flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET,
             doc='''Range, 0 = 1xbase, 1 = 2xbase, 2 = 4xbase, up to 7''')
 
-        self.add_parameter('counts', type=types.IntType,
+        self.add_parameter('counts', type=int,
             channels=(0, 1),
             flags=Instrument.FLAG_GET)
 
-        self.add_parameter('inttime', type=types.FloatType,
+        self.add_parameter('inttime', type=float,
             units='sec',
             flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET)
 
-        self.add_parameter('divider', type=types.IntType,
+        self.add_parameter('divider', type=int,
             flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET)
 
+        self.add_parameter('tttr_mode', type=int,
+            flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET,
+            option_list=(picoquant_ph.MODE_T2, picoquant_ph.MODE_T3),
+            doc='''Time-tagged mode used by start_tttr, 2 = T2, 3 = T3''')
+
+        self.add_parameter('g2_binwidth', type=int,
+            flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET,
+            units='ps', minval=1,
+            doc='''Bin width of the g2 histogram''')
+
+        self.add_parameter('g2_bins', type=int,
+            flags=Instrument.FLAG_SET | Instrument.FLAG_SOFTGET,
+            minval=1,
+            doc='''Number of g2 bins, centered around zero delay''')
+
+        self.add_parameter('lifetime_histogram', type=np.ndarray,
+            flags=Instrument.FLAG_GET,
+            doc='''Live T3 lifetime histogram, in units of the resolution''')
+
+        self.add_parameter('g2_histogram', type=np.ndarray,
+            flags=Instrument.FLAG_GET,
+            doc='''Live g2 cross-correlation histogram''')
+
+        self.add_parameter('tttr_records', type=int,
+            flags=Instrument.FLAG_GET,
+            doc='''Number of time-tagged records processed''')
+
         self.add_function('reset')
         self.add_function('get_all')
         self.add_function('open')
         self.add_function('close')
         self.add_function('start')
         self.add_function('plot')
+        self.add_function('start_tttr')
+        self.add_function('stop_tttr')
+        self.add_function('get_g2_delays')
 
         self.set_inttime(10)
+        self.set_tttr_mode(picoquant_ph.MODE_T3)
+        self.set_g2_binwidth(1000)
+        self.set_g2_bins(1001)
 
         if reset:
             self.reset()
@@ -67,7 +109,10 @@ class Picoharp(Instrument):
             self.get_all()
 
     def _create_dev(self):
-        self._dev = picoquant_ph.PHDevice(self._devid)
+        if self._simulate:
+            self._dev = picoquant_ph.SimulatedPHDevice(self._devid)
+        else:
+            self._dev = picoquant_ph.PHDevice(self._devid)
 
     def reset(self):
         self.get_all()
@@ -171,3 +216,82 @@ class Picoharp(Instrument):
             return None
         return self._dev.set_cfd_zero_cross(chan, val)
 
+    def do_set_tttr_mode(self, mode):
+        self._tttr_mode = mode
+
+    def do_set_g2_binwidth(self, val):
+        self._g2_binwidth = val
+
+    def do_set_g2_bins(self, val):
+        self._g2_bins = val
+
+    def start_tttr(self, acq_time=None):
+        '''
+        Start a time-tagged measurement in the current tttr_mode for
+        acq_time seconds (default: inttime). The histograms are cleared
+        and updated in the background; use stop_tttr() to stop early or
+        to wait for the measurement to finish.
+        '''
+        if not self._dev:
+            return
+        self.stop_tttr()
+
+        if acq_time is None:
+            acq_time = self._inttime
+        mode = self._tttr_mode
+        self._dev.initialize(mode)
+        sync_rate = self._dev.get_count_rate(0)
+        if sync_rate > 0:
+            period = int(1e12 / sync_rate)
+        else:
+            period = 0
+        self._hist = tttr.Histogrammer(mode, binwidth=self._g2_binwidth,
+            nbins=self._g2_bins, sync_period=period,
+            resolution=self._dev.get_resolution())
+
+        self._acq = tttr.Acquisition(self._dev, self._hist,
+            readsize=picoquant_ph.TTREADMAX)
+        self._dev.start(int(acq_time * 1000))
+        self._acq.start()
+
+    def stop_tttr(self, wait=False):
+        '''
+        Stop the time-tagged measurement. If wait is True, let it run
+        until the acquisition time has passed.
+        '''
+        if self._acq is None:
+            return
+        if wait:
+            self._acq.join()
+        else:
+            self._dev.stop()
+            self._acq.stop()
+        self._acq = None
+        self._dev.initialize(picoquant_ph.MODE_HIST)
+        self.get_tttr_records()
+
+    def is_tttr_running(self):
+        return self._acq is not None and self._acq.is_running()
+
+    def do_get_lifetime_histogram(self):
+        if self._hist is None:
+            return np.zeros(0)
+        return self._hist.get_lifetime()
+
+    def do_get_g2_histogram(self):
+        if self._hist is None:
+            return np.zeros(0)
+        return self._hist.get_g2()
+
+    def get_g2_delays(self):
+        '''
+        Returns the delays of the g2 histogram bins in ps
+        '''
+        if self._hist is None:
+            return np.zeros(0)
+        return self._hist.get_g2_delays()
+
+    def do_get_tttr_records(self):
+        if self._hist is None:
+            return 0
+        return self._hist.get_nrecords()
@@ -13,6 +13,7 @@ lib = rm.visalib
 
 
 from time import sleep
+import time
 import logging
 import numpy as np
 from lib import visafunc
@@ -63,10 +64,12 @@ class QDevilQdac(Instrument):
     noChannel = 0
     debugMode = False
 
-    def __init__(self, name, port, verbose=False):
+    def __init__(self, name, port, verbose=False, sport=None):
         # Constructor
         # port: Serial port for QDAC
         # verbose: Print serial communication during operation. Useful for debugging
+        # sport: Already opened serial port to use instead of port, e.g. a
+        #        _QDevilQdac.fake_serial.FakeQdacSerial for testing
 
         logging.info("Initializing instrument Qdevil Qdac")
         Instrument.__init__(self, name, tags=["physical"])
@@ -87,6 +90,10 @@ class QDevilQdac(Instrument):
         self.fastRate = 5e-1
         self.rates = np.zeros(24)
 
+        # Number of commands sent ahead of their replies by sendBatch
+        self.pipelineDepth = 16
+        self._rxbuf = bytearray()
+
         self.add_function("close")
         self.add_function("flush")
         self.add_function("getSerialNumber")
@@ -104,10 +111,19 @@ class QDevilQdac(Instrument):
         self.add_function("setChannelOutput")
         self.add_function("getChannelOutput")
         self.add_function("getCurrentReading")
+        self.add_function("getCurrentReadings")
+        self.add_function("getDCVoltages")
+        self.add_function("setDCVoltages")
+        self.add_function("sendBatch")
 
         self.add_function("rampDCVoltage")
+        self.add_function("rampVoltages")
         self.add_function("allToZero")
 
+        if sport is not None:
+            self.sport = sport
+            return
+
         # def __enter__(self):
         self.sport = serial.Serial(
             port=self.port,
@@ -127,8 +143,9 @@ class QDevilQdac(Instrument):
 
     def flush(self):
         # Purges the serial port input buffer
+        del self._rxbuf[:]
         while True:
-            response = self.sport.read(1)
+            response = self.sport.read(max(1, self.sport.in_waiting))
             if not response:
                 break
 
@@ -241,11 +258,20 @@ class QDevilQdac(Instrument):
         # This only works if setChannelOutput has been set to Generator.DC, which is the power-on setting!!
         if self.debugMode == False:
             self._validateChannel(channel)
-        reply = self._checkForError(self._sendReceive(b"set %d" % channel))
-        try:
-            return float(reply.split(b":", 1)[1].split()[1])
-        except:
-            raise Exception("Error response from QDAC: <%s>" % reply)
+        return self._parseDCVoltage(
+            self._checkForError(self._sendReceive(b"set %d" % channel))
+        )
+
+    def getDCVoltages(self, channels=None):
+        # Gets the DC voltages of several QDAC channels with pipelined commands
+        # channels: list of channels, default all channels
+        if channels is None:
+            channels = self.channelNumbers
+        if self.debugMode == False:
+            for channel in channels:
+                self._validateChannel(channel)
+        replies = self._sendReceiveMany([b"set %d" % ch for ch in channels])
+        return [self._parseDCVoltage(self._checkForError(r)) for r in replies]
 
     def setRate(self, channel, fast):
         if fast:
@@ -259,34 +285,45 @@ class QDevilQdac(Instrument):
         if self.debugMode == False:
             self._validateChannel(channel)
             self._validateVoltage(channel, volts)
-        reply = str(
-            self._checkForError(
-                self._sendReceive(b"set %d %e" % (channel, volts))
-            ).decode("utf-8")
+        return self._parseSetDCVoltage(
+            self._checkForError(self._sendReceive(b"set %d %e" % (channel, volts)))
         )
-        try:
-            analog = float(reply.split("Output:")[1].split("(")[0].strip(" "))
-            digital = int(reply.split("(")[1].split(")")[0])
-            return {"Voltage": analog, "Digital": digital}
-        except:
-            raise Exception("Error response from QDAC: <%s>" % reply)
 
-    def rampDCVoltage(self, channel, volts):
+    def setDCVoltages(self, channels, volts):
+        # Sets the DC voltages of several QDAC channels with pipelined commands
+        # volts: one voltage per channel
+        if len(channels) != len(volts):
+            raise Exception("Number of channels and voltages differ")
+        if self.debugMode == False:
+            for channel, v in zip(channels, volts):
+                self._validateChannel(channel)
+                self._validateVoltage(channel, v)
+        replies = self._sendReceiveMany(
+            [b"set %d %e" % (ch, v) for ch, v in zip(channels, volts)]
+        )
+        return [self._parseSetDCVoltage(self._checkForError(r)) for r in replies]
+
+    def rampDCVoltage(self, channel, volts, hardware=False):
+        # Ramps a channel at the slow or fast rate selected with setRate:
+        # steps of rate0 V every 5 ms, set from the computer, or with
+        # hardware=True in the same time by a QDAC function generator
         rate0 = self.slowRate
         delay0 = 0.005
         if self.rates[channel - 1] == 1:
             rate0 = self.fastRate
 
-        startV = self.getDCVoltage(self, channel)
+        startV = self.getDCVoltage(channel)
+        if hardware:
+            duration = np.abs(volts - startV) / rate0 * delay0
+            self.rampVoltages([channel], [volts], duration, startVoltages=[startV])
+            return
 
-        len = np.int(np.ceil(np.abs(volts - startV) / rate0) + 1)
-        vList = np.linspace(startV, volts, len)
-
-        for v in vList:
-            self.setDCVoltage(self, channel, v)
+        n = int(np.ceil(np.abs(volts - startV) / rate0)) + 1
+        for v in np.linspace(startV, volts, n)[1:]:
+            self.setDCVoltage(channel, v)
             qt.msleep(delay0)
 
-    def ramp_to_voltage(self, stop, step, channel=0):
+    def ramp_to_voltage(self, stop, step, channel=0, hardware=False):
         """
         Ramps the source voltage from the current level to the desired
         level in linear steps.
@@ -301,20 +338,96 @@ class QDevilQdac(Instrument):
 
         channel : int
             Selects the channel to ramp.
+
+        hardware : bool
+            Let a QDAC function generator do a continuous ramp of 1 ms per
+            step, instead of setting each step from the computer. Off by
+            default until verified on the hardware.
         """
         assert channel > 0
 
         start = self.getDCVoltage(channel)
+        nsteps = int(np.ceil(np.abs((stop - start) / step)))
+
+        if hardware:
+            self.rampVoltages([channel], [stop], nsteps * 1e-3, startVoltages=[start])
+            return
 
         # step voltage from start to stop
-        ramp = np.linspace(start, stop, int(np.ceil(np.abs((stop - start) / step)) + 1))
+        ramp = np.linspace(start, stop, nsteps + 1)
         for v in ramp[1:]:
             self.setDCVoltage(channel, v)
             qt.msleep(0.001)
 
-    def allToZero(self):
-        for i in range(1, 25):
-            self.rampDCVoltage(i, 0)
+    def rampVoltages(self, channels, stops, duration, startVoltages=None):
+        # Ramps several channels at the same time with the QDAC function
+        # generators, up to 8 channels per generator run
+        # stops: final voltage per channel
+        # duration: ramp time in seconds
+        # startVoltages: current voltage per channel, read from the QDAC if None
+        # The ramp is a single triangle period with 100% duty cycle, offset
+        # at the start voltage and amplitude stop - start. Afterwards the DC
+        # level is set to the final voltage and the channel switched back to
+        # Generator.DC, so getDCVoltage and setDCVoltage work as before.
+        if len(channels) != len(stops):
+            raise Exception("Number of channels and voltages differ")
+        if self.debugMode == False:
+            for channel, v in zip(channels, stops):
+                self._validateChannel(channel)
+                self._validateVoltage(channel, v)
+        if startVoltages is None:
+            startVoltages = self.getDCVoltages(channels)
+
+        # Each period sample is 1 ms
+        period = int(np.ceil(duration * 1000))
+        if period < 2:
+            self.setDCVoltages(channels, stops)
+            return
+
+        n = len(Generator.functionGenerators)
+        for i in range(0, len(channels), n):
+            group = list(zip(channels, startVoltages, stops))[i : i + n]
+            # Each channel is connected right after its generator started
+            cmds = []
+            for gen, (ch, start, stop) in zip(Generator.functionGenerators, group):
+                cmds.append(
+                    b"fun %d %d %d %f %d %d"
+                    % (gen, Waveform.triangle, period, 100, 1, 0)
+                )
+                cmds.append(b"wav %d %d %e %e" % (ch, gen, stop - start, start))
+            for reply in self._sendReceiveMany(cmds):
+                self._checkForError(reply)
+
+            # The generator runs a single period (1 repetition) and stops.
+            # Wait with a margin for the QDAC clock and the command latency,
+            # so the final DC level is only set after the ramp ended.
+            qt.msleep(period * 1e-3 * 1.05 + 0.02)
+
+            cmds = []
+            for ch, start, stop in group:
+                cmds.append(b"set %d %e" % (ch, stop))
+                cmds.append(b"wav %d %d %e %e" % (ch, Generator.DC, 1, 0))
+            for reply in self._sendReceiveMany(cmds):
+                self._checkForError(reply)
+
+    def allToZero(self, hardware=False):
+        # Ramps all channels to 0 V at the same time, each at its own rate
+        # as in rampDCVoltage
+        channels = list(range(1, 25))
+        startV = np.array(self.getDCVoltages(channels))
+        rate0 = np.where(self.rates == 1, self.fastRate, self.slowRate)
+        if hardware:
+            duration = np.max(np.abs(startV) / rate0 * 0.005)
+            self.rampVoltages(channels, [0] * len(channels), duration, startVoltages=startV)
+            return
+
+        nsteps = np.ceil(np.abs(startV) / rate0).astype(int)
+        for i in range(1, np.max(nsteps) + 1):
+            # Channels already at zero are left alone
+            busy = nsteps >= i
+            volts = startV[busy] * (1 - i / nsteps[busy])
+            self.setDCVoltages(list(np.array(channels)[busy]), list(volts))
+            qt.msleep(0.005)
 
     def setRawDAC(self, channel, dacValue):
         # Sets the DAC output of a channel as a raw integer
@@ -793,11 +906,21 @@ class QDevilQdac(Instrument):
         # Reads current from a DAC channel. Unit is in Amps
         if self.debugMode == False:
             self._validateChannel(channel)
-        reply = self._checkForError(self._sendReceive(b"get %d" % channel))
-        try:
-            return float(reply.split(b":", 1)[1][:-2]) * 1e-6
-        except:
-            raise Exception("Error response from QDAC: <%s>" % reply)
+        return self._parseCurrent(
+            self._checkForError(self._sendReceive(b"get %d" % channel))
+        )
+
+    def getCurrentReadings(self, channels=None):
+        # Reads the currents of several DAC channels with pipelined commands.
+        # Unit is in Amps
+        # channels: list of channels, default all channels
+        if channels is None:
+            channels = self.channelNumbers
+        if self.debugMode == False:
+            for channel in channels:
+                self._validateChannel(channel)
+        replies = self._sendReceiveMany([b"get %d" % ch for ch in channels])
+        return [self._parseCurrent(self._checkForError(r)) for r in replies]
 
     def getRawCurrentADCreading(self, channel):
         # Reads current from a DAC channel. Unit is in Amps
@@ -950,6 +1073,7 @@ class QDevilQdac(Instrument):
                     stopbits=serial.STOPBITS_ONE,
                     timeout=0.5,
                 )
+                del self._rxbuf[:]
             else:
                 raise Exception("Failed to change baud rate: %s" % reply)
         else:
@@ -1077,6 +1201,36 @@ class QDevilQdac(Instrument):
         if triggerNumber not in self.triggerRange:
             raise Exception("Invalid trigger number: %d" % triggerNumber)
 
+    def _parseDCVoltage(self, reply):
+        try:
+            return float(reply.split(b":", 1)[1].split()[1])
+        except:
+            raise Exception("Error response from QDAC: <%s>" % reply)
+
+    def _parseSetDCVoltage(self, reply):
+        reply = reply.decode("utf-8")
+        try:
+            analog = float(reply.split("Output:")[1].split("(")[0].strip(" "))
+            digital = int(reply.split("(")[1].split(")")[0])
+            return {"Voltage": analog, "Digital": digital}
+        except:
+            raise Exception("Error response from QDAC: <%s>" % reply)
+
+    def _parseCurrent(self, reply):
+        try:
+            return float(reply.split(b":", 1)[1][:-2]) * 1e-6
+        except:
+            raise Exception("Error response from QDAC: <%s>" % reply)
+
+    def sendBatch(self, commands):
+        # Sends several commands and returns the replies as strings
+        # commands: list of command strings, e.g. ["set 1 0.5", "get 1"]
+        # The commands are pipelined, see _sendReceiveMany
+        cmds = [c.encode("ascii") if isinstance(c, str) else c for c in commands]
+        return [
+            self._checkForError(r).decode("utf-8") for r in self._sendReceiveMany(cmds)
+        ]
+
     def _sendReceive(self, msg):
         if self.verbose:
             print(msg)
@@ -1084,19 +1238,41 @@ class QDevilQdac(Instrument):
         reply = self._readLine()
         return reply
 
+    def _sendReceiveMany(self, msgs):
+        # Pipelined _sendReceive: up to self.pipelineDepth commands are
+        # written before their replies are read, so the serial round trip
+        # is not paid for every command. Returns the replies in order.
+        replies = []
+        sent = 0
+        while len(replies) < len(msgs):
+            end = min(len(msgs), len(replies) + self.pipelineDepth)
+            if sent < end:
+                if self.verbose:
+                    for msg in msgs[sent:end]:
+                        print(msg)
+                self.sport.write(b"".join(msg + b"\n" for msg in msgs[sent:end]))
+                sent = end
+            replies.append(self._readLine())
+        return replies
+
     def _readLine(self, failOnTimeout=True):
-        out = b""
-        c = b""
+        # Returns the next line, without the line terminator. The serial
+        # port is read in bulk into self._rxbuf, where the rest of the data
+        # is kept for the next call.
         while True:
-            c = self.sport.read(1)
+            idx = self._rxbuf.find(b"\n")
+            if idx >= 0:
+                out = bytes(self._rxbuf[:idx])
+                del self._rxbuf[: idx + 1]
+                break
+            c = self.sport.read(max(1, self.sport.in_waiting))
             if c:
-                if c != b"\n":
-                    out += c
-                else:
-                    break
+                self._rxbuf += c
             else:
                 if failOnTimeout and self.verbose:
                     raise Exception("Timeout!")
+                out = bytes(self._rxbuf)
+                del self._rxbuf[:]
                 break
         if self.verbose and out:
             print(out)
@@ -18,7 +18,8 @@
 import logging
 import time
 
-import visa
+import numpy as np
+import myVisa
 from source.instrument import Instrument
 
 
@@ -48,7 +49,7 @@ class SR830(Instrument):
         Instrument.__init__(self, name, tags=['physical'])
         self._address = address
         #self._visainstrument = visa.instrument(self._address)
-        rm = visa.ResourceManager()
+        rm = myVisa.get_resource_manager()
         self._visainstrument = rm.get_instrument(self._address)
 
         self.add_parameter('mode',
@@ -175,6 +176,9 @@ class SR830(Instrument):
 
         self.add_function('reset')
         self.add_function('get_all')
+        self.add_function('arm_buffer')
+        self.add_function('trigger_buffer')
+        self.add_function('read_buffer')
 
         if reset:
             self.reset()
@@ -289,6 +293,100 @@ class SR830(Instrument):
             print('Wrong output requested.')
         return readvalue
 
+    def arm_buffer(self, ch1=0, ch2=0):
+        '''
+        Clears the internal data buffer and starts a buffered acquisition
+        that stores one point on every trigger (SRAT 14), up to 16383
+        points. Trigger with trigger_buffer() or the rear panel TRIG input
+        and download the data with read_buffer().
+
+        Input:
+            ch1 (int) : channel 1 display, 0 = X, 1 = R
+            ch2 (int) : channel 2 display, 0 = Y, 1 = P
+
+        Output:
+            None
+        '''
+        logging.debug(__name__ + ' : Arming data buffer')
+        self.direct_output()
+        self._visainstrument.write('DDEF 1,%d,0' % ch1)
+        self._visainstrument.write('DDEF 2,%d,0' % ch2)
+        self._visainstrument.write('SRAT 14')
+        self._visainstrument.write('SEND 0')
+        self._visainstrument.write('TSTR 0')
+        self._visainstrument.write('REST')
+        self._visainstrument.write('STRT')
+
+    def trigger_buffer(self):
+        '''
+        Stores the current channel 1 and 2 values in the buffer.
+        '''
+        self._visainstrument.write('TRIG')
+
+    def get_buffer_count(self):
+        '''
+        Returns the number of points stored in the buffer.
+        '''
+        return int(self._visainstrument.query('SPTS?'))
+
+    def _read_trace(self, channel, npoints):
+        '''
+        Downloads npoints of buffer 'channel' as one binary transfer of
+        little-endian 4-byte floats (TRCB?).
+        '''
+        self._visainstrument.write('TRCB? %d,0,%d' % (channel, npoints))
+        raw = self._visainstrument.read_bytes(4 * npoints)
+        return np.frombuffer(raw, dtype='<f4').astype(np.float64)
+
+    def read_buffer(self, npoints=None, timeout=10):
+        '''
+        Waits until npoints are stored, stops the acquisition and
+        downloads both channels.
+
+        Input:
+            npoints (int)   : number of points, default all stored points
+            timeout (float) : maximum time to wait for the points in s
+
+        Output:
+            data (numpy.ndarray) : array of shape (npoints, 2)
+        '''
+        if npoints is None:
+            npoints = self.get_buffer_count()
+        else:
+            t_end = time.time() + timeout
+            while self.get_buffer_count() < npoints:
+                if time.time() > t_end:
+                    raise ValueError('Timeout waiting for %d buffer points' % npoints)
+                time.sleep(0.01)
+
+        self._visainstrument.write('PAUS')
+        if npoints == 0:
+            return np.zeros((0, 2))
+        return np.column_stack((self._read_trace(1, npoints),
+            self._read_trace(2, npoints)))
+
+    def buffered_sweep(self, func, values, delay=0, ch1=0, ch2=0):
+        '''
+        Runs a sweep where the lock-in values are stored in the buffer,
+        instead of read out, for each point. The data is downloaded at
+        the end.
+
+        Input:
+            func (function) : called with each value, e.g. a set function
+            values (list)   : sweep values
+            delay (float)   : time to wait after func before triggering in s
+
+        Output:
+            data (numpy.ndarray) : array of shape (len(values), 2)
+        '''
+        import qt
+        self.arm_buffer(ch1, ch2)
+        for val in values:
+            func(val)
+            qt.msleep(delay)
+            self.trigger_buffer()
+        return self.read_buffer(len(values))
+
     def do_get_X(self, ovl=False):
         '''
         Read out X of the Lock In
@@ -3,9 +3,12 @@ add docstring
 """
 
 import logging
+import time
 
-import visa
+import numpy as np
+import myVisa
 from source.instrument import Instrument
+from _SR860.stream import StreamReceiver, CHANNELS, DEFAULT_PORT
 
 ###############################################################################
 # TODO:
@@ -18,6 +21,18 @@ from source.instrument import Instrument
 ###############################################################################
 
 
+def _parse_binblock(raw: bytes):
+    """
+    Returns the data of an IEEE 488.2 definite length block (#<n><len><data>).
+    """
+    if raw[:1] != b'#':
+        raise ValueError('Invalid binary block header: {!r}'.format(raw[:10]))
+    ndigits = int(raw[1:2])
+    length = int(raw[2:2 + ndigits])
+    start = 2 + ndigits
+    return raw[start:start + length]
+
+
 class SR860(Instrument):
     """
     Creates a new Instrument to interact with the SR860.
@@ -41,7 +56,7 @@ class SR860(Instrument):
                 None
         """
         Instrument.__init__(self, name, tags=['physical'])
-        self._visainstrument = visa.ResourceManager().get_instrument(address)
+        self._visainstrument = myVisa.get_resource_manager().get_instrument(address)
 
         # reference parameters
         self.add_parameter('timebase_mode', type=str,
@@ -581,13 +596,13 @@ class SR860(Instrument):
                            minval=0, maxval=1)
         self.add_parameter('stream_packet_size', type=int,
                            flags=Instrument.FLAG_GETSET,
-                           minval=0, maxval=1)
+                           minval=0, maxval=3)
         self.add_parameter('stream_port', type=int,
                            flags=Instrument.FLAG_GETSET,
-                           minval=0, maxval=1)
+                           minval=1024, maxval=65535)
         self.add_parameter('stream_option', type=int,
                            flags=Instrument.FLAG_GETSET,
-                           minval=0, maxval=1)
+                           minval=0, maxval=3)
         self.add_parameter('stream_enabled', type=int,
                            flags=Instrument.FLAG_GETSET,
                            minval=0, maxval=1)
@@ -711,6 +726,15 @@ class SR860(Instrument):
         # data capture functions
         self.add_function('start_capture')
         self.add_function('stop_capture')
+        self.add_function('arm_capture')
+        self.add_function('trigger_capture')
+        self.add_function('read_capture')
+
+        # data streaming functions
+        self.add_function('start_stream')
+        self.add_function('stop_stream')
+        self._stream = None
+        self._capture_config = 1
 
         # system functions
         # self.add_function('screenshot')
@@ -2055,8 +2079,19 @@ class SR860(Instrument):
 
     def do_get_capture_buffer_bin(self, offset, length):
         """
+        Downloads 'length' kB of the capture buffer, starting at 'offset'
+        kB, as one binary block.
+
+        Input:
+                offset (int)  : offset in kB
+                length (int)  : length in kB, at most 64
+
+        Output:
+                values (numpy.ndarray) : the captured float values
         """
-        return self._visainstrument.query(':CAPTUREGET? {}, {}'.format(offset, length))
+        self._visainstrument.write(':CAPTUREGET? {}, {}'.format(offset, length))
+        block = _parse_binblock(self._visainstrument.read_raw())
+        return np.frombuffer(block, dtype='<f4').astype(np.float64)
 
     def do_get_stream_config(self):
         """
@@ -2450,6 +2485,197 @@ class SR860(Instrument):
         """
         self._visainstrument.write(':CAPTURESTOP')
 
+    def arm_capture(self, npoints: int, config: int = 1):
+        """
+        Configures the capture buffer for npoints samples and starts a
+        capture that stores one sample per trigger. Trigger with
+        trigger_capture() or the rear panel trigger input and download
+        the data with read_capture().
+
+        Input:
+                npoints (int) : number of samples
+                config (int)  : 0 = X, 1 = XY, 2 = RT, 3 = XYRT
+
+        Output:
+                None
+        """
+        nbytes = npoints * 4 * len(CHANNELS[config])
+        length = max(1, -(-nbytes // 1024))
+        if length > 4096:
+            raise ValueError('Capture of {} samples does not fit in the '
+                             'buffer'.format(npoints))
+        self._capture_config = config
+        self.stop_capture()
+        self.set_capture_config(config)
+        self.set_capture_length(length)
+        # One shot, one sample per trigger
+        self.start_capture(0, 2)
+
+    def trigger_capture(self):
+        """
+        Stores one sample in the capture buffer, like a hardware trigger.
+        """
+        self._visainstrument.write(':TRIG')
+
+    def read_capture(self, npoints: int, timeout: float = 10):
+        """
+        Waits until npoints samples are captured, stops the capture and
+        downloads the data in binary blocks of at most 64 kB.
+
+        Input:
+                npoints (int)   : number of samples
+                timeout (float) : maximum time to wait in s
+
+        Output:
+                data (numpy.ndarray) : array of shape (npoints, channels)
+        """
+        nch = len(CHANNELS[self._capture_config])
+        nbytes = npoints * 4 * nch
+        t_end = time.time() + timeout
+        while int(self._visainstrument.query(':CAPTUREBYTES?')) < nbytes:
+            if time.time() > t_end:
+                raise ValueError('Timeout waiting for {} capture '
+                                 'samples'.format(npoints))
+            time.sleep(0.01)
+        self.stop_capture()
+
+        nkb = -(-nbytes // 1024)
+        blocks = [self.do_get_capture_buffer_bin(offset, min(64, nkb - offset))
+                  for offset in range(0, nkb, 64)]
+        values = np.concatenate(blocks)[:npoints * nch]
+        return values.reshape(npoints, nch)
+
+    def buffered_sweep(self, func, values, delay: float = 0, config: int = 1):
+        """
+        Runs a sweep where the lock-in values are captured, instead of
+        read out, for each point. The data is downloaded at the end.
+
+        Input:
+                func (function) : called with each value, e.g. a set function
+                values (list)   : sweep values
+                delay (float)   : time to wait after func before triggering
+                config (int)    : 0 = X, 1 = XY, 2 = RT, 3 = XYRT
+
+        Output:
+                data (numpy.ndarray) : array of shape (len(values), channels)
+        """
+        import qt
+        self.arm_capture(len(values), config)
+        for val in values:
+            func(val)
+            qt.msleep(delay)
+            self.trigger_capture()
+        return self.read_capture(len(values))
+
+    def start_stream(self, config: int = 1, rate: int = 0, fmt: int = 0,
+                     packet_size: int = 0, port: int = DEFAULT_PORT,
+                     capacity: int = 1 << 20, int_scale: float = 1.0):
+        """
+        Starts streaming data over UDP to this computer, and receiving it
+        in the background into a ring buffer. Read the data with
+        get_stream_samples() or stream_to_data().
+
+        Input:
+                config (int)      : 0 = X, 1 = XY, 2 = RT, 3 = XYRT
+                rate (int)        : sample rate is the maximum rate / 2^rate
+                fmt (int)         : 0 = float32, 1 = int16
+                packet_size (int) : 0-3 = 1024, 512, 256, 128 bytes
+                port (int)        : UDP port, 0 to pick a free one
+                capacity (int)    : ring buffer size in samples
+                int_scale (float) : factor applied to int16 samples
+
+        Output:
+                None
+        """
+        self.stop_stream()
+        self._stream = StreamReceiver(port=port, capacity=capacity,
+                                      nchannels=len(CHANNELS[config]),
+                                      int_scale=int_scale)
+        self._stream.start()
+        self.set_stream_config(config)
+        self.set_stream_rate(rate)
+        self.set_stream_format(fmt)
+        self.set_stream_packet_size(packet_size)
+        self.set_stream_port(self._stream.get_port())
+        self.set_stream_enabled(1)
+
+    def stop_stream(self):
+        """
+        Stops streaming and the receiver. The received samples remain
+        available until the next start_stream().
+        """
+        if self._stream is None:
+            return
+        self.set_stream_enabled(0)
+        self._stream.stop()
+        stats = self._stream.get_stats()
+        if stats['lost'] > 0:
+            logging.warning('SR860 stream: %d of %d packets lost',
+                            stats['lost'], stats['lost'] + stats['packets'])
+
+    def get_stream_sample_rate(self):
+        """
+        Returns the stream sample rate in Hz.
+        """
+        ratemax = float(self._visainstrument.query(':STREAMRATEMAX?'))
+        return ratemax / 2 ** int(self._visainstrument.query(':STREAMRATE?'))
+
+    def get_stream_samples(self, n: int):
+        """
+        Returns the last n streamed samples.
+
+        Input:
+                n (int)       : number of samples
+
+        Output:
+                array of shape (n, channels); lost packets are NaN
+        """
+        if self._stream is None:
+            return np.zeros((0, 0))
+        return self._stream.get_last(n)
+
+    def get_stream_stats(self):
+        """
+        Returns the number of stream packets received, lost and rejected.
+        """
+        if self._stream is None:
+            return None
+        return self._stream.get_stats()
+
+    def stream_to_data(self, data, duration: float, interval: float = 0.1):
+        """
+        Adds the streamed samples to a Data object for 'duration' seconds.
+        The first column is the time in seconds since the stream started,
+        followed by a column per streamed channel.
+
+        Input:
+                data (Data)       : data object to add the points to
+                duration (float)  : time to record in seconds
+                interval (float)  : time between updates in seconds
+
+        Output:
+                number of samples added
+        """
+        import qt
+        if self._stream is None:
+            raise ValueError('Stream not started, call start_stream() first')
+        rate = self.get_stream_sample_rate()
+        cursor = self._stream.get_total()
+        count = 0
+        t_end = time.time() + duration
+        while time.time() < t_end:
+            qt.msleep(interval)
+            samples, newcursor, skipped = self._stream.read_new(cursor)
+            if skipped > 0:
+                logging.warning('SR860 stream: %d samples overwritten before '
+                                'they were read', skipped)
+            if len(samples) > 0:
+                t = np.arange(newcursor - len(samples), newcursor) / rate
+                data.add_data_point(np.column_stack((t, samples)))
+                count += len(samples)
+            cursor = newcursor
+        return count
+
     # def screenshot(self):
 
     def save_data(self):
@@ -22,7 +22,6 @@ from _Spectrum_M2i2030.regs import regs as _spcm_regs
 from instrument import Instrument
 import pickle
 from time import sleep, time
-import types
 import logging
 import numpy
 
@@ -68,21 +67,22 @@ class Spectrum_M2i2030(Instrument):
 
         # Load dll and open connection
         self._card_is_open = False
+        self._dma_raw = None
         self._load_dll()
         self._open()
 
         # add parameters
-        self.add_parameter('timeout', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('trigger_delay', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('memsize', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('post_trigger', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('input_offset_ch0', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('input_offset_ch1', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('input_amp_ch0', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('input_amp_ch1', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('spc_samplerate', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('reference_clock', flags=Instrument.FLAG_GETSET, type=types.IntType)
-        self.add_parameter('segmentsize', flags=Instrument.FLAG_GETSET, type=types.IntType)
+        self.add_parameter('timeout', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('trigger_delay', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('memsize', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('post_trigger', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('input_offset_ch0', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('input_offset_ch1', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('input_amp_ch0', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('input_amp_ch1', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('spc_samplerate', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('reference_clock', flags=Instrument.FLAG_GETSET, type=int)
+        self.add_parameter('segmentsize', flags=Instrument.FLAG_GETSET, type=int)
 
         self.add_parameter('serial', flags=Instrument.FLAG_GET)
         self.add_parameter('ramsize', flags=Instrument.FLAG_GET)
@@ -176,7 +176,7 @@ class Spectrum_M2i2030(Instrument):
         '''
         logging.debug(__name__ + ' : Try to open card')
         if ( not self._card_is_open):
-          self._spcm_win32.handel = self._spcm_win32.open('spcm0')
+          self._spcm_win32.handel = self._spcm_win32.open(b'spcm0')
           self._card_is_open = True
         else:
           logging.warning(__name__ + ' : Card is already open !')
@@ -275,7 +275,7 @@ class Spectrum_M2i2030(Instrument):
         if (err==0):
             return 0
         else:
-            logging.error(__name__ + ' : Error %s while setting reg %s to %s' % (err, regnum, regval))
+            logging.error(__name__ + ' : Error %s while invalidating buffer %s' % (err, buffertype))
             self._get_error()
             raise ValueError('Error communicating with device')
 
@@ -300,10 +300,7 @@ class Spectrum_M2i2030(Instrument):
 
         self._spcm_win32.GetErrorInfo(self._spcm_win32.handel, p_er1, p_er2, p_errortekst)
 
-        tekst = ""
-
-        for ii in range(200):
-            tekst  = tekst + p_errortekst.contents[ii]
+        tekst = p_errortekst.contents.value.decode('latin-1')
         logging.error(__name__ + ' : ' + tekst)
         return tekst
 
@@ -517,6 +514,58 @@ class Spectrum_M2i2030(Instrument):
         self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_CH_ANDMASK0,    0);
         self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_CH_ANDMASK1,    0);
 
+    def init_fifo_multiple_recording(self, segsize=1024, posttrigger=512, nr_of_channels=1, amp=500, offs=0):
+        '''
+        Initiates the card in:
+            FIFO Multiple Recording mode, running until stopped
+            Using channel 0, or channel 0 and 1
+            Trigger on ext0, positive slope, 50 Ohm
+
+        Read the data with iter_fifo_blocks or stream_fifo.
+
+        Input:
+            segsize (int)        : number of datapoints per trigger
+            posttrigger(int)     : number of datapoints taken after the trigger
+            nr_of_channels (int) : 1 or 2
+            amp (int)            : half of the range in millivolts
+            offs (int)           : offset as percentage of the range
+
+        Output:
+            None
+        '''
+        logging.debug(__name__ + ' : Initialing card for FIFO multiple recording')
+
+        if nr_of_channels == 2:
+            channels = _spcm_regs.CHANNEL0 | _spcm_regs.CHANNEL1
+        else:
+            channels = _spcm_regs.CHANNEL0
+
+        # Set the modes
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_EXT0_MODE, _spcm_regs.SPC_TM_POS);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_EXT0_PULSEWIDTH, 0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_OUTPUT, 0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_TERM, 0);
+
+        # Set channel information
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_CHENABLE, channels)
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_CARDMODE, _spcm_regs.SPC_REC_FIFO_MULTI)
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_SEGMENTSIZE, segsize)
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_POSTTRIGGER, posttrigger)
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_LOOPS, 0)
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_AMP0, amp)
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_OFFS0, offs)
+        if nr_of_channels == 2:
+            self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_AMP1, amp)
+            self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_OFFS1, offs)
+
+        # Set the masks
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_ORMASK, _spcm_regs.SPC_TMASK_EXT0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_ANDMASK,        0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_CH_ORMASK0,     0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_CH_ORMASK1,     0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_CH_ANDMASK0,    0);
+        self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_TRIG_CH_ANDMASK1,    0);
+
 #########################
 ### General
 #########################
@@ -1114,32 +1163,74 @@ class Spectrum_M2i2030(Instrument):
 ### read data from card
 #######################
 
-    def readout_raw_buffer(self, nr_of_channels=1):
+    def _get_dma_buffer(self, nbytes):
         '''
-        Reads out the buffer, and returns a list with the size of the
-        buffer. Contains only data if the channel is triggered.
+        Returns a page-aligned int8 buffer of nbytes for DMA transfers.
+        The memory is reused by subsequent readouts, and only reallocated
+        when a larger buffer is needed.
 
         Input:
-            None
+            nbytes (int) : size of the buffer
 
         Output:
-            data (int[memsize]): The data of the buffer
+            buffer (numpy.ndarray) : int8 array of nbytes
         '''
-        logging.debug(__name__ + ' : Readout raw buffer')
-        lMemsize = self.get_memsize()
-        lBufsize = lMemsize * nr_of_channels
+        if self._dma_raw is None or len(self._dma_raw) < nbytes + 4096:
+            self._dma_raw = numpy.empty(nbytes + 4096, dtype=numpy.int8)
+        skip = (-self._dma_raw.ctypes.data) % 4096
+        return self._dma_raw[skip:skip + nbytes]
 
-        a = (c_int8 * lBufsize)()
-        p_data = pointer(a)
+    def _def_transfer(self, buf, notify=0):
+        '''
+        Sets up a card to PC DMA transfer into buf.
+
+        Input:
+            buf (numpy.ndarray) : destination buffer
+            notify (int)        : notify size in bytes, 0 to notify at the end
 
-        # setup buffer
-        err = self._spcm_win32.DefTransfer64(self._spcm_win32.handel, _spcm_regs.SPCM_BUF_DATA, 1,
-            0, p_data, c_int64(0), c_int64(lBufsize))
+        Output:
+            None
+        '''
+        err = self._spcm_win32.DefTransfer64(self._spcm_win32.handel, _spcm_regs.SPCM_BUF_DATA,
+            _spcm_regs.SPCM_DIR_CARDTOPC, notify, buf.ctypes.data_as(c_void_p),
+            c_int64(0), c_int64(buf.nbytes))
         if (err!=0):
             logging.error(__name__ + ' : Error setting up buffer')
             self._get_error()
             raise ValueError('Error communicating with device')
 
+    def _convert_to_volts(self, data, amp, offset):
+        '''
+        Converts raw samples to the input voltage in millivolts.
+        '''
+        ret = data.astype(numpy.float32)
+        ret *= 2.0 * amp / 255.0
+        ret += offset
+        return ret
+
+    def readout_raw_buffer(self, nr_of_channels=1, copy=False):
+        '''
+        Reads out the buffer, and returns an array with the size of the
+        buffer. Contains only data if the channel is triggered.
+
+        The data is transferred into a preallocated buffer, and the array
+        returned is a view of it that is overwritten by the next readout.
+        Use copy=True to get data that is kept.
+
+        Input:
+            nr_of_channels (int) : number of enabled channels
+            copy (bool)          : return a copy of the buffer
+
+        Output:
+            data (int8[memsize * nr_of_channels]): The data of the buffer
+        '''
+        logging.debug(__name__ + ' : Readout raw buffer')
+        lMemsize = self.get_memsize()
+        lBufsize = lMemsize * nr_of_channels
+
+        data = self._get_dma_buffer(lBufsize)
+        self._def_transfer(data)
+
         # readout data
         err = self._spcm_win32.SetParam32(self._spcm_win32.handel, _spcm_regs.SPC_M2CMD,
             _spcm_regs.M2CMD_DATA_STARTDMA | _spcm_regs.M2CMD_DATA_WAITDMA)
@@ -1148,19 +1239,21 @@ class Spectrum_M2i2030(Instrument):
             self._get_error()
             raise ValueError('Error communicating with device')
 
-        data = p_data.contents[:]
+        if copy:
+            return data.copy()
         return data
 
     def readout_singlechannel_singlemode_bin(self):
         '''
-        Reads out the buffer, and returns a list with the size of the
+        Reads out the buffer, and returns an array with the size of the
         buffer. Contains only data if the channel is triggered.
+        The array is a view of the DMA buffer, see readout_raw_buffer.
 
         Input:
             None
 
         Output:
-            data (int[memsize]): The data of the buffer
+            data (int8[memsize]): The data of the buffer
         '''
         logging.debug(__name__ + ' : Readout binaries from buffer')
 
@@ -1170,7 +1263,7 @@ class Spectrum_M2i2030(Instrument):
     def readout_singlechannel_singlemode_float(self):
         '''
         Reads out the buffer, and converts the data to the actual input voltage.
-        Returns a list with the size of the buffer.
+        Returns an array with the size of the buffer.
         Contains only data if the channel is triggered.
 
         Input:
@@ -1185,23 +1278,15 @@ class Spectrum_M2i2030(Instrument):
         offset = float(self.get_input_offset_ch0())
 
         data = self.readout_raw_buffer()
-        if data == 'timeout':
-            return data
-        data = numpy.array(data, numpy.float32)
-        data = []
-        data = 2.0 * amp * (data / 255.0) + offset
-        return data
+        return self._convert_to_volts(data, amp, offset)
 
     def readout_singlechannel_multimode_bin(self):
         lMemsize = self.get_memsize()
         lSegsize = self.get_segmentsize()
 
-        lnumber_of_samples = lMemsize / lSegsize
+        lnumber_of_samples = lMemsize // lSegsize
 
         data = self.readout_raw_buffer()
-        if data == 'timeout':
-            return data
-        data = numpy.array(data, numpy.int8)
         data = numpy.reshape(data, (lnumber_of_samples, lSegsize))
         return data
 
@@ -1211,26 +1296,19 @@ class Spectrum_M2i2030(Instrument):
         amp = float(self.get_input_amp_ch0())
         offset = float(self.get_input_offset_ch0())
 
-        lnumber_of_samples = lMemsize / lSegsize
+        lnumber_of_samples = lMemsize // lSegsize
 
         data = self.readout_raw_buffer()
-        if data == 'timeout':
-            return data
-        data = numpy.array(data, numpy.float32)
         data = numpy.reshape(data, (lnumber_of_samples, lSegsize))
-        data = 2.0 * amp * (data / 255.0) + offset
-        return data
+        return self._convert_to_volts(data, amp, offset)
 
     def readout_doublechannel_multimode_bin(self):
         lMemsize = self.get_memsize()
         lSegsize = self.get_segmentsize()
 
-        lnumber_of_samples = lMemsize / lSegsize
+        lnumber_of_samples = lMemsize // lSegsize
 
         data = self.readout_raw_buffer(nr_of_channels=2)
-        if data == 'timeout':
-            return data
-        data = numpy.array(data, numpy.int8)
         data = numpy.reshape(data, (lMemsize, 2))
         data0 = data[:,0]
         data1 = data[:,1]
@@ -1239,28 +1317,89 @@ class Spectrum_M2i2030(Instrument):
         return (data0, data1)
 
     def readout_doublechannel_multimode_float(self):
-        lMemsize = self.get_memsize()
-        lSegsize = self.get_segmentsize()
         amp0 = float(self.get_input_amp_ch0())
         offset0 = float(self.get_input_offset_ch1())
         amp1 = float(self.get_input_amp_ch0())
         offset1 = float(self.get_input_offset_ch1())
 
-        lnumber_of_samples = lMemsize / lSegsize
-
-        data = self.readout_raw_buffer(nr_of_channels=2)
-        if data == 'timeout':
-            return data
-        data = numpy.array(data, numpy.int8)
-        data = numpy.reshape(data, (lMemsize, 2))
-        data0 = data[:,0]
-        data1 = data[:,1]
-        data0 = numpy.reshape(data0, (lnumber_of_samples, lSegsize))
-        data1 = numpy.reshape(data1, (lnumber_of_samples, lSegsize))
-        data0 = 2.0 * amp0 * (data0 / 255.0) + offset0
-        data1 = 2.0 * amp1 * (data1 / 255.0) + offset1
+        data0, data1 = self.readout_doublechannel_multimode_bin()
+        data0 = self._convert_to_volts(data0, amp0, offset0)
+        data1 = self._convert_to_volts(data1, amp1, offset1)
         return (data0, data1)
 
+    def iter_fifo_blocks(self, blocksize, nblocks=None, nr_of_channels=1, nbuffers=2):
+        '''
+        Starts the card in FIFO mode and yields the data in blocks as it
+        arrives. The DMA buffer holds nbuffers blocks: the card fills the
+        next block while the current one is processed. A block is handed
+        back to the card when the next block is requested, so copy it if
+        it has to be kept.
+
+        Set up the card first, e.g. with init_fifo_multiple_recording.
+
+        Input:
+            blocksize (int)      : samples per channel in a block
+            nblocks (int)        : number of blocks, None to run until the
+                                   generator is closed
+            nr_of_channels (int) : number of enabled channels
+            nbuffers (int)       : number of blocks in the DMA buffer
+
+        Output:
+            generator yielding int8 arrays of blocksize samples, or
+            (blocksize, nr_of_channels) for more than one channel
+        '''
+        logging.debug(__name__ + ' : Start FIFO readout')
+        blockbytes = blocksize * nr_of_channels
+        buf = self._get_dma_buffer(nbuffers * blockbytes)
+        self._def_transfer(buf, notify=blockbytes)
+
+        self._set_param(_spcm_regs.SPC_M2CMD, _spcm_regs.M2CMD_CARD_START |
+            _spcm_regs.M2CMD_CARD_ENABLETRIGGER | _spcm_regs.M2CMD_DATA_STARTDMA)
+
+        count = 0
+        try:
+            while nblocks is None or count < nblocks:
+                if self._set_param(_spcm_regs.SPC_M2CMD, _spcm_regs.M2CMD_DATA_WAITDMA) == 263:
+                    raise ValueError('Timeout waiting for FIFO data')
+                if self._get_param(_spcm_regs.SPC_M2STATUS) & _spcm_regs.M2STAT_DATA_OVERRUN:
+                    logging.warning(__name__ + ' : FIFO overrun, data lost')
+
+                pos = self._get_param(_spcm_regs.SPC_DATA_AVAIL_USER_POS)
+                avail = self._get_param(_spcm_regs.SPC_DATA_AVAIL_USER_LEN)
+                while avail >= blockbytes and (nblocks is None or count < nblocks):
+                    block = buf[pos:pos + blockbytes]
+                    if nr_of_channels > 1:
+                        block = block.reshape((blocksize, nr_of_channels))
+                    yield block
+
+                    self._set_param(_spcm_regs.SPC_DATA_AVAIL_CARD_LEN, blockbytes)
+                    pos = (pos + blockbytes) % buf.nbytes
+                    avail -= blockbytes
+                    count += 1
+        finally:
+            self._set_param(_spcm_regs.SPC_M2CMD,
+                _spcm_regs.M2CMD_CARD_STOP | _spcm_regs.M2CMD_DATA_STOPDMA)
+
+    def stream_fifo(self, callback, blocksize, nblocks=None, nr_of_channels=1, nbuffers=2):
+        '''
+        Runs a FIFO acquisition and calls callback(block) for each block,
+        see iter_fifo_blocks. The acquisition stops after nblocks blocks,
+        or when the callback returns False.
+
+        Output:
+            count (int) : number of blocks processed
+        '''
+        count = 0
+        blocks = self.iter_fifo_blocks(blocksize, nblocks, nr_of_channels, nbuffers)
+        try:
+            for block in blocks:
+                count += 1
+                if callback(block) is False:
+                    break
+        finally:
+            blocks.close()
+        return count
+
 
 ### test run
 
@@ -1281,9 +1420,9 @@ class Spectrum_M2i2030(Instrument):
             data (int[memsize]): Measurement data
         '''
         self.init_default(memsize=memsize, posttrigger=posttrigger, amp=amp)
-        print 'starting card and waiting for trigger'
+        print('starting card and waiting for trigger')
         self.start_with_trigger_and_waitready()
-        print "received trigger"
+        print("received trigger")
         self.data = self.readout_singlemode_float()
         return self.data
 
@@ -1414,7 +1553,7 @@ class Spectrum_M2i2030(Instrument):
         Output:
             None
         '''
-        logging.debug(__name__ + ' : Set memsize to %s' % lMemzise)
+        logging.debug(__name__ + ' : Set memsize to %s' % lMemsize)
         self._set_param(_spcm_regs.SPC_MEMSIZE, lMemsize)
 
     def do_get_memsize(self):
@@ -18,12 +18,11 @@
 
 from instrument import Instrument
 import visa
-import types
 import logging
 import numpy
-import struct
+from _Tektronix_AWG import Tektronix_AWG, WFM_DTYPE, _waveform_key
 
-class Tektronix_AWG520(Instrument):
+class Tektronix_AWG520(Tektronix_AWG):
     '''
     This is the python driver for the Tektronix AWG520
     Arbitrary Waveform Generator
@@ -55,7 +54,7 @@ class Tektronix_AWG520(Instrument):
             None
         '''
         logging.debug(__name__ + ' : Initializing instrument')
-        Instrument.__init__(self, name, tags=['physical'])
+        Tektronix_AWG.__init__(self, name, tags=['physical'])
 
 
         self._address = address
@@ -66,42 +65,42 @@ class Tektronix_AWG520(Instrument):
         self._numpoints = numpoints
 
         # Add parameters
-        self.add_parameter('trigger_mode', type=types.StringType,
+        self.add_parameter('trigger_mode', type=str,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET)
-        self.add_parameter('trigger_impedance', type=types.FloatType,
+        self.add_parameter('trigger_impedance', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             minval=49, maxval=2e3, units='Ohm')
-        self.add_parameter('trigger_level', type=types.FloatType,
+        self.add_parameter('trigger_level', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             minval=-5, maxval=5, units='Volts')
-        self.add_parameter('clock', type=types.FloatType,
+        self.add_parameter('clock', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             minval=1e6, maxval=1e9, units='Hz')
-        self.add_parameter('numpoints', type=types.IntType,
+        self.add_parameter('numpoints', type=int,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             minval=100, maxval=1e9, units='Int')
-        self.add_parameter('filename', type=types.StringType,
+        self.add_parameter('filename', type=str,
             flags=Instrument.FLAG_SET, channels=(1, 2),
             channel_prefix='ch%d_')
-        self.add_parameter('amplitude', type=types.FloatType,
+        self.add_parameter('amplitude', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2), minval=0, maxval=2, units='Volts', channel_prefix='ch%d_')
-        self.add_parameter('offset', type=types.FloatType,
+        self.add_parameter('offset', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2), minval=-2, maxval=2, units='Volts', channel_prefix='ch%d_')
-        self.add_parameter('marker1_low', type=types.FloatType,
+        self.add_parameter('marker1_low', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2), minval=-2, maxval=2, units='Volts', channel_prefix='ch%d_')
-        self.add_parameter('marker1_high', type=types.FloatType,
+        self.add_parameter('marker1_high', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2), minval=-2, maxval=2, units='Volts', channel_prefix='ch%d_')
-        self.add_parameter('marker2_low', type=types.FloatType,
+        self.add_parameter('marker2_low', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2), minval=-2, maxval=2, units='Volts', channel_prefix='ch%d_')
-        self.add_parameter('marker2_high', type=types.FloatType,
+        self.add_parameter('marker2_high', type=float,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2), minval=-2, maxval=2, units='Volts', channel_prefix='ch%d_')
-        self.add_parameter('status', type=types.StringType,
+        self.add_parameter('status', type=str,
             flags=Instrument.FLAG_GETSET | Instrument.FLAG_GET_AFTER_SET,
             channels=(1, 2),channel_prefix='ch%d_')
 
@@ -109,6 +108,7 @@ class Tektronix_AWG520(Instrument):
         self.add_function('reset')
         self.add_function('get_all')
         self.add_function('clear_waveforms')
+        self.add_function('clear_waveform_cache')
         self.add_function('set_trigger_mode_on')
         self.add_function('set_trigger_mode_off')
         self.add_function('set_trigger_impedance_1e3')
@@ -339,13 +339,13 @@ class Tektronix_AWG520(Instrument):
         if numpts != self._numpoints:
             logging.warning(__name__ + ' : changing numpoints. This will clear all waveforms!')
 
-        response = raw_input('type "yes" to continue')
-        if response is 'yes':
+        response = input('type "yes" to continue')
+        if response == 'yes':
             logging.debug(__name__ + ' : Setting numpoints to %s' %numpts)
             self._numpoints = numpts
             self.clear_waveforms()
         else:
-            print 'aborted'
+            print('aborted')
 
     def do_get_clock(self):
         '''
@@ -427,18 +427,14 @@ class Tektronix_AWG520(Instrument):
             len3=int(data[i])
             len4=int(data[i+1:i+1+len3])
 
-            w=[]
-            m1=[]
-            m2=[]
-
-            for q in range(i+1+len3, i+1+len3+len4,5):
-                j=int(q)
-                c,d = struct.unpack('<fB', data[j:5+j])
-                w.append(c)
-                m2.append(int(d/2))
-                m1.append(d-2*int(d/2))
+            ws = data[i+1+len3:i+1+len3+len4]
+            points = numpy.frombuffer(ws, dtype=WFM_DTYPE)
+            w = points['w'].tolist()
+            m1 = (points['m'] & 1).tolist()
+            m2 = ((points['m'] >> 1) & 1).tolist()
 
             clock = float(data[i+1+len3+len4+5:len(data)])
+            self._wfm_cache[name] = _waveform_key(ws, clock)
 
             self._values['files'][name]={}
             self._values['files'][name]['w']=w
@@ -666,94 +662,9 @@ class Tektronix_AWG520(Instrument):
             self._visainstrument.write('OUTP%s OFF' %channel)
         else:
             logging.debug(__name__ + ' : Try to set status to invalid value %s' % status)
-            print 'Tried to set status to invalid value %s' %status
+            print('Tried to set status to invalid value %s' % status)
 
     #  Ask for string with filenames
     def get_filenames(self):
         logging.debug(__name__ + ' : Read filenames from instrument')
         return self._visainstrument.ask('MMEM:CAT? "MAIN"')
-
-    # Send waveform to the device
-    def send_waveform(self,w,m1,m2,filename,clock):
-        '''
-        Sends a complete waveform. All parameters need to be specified.
-        See also: resend_waveform()
-
-        Input:
-            w (float[numpoints]) : waveform
-            m1 (int[numpoints])  : marker1
-            m2 (int[numpoints])  : marker2
-            filename (string)    : filename
-            clock (int)          : frequency (Hz)
-
-        Output:
-            None
-        '''
-        logging.debug(__name__ + ' : Sending waveform %s to instrument' % filename)
-        # Check for errors
-        dim = len(w)
-
-        if (not((len(w)==len(m1)) and ((len(m1)==len(m2))))):
-            return 'error'
-
-        self._values['files'][filename]={}
-        self._values['files'][filename]['w']=w
-        self._values['files'][filename]['m1']=m1
-        self._values['files'][filename]['m2']=m2
-        self._values['files'][filename]['clock']=clock
-        self._values['files'][filename]['numpoints']=len(w)
-
-        m = m1 + numpy.multiply(m2,2)
-        ws = ''
-        for i in range(0,len(w)):
-            ws = ws + struct.pack('<fB', w[i], int(m[i]))
-
-        s1 = 'MMEM:DATA "%s",' % filename
-        s3 = 'MAGIC 1000\n'
-        s5 = ws
-        s6 = 'CLOCK %.10e\n' % clock
-
-        s4 = '#' + str(len(str(len(s5)))) + str(len(s5))
-        lenlen=str(len(str(len(s6) + len(s5) + len(s4) + len(s3))))
-        s2 = '#' + lenlen + str(len(s6) + len(s5) + len(s4) + len(s3))
-
-        mes = s1 + s2 + s3 + s4 + s5 + s6
-
-        self._visainstrument.write(mes)
-
-    def resend_waveform(self, channel, w=[], m1=[], m2=[], clock=[]):
-        '''
-        Resends the last sent waveform for the designated channel
-        Overwrites only the parameters specified
-
-        Input: (mandatory)
-            channel (int) : 1 or 2, the number of the designated channel
-
-        Input: (optional)
-            w (float[numpoints]) : waveform
-            m1 (int[numpoints])  : marker1
-            m2 (int[numpoints])  : marker2
-            clock (int) : frequency
-
-        Output:
-            None
-        '''
-        filename = self._values['recent_channel_%s' %channel]['filename']
-        logging.debug(__name__ + ' : Resending %s to channel %s' % (filename, channel))
-
-
-        if (w==[]):
-            w = self._values['recent_channel_%s' %channel]['w']
-        if (m1==[]):
-            m1 = self._values['recent_channel_%s' %channel]['m1']
-        if (m2==[]):
-            m2 = self._values['recent_channel_%s' %channel]['m2']
-        if (clock==[]):
-            clock = self._values['recent_channel_%s' %channel]['clock']
-
-        if not ( (len(w) == self._numpoints) and (len(m1) == self._numpoints) and (len(m2) == self._numpoints)):
-            logging.error(__name__ + ' : one (or more) lengths of waveforms do not match with numpoints')
-
-        self.send_waveform(w,m1,m2,filename,clock)
-        self.do_set_filename(filename, channel)
-
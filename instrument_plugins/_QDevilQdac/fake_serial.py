@@ -0,0 +1,149 @@
+# fake_serial.py, loopback serial port that answers like a QDAC
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import collections
+import time
+
+
+class FakeQdacSerial:
+    # Replacement for serial.Serial that answers the QDAC commands used by
+    # the driver, for testing and benchmarking without an instrument.
+    # Replies become readable after the command and reply have been
+    # transferred at the emulated baud rate, plus a fixed firmware latency.
+
+    def __init__(self, baudrate=460800, latency=200e-6, timeout=0.5, numBoards=3):
+        # baudrate: transfer rate to emulate, None for no transfer delay
+        # latency: seconds between receiving a command and sending the reply
+        # timeout: read timeout in seconds, like serial.Serial
+        # numBoards: number of 8-channel boards
+        self.baudrate = baudrate
+        self.latency = latency
+        self.timeout = timeout
+        self.numBoards = numBoards
+        self.is_open = True
+
+        self.voltages = {}
+        self.outputs = {}
+        self.generators = {}
+        self.nreads = 0
+        self.nwrites = 0
+
+        self._inbuf = bytearray()
+        self._avail = bytearray()
+        self._pending = collections.deque()
+        self._lineFree = 0.0
+
+    def _byteTime(self, n):
+        if self.baudrate is None:
+            return 0.0
+        return n * 10.0 / self.baudrate
+
+    def _update(self):
+        now = time.time()
+        while self._pending and self._pending[0][0] <= now:
+            self._avail += self._pending.popleft()[1]
+
+    def write(self, data):
+        self.nwrites += 1
+        self._inbuf += data
+        t = time.time() + self._byteTime(len(data))
+        while True:
+            idx = self._inbuf.find(b"\n")
+            if idx < 0:
+                break
+            cmd = bytes(self._inbuf[:idx]).strip()
+            del self._inbuf[: idx + 1]
+            reply = self._handle(cmd) + b"\n"
+            start = max(t + self.latency, self._lineFree)
+            self._lineFree = start + self._byteTime(len(reply))
+            self._pending.append((self._lineFree, reply))
+        return len(data)
+
+    def read(self, size=1):
+        self.nreads += 1
+        deadline = time.time() + self.timeout
+        self._update()
+        while len(self._avail) < size:
+            if self._pending and self._pending[0][0] <= deadline:
+                time.sleep(max(0, self._pending[0][0] - time.time()))
+            else:
+                time.sleep(max(0, deadline - time.time()))
+                self._update()
+                break
+            self._update()
+        out = bytes(self._avail[:size])
+        del self._avail[:size]
+        return out
+
+    @property
+    def in_waiting(self):
+        self._update()
+        return len(self._avail)
+
+    def reset_input_buffer(self):
+        self._update()
+        del self._avail[:]
+
+    def close(self):
+        self.is_open = False
+
+    def _handle(self, cmd):
+        args = cmd.split()
+        if not args:
+            return b"Error: Empty command"
+        name, args = args[0], args[1:]
+        try:
+            if name == b"set" and len(args) == 1:
+                ch = int(args[0])
+                return b"Ch%d: Output: %.6f V" % (ch, self.voltages.get(ch, 0.0))
+            if name == b"set" and len(args) == 2:
+                ch, volts = int(args[0]), float(args[1])
+                self.voltages[ch] = volts
+                digital = int(round(volts / 10.0 * 524287))
+                return b"Ch%d: Output: %.6f (%d)" % (ch, volts, digital)
+            if name == b"get":
+                # Leakage of 10 MOhm
+                ch = int(args[0])
+                return b"Current: %.6fuA" % (self.voltages.get(ch, 0.0) * 0.1)
+            if name == b"wav":
+                ch = int(args[0])
+                if len(args) > 1:
+                    self.outputs[ch] = (int(args[1]), float(args[2]), float(args[3]))
+                gen, amp, off = self.outputs.get(ch, (0, 1.0, 0.0))
+                return b"Output: %d, Generator: %d, Amplitude: %f, Offset: %f" % (
+                    ch,
+                    gen,
+                    amp,
+                    off,
+                )
+            if name == b"fun" and int(args[1]) in (2, 3):
+                gen, wave, period = int(args[0]), int(args[1]), int(args[2])
+                duty, reps, trig = float(args[3]), int(args[4]), int(args[5])
+                self.generators[gen] = (wave, period, duty, reps, trig)
+                return (
+                    b"Generator: %d, Curvetype: %d, Period: %d, Dutycycle: %f, "
+                    b"Repetitions: %d, Trigger: %d"
+                    % (gen, wave, period, duty, reps, trig)
+                )
+            if name == b"trig":
+                return b"Trigger %d executed" % int(args[0])
+            if name == b"sernum":
+                return b"FAKE0001"
+            if name == b"boardNum":
+                return b"Number of boards: %d" % self.numBoards
+        except (IndexError, ValueError):
+            return b"Error: Invalid arguments"
+        return b"Error: Unknown command"
@@ -0,0 +1,365 @@
+# stream.py, receiver for the SR860 UDP data stream
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+"""
+The SR860 streams data as UDP packets, each with a 4 byte big-endian
+header followed by the samples:
+
+    bits  0-7   packet counter
+    bits  8-11  content: 0-3 = X, XY, RT, XYRT as float32,
+                         4-7 = the same as int16
+    bits 12-15  payload size: 0-3 = 1024, 512, 256, 128 bytes
+    bits 16-19  sample rate code (STREAMRATE)
+    bits 20-23  status bits (overloads)
+    bit  24     payload is little-endian
+    bit  25     data integrity checking enabled
+"""
+
+import logging
+import socket
+import struct
+import threading
+import time
+
+import numpy as np
+
+DEFAULT_PORT = 1865
+
+CHANNELS = (('X',), ('X', 'Y'), ('R', 'Theta'), ('X', 'Y', 'R', 'Theta'))
+PACKET_SIZES = (1024, 512, 256, 128)
+
+
+def parse_header(header: int):
+    """
+    Splits a packet header into its fields.
+
+    Input:
+            header (int)  : the first 4 bytes as big-endian integer
+
+    Output:
+            dict with counter, content, nchannels, is_int, size, rate,
+            status and little_endian
+    """
+    content = (header >> 8) & 0xf
+    return {
+        'counter': header & 0xff,
+        'content': content,
+        'nchannels': len(CHANNELS[content & 3]),
+        'is_int': content >= 4,
+        'size': PACKET_SIZES[(header >> 12) & 3],
+        'rate': (header >> 16) & 0xf,
+        'status': (header >> 20) & 0xf,
+        'little_endian': bool(header & (1 << 24)),
+    }
+
+
+def decode_packet(packet: bytes):
+    """
+    Decodes a stream packet.
+
+    Input:
+            packet (bytes) : the UDP datagram
+
+    Output:
+            (info, samples): the header fields (see parse_header) and a
+            float array of shape (nsamples, nchannels)
+
+    Raises ValueError if the packet length does not match the payload
+    size in the header.
+    """
+    if len(packet) < 4:
+        raise ValueError('Stream packet of {} bytes has no header'.format(
+            len(packet)))
+    info = parse_header(struct.unpack('>I', packet[:4])[0])
+    if len(packet) - 4 != info['size']:
+        raise ValueError('Stream packet payload is {} bytes, header says '
+                         '{}'.format(len(packet) - 4, info['size']))
+    dtype = '<' if info['little_endian'] else '>'
+    dtype += 'i2' if info['is_int'] else 'f4'
+    values = np.frombuffer(packet, dtype=dtype, offset=4)
+    nch = info['nchannels']
+    values = values[:len(values) // nch * nch]
+    return info, values.reshape(-1, nch).astype(np.float64)
+
+
+class StreamReceiver:
+    """
+    Receives the SR860 UDP stream in a background thread. Samples are
+    stored in a ring buffer, from which the last N samples or all new
+    samples since a previous read can be taken.
+
+    Packets are checked with the 8 bit packet counter. Lost packets are
+    counted and filled with NaN, so the sample index stays proportional to
+    the time since the start of the stream.
+    """
+
+    def __init__(self, port: int = DEFAULT_PORT, capacity: int = 1 << 20,
+                 nchannels: int = 2, int_scale: float = 1.0,
+                 host: str = ''):
+        """
+        Input:
+                port (int)        : UDP port to listen on
+                capacity (int)    : ring buffer size in samples
+                nchannels (int)   : channels per sample, see CHANNELS
+                int_scale (float) : factor applied to int16 payloads
+                host (str)        : interface to bind to, '' for all
+        """
+        self._port = port
+        self._host = host
+        self._capacity = capacity
+        self._nchannels = nchannels
+        self._int_scale = int_scale
+
+        self._buf = np.zeros((capacity, nchannels))
+        self._total = 0
+        self._lock = threading.Condition()
+        self._socket = None
+        self._thread = None
+        self._stop = threading.Event()
+        self.reset_stats()
+
+    def reset_stats(self):
+        self._packets = 0
+        self._lost = 0
+        self._bad = 0
+        self._status = 0
+        self._last_counter = None
+
+    def start(self):
+        """
+        Opens the socket and starts the receiving thread.
+        """
+        if self._thread is not None:
+            return
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 22)
+        self._socket.bind((self._host, self._port))
+        self._socket.settimeout(0.1)
+        self._port = self._socket.getsockname()[1]
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='SR860Stream')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the receiving thread and closes the socket.
+        """
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self._socket.close()
+        self._socket = None
+
+    def get_port(self) -> int:
+        return self._port
+
+    def _run(self):
+        packet = bytearray(4 + max(PACKET_SIZES))
+        while not self._stop.is_set():
+            try:
+                n = self._socket.recv_into(packet)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                logging.error('SR860 stream receive failed: %s', e)
+                break
+            try:
+                self._handle_packet(bytes(packet[:n]))
+            except Exception as e:
+                self._bad += 1
+                logging.error('SR860 stream packet handling failed: %s', e)
+
+    def _handle_packet(self, packet: bytes):
+        try:
+            info, samples = decode_packet(packet)
+        except ValueError as e:
+            self._bad += 1
+            logging.warning('SR860 stream packet rejected: %s', e)
+            return
+        if info['nchannels'] != self._nchannels:
+            self._bad += 1
+            logging.warning('SR860 stream packet with %d channels, expected %d',
+                            info['nchannels'], self._nchannels)
+            return
+        if info['is_int']:
+            samples *= self._int_scale
+
+        counter = info['counter']
+        if self._last_counter is not None:
+            missing = (counter - self._last_counter - 1) & 0xff
+            if missing > 0:
+                self._lost += missing
+                logging.warning('SR860 stream lost %d packet(s)', missing)
+                gap = np.full((missing * len(samples), self._nchannels), np.nan)
+                self._append(gap)
+        self._last_counter = counter
+        self._packets += 1
+        self._status |= info['status']
+        self._append(samples)
+
+    def _append(self, samples):
+        with self._lock:
+            if len(samples) > self._capacity:
+                self._total += len(samples) - self._capacity
+                samples = samples[-self._capacity:]
+            pos = self._total % self._capacity
+            first = min(len(samples), self._capacity - pos)
+            self._buf[pos:pos+first] = samples[:first]
+            self._buf[:len(samples)-first] = samples[first:]
+            self._total += len(samples)
+            self._lock.notify_all()
+
+    def _get_range(self, start, stop):
+        """Return samples [start, stop) as counted from the stream start."""
+        idx = np.arange(start, stop) % self._capacity
+        return self._buf[idx]
+
+    def get_last(self, n: int):
+        """
+        Returns the last n samples.
+
+        Input:
+                n (int)       : number of samples
+
+        Output:
+                array of shape (n, nchannels), fewer if not available yet
+        """
+        with self._lock:
+            n = min(n, self._total, self._capacity)
+            return self._get_range(self._total - n, self._total)
+
+    def read_new(self, cursor: int = 0, timeout: float = None):
+        """
+        Returns the samples received since 'cursor', waiting at most
+        'timeout' seconds for new samples. Samples that were overwritten
+        in the ring buffer are skipped.
+
+        Input:
+                cursor (int)    : sample count returned by the previous call
+                timeout (float) : time to wait for new data
+
+        Output:
+                (samples, cursor, skipped): array of shape (n, nchannels),
+                the cursor for the next call and the number of samples
+                that were overwritten before they could be read
+        """
+        with self._lock:
+            if self._total <= cursor and timeout:
+                self._lock.wait(timeout)
+            total = self._total
+            start = max(cursor, total - self._capacity)
+            return self._get_range(start, total), total, start - cursor
+
+    def get_total(self) -> int:
+        """Returns the number of samples received, including NaN gaps."""
+        return self._total
+
+    def get_stats(self) -> dict:
+        """
+        Returns the number of packets received, lost and rejected, and the
+        status bits seen since the last reset_stats().
+        """
+        return {'packets': self._packets, 'lost': self._lost,
+                'bad': self._bad, 'status': self._status}
+
+
+class FakeSR860Sender:
+    """
+    Sends a stream in the SR860 packet format to a local UDP port, for
+    testing the receiver without an instrument. The samples are sine
+    waves with the channel index as phase offset.
+    """
+
+    def __init__(self, port: int, host: str = '127.0.0.1', content: int = 1,
+                 size_code: int = 0, rate: float = 10000.0,
+                 little_endian: bool = False, drop: tuple = ()):
+        """
+        Input:
+                port (int)          : destination port
+                host (str)          : destination host
+                content (int)       : packet content code, see parse_header
+                size_code (int)     : packet size code (STREAMPCKT)
+                rate (float)        : samples per second
+                little_endian (bool): payload byte order
+                drop (tuple)        : packet numbers not to send, to test
+                                      gap detection
+        """
+        self._addr = (host, port)
+        self._content = content
+        self._size_code = size_code
+        self._rate = rate
+        self._little_endian = little_endian
+        self._drop = set(drop)
+        self._nchannels = len(CHANNELS[content & 3])
+        itemsize = 2 if content >= 4 else 4
+        self._per_packet = PACKET_SIZES[size_code] // itemsize // self._nchannels
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sample = 0
+        self._packet = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    def samples(self, start: int, n: int):
+        """Returns the values of samples start up to start + n."""
+        t = np.arange(start, start + n)[:, None] / self._rate
+        phase = np.arange(self._nchannels)[None, :]
+        values = np.sin(2 * np.pi * 10 * t + phase)
+        if self._content >= 4:
+            return np.round(values * 30000)
+        return values
+
+    def send_packet(self):
+        """Builds and sends the next packet."""
+        values = self.samples(self._sample, self._per_packet)
+        header = (self._packet & 0xff) | (self._content << 8) | \
+            (self._size_code << 12)
+        if self._little_endian:
+            header |= 1 << 24
+        dtype = '<' if self._little_endian else '>'
+        dtype += 'i2' if self._content >= 4 else 'f4'
+        packet = struct.pack('>I', header) + values.astype(dtype).tobytes()
+        if self._packet not in self._drop:
+            self._socket.sendto(packet, self._addr)
+        self._sample += self._per_packet
+        self._packet += 1
+
+    def run(self, duration: float):
+        """
+        Sends packets in real time at the configured sample rate for
+        'duration' seconds, in a background thread.
+        """
+        def loop():
+            t0 = time.time()
+            while not self._stop.is_set() and time.time() - t0 < duration:
+                due = (time.time() - t0) * self._rate
+                while self._sample + self._per_packet <= due:
+                    self.send_packet()
+                time.sleep(0.001)
+
+        self._thread = threading.Thread(target=loop, name='FakeSR860')
+        self._thread.daemon = True
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._socket.close()
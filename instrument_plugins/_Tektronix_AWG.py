@@ -0,0 +1,165 @@
+# _Tektronix_AWG.py, waveform upload shared by the Tektronix AWG drivers
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+from instrument import Instrument
+import logging
+import numpy
+import hashlib
+
+# One waveform point in a .wfm file: float32 value and marker byte
+WFM_DTYPE = numpy.dtype([('w', '<f4'), ('m', 'u1')])
+
+def _ieee_block(data):
+    '''
+    Prefixes data with an IEEE 488.2 definite length block header.
+    '''
+    n = str(len(data))
+    return ('#%d%s' % (len(n), n)).encode('ascii') + data
+
+def _pack_waveform(w, m1, m2):
+    '''
+    Packs a waveform and its markers into the binary .wfm point format.
+
+    Input:
+        w (float[numpoints]) : waveform
+        m1 (int[numpoints])  : marker1
+        m2 (int[numpoints])  : marker2
+
+    Output:
+        packed points (5 bytes each)
+    '''
+    data = numpy.empty(len(w), dtype=WFM_DTYPE)
+    data['w'] = w
+    data['m'] = numpy.asarray(m1, dtype=int) + 2 * numpy.asarray(m2, dtype=int)
+    return data.tobytes()
+
+def _waveform_key(ws, clock):
+    '''
+    Returns the content hash of packed waveform points and clock.
+    '''
+    return hashlib.sha1(ws + ('CLOCK %.10e' % clock).encode('ascii')).hexdigest()
+
+class Tektronix_AWG(Instrument):
+    '''
+    Base class of the Tektronix AWG520 and AWG5014 drivers, which upload
+    waveforms in the same .wfm format. Sent waveforms are remembered by
+    content hash, so unchanged waveforms are not uploaded again.
+
+    Subclasses provide self._visainstrument, self._values, self._numpoints
+    and do_set_filename().
+    '''
+
+    def __init__(self, name, **kwargs):
+        Instrument.__init__(self, name, **kwargs)
+        # Content hash of the waveform file last sent, per filename
+        self._wfm_cache = {}
+
+    # Send waveform to the device
+    def send_waveform(self, w, m1, m2, filename, clock, force=False):
+        '''
+        Sends a complete waveform. All parameters need to be specified.
+        If a waveform with the same points, markers and clock was already
+        sent under this filename, nothing is sent, unless force is set.
+        See also: resend_waveform(), clear_waveform_cache()
+
+        Input:
+            w (float[numpoints]) : waveform
+            m1 (int[numpoints])  : marker1
+            m2 (int[numpoints])  : marker2
+            filename (string)    : filename
+            clock (int)          : frequency (Hz)
+            force (bool)         : send even if the instrument has it already
+
+        Output:
+            None
+        '''
+        logging.debug(__name__ + ' : Sending waveform %s to instrument' % filename)
+        # Check for errors
+        if (not((len(w)==len(m1)) and ((len(m1)==len(m2))))):
+            return 'error'
+
+        self._values['files'][filename]={}
+        self._values['files'][filename]['w']=w
+        self._values['files'][filename]['m1']=m1
+        self._values['files'][filename]['m2']=m2
+        self._values['files'][filename]['clock']=clock
+        self._values['files'][filename]['numpoints']=len(w)
+
+        ws = _pack_waveform(w, m1, m2)
+        key = _waveform_key(ws, clock)
+        if not force and self._wfm_cache.get(filename) == key:
+            logging.debug(__name__ + ' : Waveform %s unchanged, not sending' % filename)
+            return
+
+        body = 'MAGIC 1000\n'.encode('ascii') + _ieee_block(ws) + \
+            ('CLOCK %.10e\n' % clock).encode('ascii')
+        mes = ('MMEM:DATA "%s",' % filename).encode('ascii') + _ieee_block(body)
+
+        # Forget the old hash first, in case the transfer fails halfway
+        self._wfm_cache.pop(filename, None)
+        self._visainstrument.write_raw(mes)
+        self._wfm_cache[filename] = key
+
+    def clear_waveform_cache(self):
+        '''
+        Forgets which waveforms were sent, so the next send_waveform()
+        always uploads. Use this when files on the instrument were changed
+        by other means.
+
+        Input:
+            None
+
+        Output:
+            None
+        '''
+        self._wfm_cache = {}
+
+    def resend_waveform(self, channel, w=None, m1=None, m2=None, clock=None):
+        '''
+        Resends the last sent waveform for the designated channel
+        Overwrites only the parameters specified. The upload is skipped if
+        the instrument already holds the resulting waveform.
+
+        Input: (mandatory)
+            channel (int) : the number of the designated channel
+
+        Input: (optional)
+            w (float[numpoints]) : waveform
+            m1 (int[numpoints])  : marker1
+            m2 (int[numpoints])  : marker2
+            clock (int) : frequency
+
+        Output:
+            None
+        '''
+        recent = self._values['recent_channel_%s' % channel]
+        filename = recent['filename']
+        logging.debug(__name__ + ' : Resending %s to channel %s' % (filename, channel))
+
+        if w is None or len(w) == 0:
+            w = recent['w']
+        if m1 is None or len(m1) == 0:
+            m1 = recent['m1']
+        if m2 is None or len(m2) == 0:
+            m2 = recent['m2']
+        if clock is None or clock == []:
+            clock = recent['clock']
+
+        if not ( (len(w) == self._numpoints) and (len(m1) == self._numpoints) and (len(m2) == self._numpoints)):
+            logging.error(__name__ + ' : one (or more) lengths of waveforms do not match with numpoints')
+
+        self.send_waveform(w,m1,m2,filename,clock)
+        self.do_set_filename(filename, channel)
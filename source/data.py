@@ -31,6 +31,8 @@ import re
 import logging
 import copy
 import shutil
+import io
+import json
 
 from gettext import gettext as _L
 
@@ -170,6 +172,89 @@ class _DataList(namedlist.NamedList):
             return name
 
 
+class _DataBuffer:
+    """
+    Growable row store backing Data._data.
+
+    Rows are appended into a preallocated array whose capacity doubles when
+    it runs out, so appending is O(1) amortized. view() returns the filled
+    part of the storage as a contiguous view, without copying.
+    """
+
+    def __init__(self, capacity=1024):
+        self._min_capacity = capacity
+        self.clear()
+
+    def __len__(self):
+        return self._n
+
+    def clear(self):
+        """Drop all rows."""
+        self._array = np.array([])
+        self._n = 0
+
+    def set(self, data):
+        """Use the array 'data' as storage, without copying it."""
+        if not isinstance(data, np.ndarray):
+            data = np.array(data)
+        self._array = data
+        self._n = len(data)
+
+    def view(self):
+        """Return the rows added so far."""
+        if self._array.ndim != 2:
+            return self._array
+        return self._array[: self._n]
+
+    def get_capacity(self):
+        return len(self._array)
+
+    def _grow(self, nrows, ncols, dtype):
+        capacity = max(self._min_capacity, 2 * len(self._array), self._n + nrows)
+        array = np.empty((capacity, ncols), dtype=dtype)
+        array[: self._n] = self._array[: self._n]
+        self._array = array
+
+    def append(self, rows):
+        """
+        Append one or more rows. 'rows' is a 2d array-like (npoints x ncols),
+        or a 1d sequence for a single row.
+        """
+        # Fast path for a single row of plain numbers
+        n = self._n
+        if (
+            type(rows) in (tuple, list)
+            and 0 < n < len(self._array)
+            and self._array.ndim == 2
+            and len(rows) == self._array.shape[1]
+            and self._array.dtype.kind == "f"
+        ):
+            try:
+                self._array[n] = rows
+                self._n = n + 1
+                return
+            except (TypeError, ValueError):
+                pass
+
+        rows = np.atleast_2d(rows)
+        nrows, ncols = rows.shape
+
+        if self._n == 0 or self._array.ndim != 2:
+            self._array = np.empty((0, ncols), dtype=rows.dtype)
+            self._n = 0
+        elif ncols != self._array.shape[1]:
+            raise ValueError(
+                "Number of columns changed (%d != %d)" % (ncols, self._array.shape[1])
+            )
+
+        dtype = np.result_type(self._array.dtype, rows.dtype)
+        if dtype != self._array.dtype or self._n + nrows > len(self._array):
+            self._grow(nrows, ncols, dtype)
+
+        self._array[self._n : self._n + nrows] = rows
+        self._n += nrows
+
+
 class Data:
     """
     Data class
@@ -250,6 +335,17 @@ class Data:
     _META_COLRE = re.compile("^#.*Column ?(\\d+)", re.I)
     _META_COMMENTRE = re.compile("^#(.*)", re.I)
 
+    # Binary cache file format
+    _CACHE_MAGIC = b"QTLABBIN"
+    _CACHE_VERSION = 1
+
+    # Line types used when scanning a data file
+    _LINE_BLANK = 0
+    _LINE_COMMENT = 1
+    _LINE_DATA = 2
+    _LINE_OTHER = 3
+    _WHITESPACE = np.array([ord(" "), ord("\t"), ord("\r")], dtype=np.uint8)
+
     """
     _INT_TYPES = (
             types.IntType, types.LongType,
@@ -294,6 +390,22 @@ class Data:
             tempfile (bool), default False. If True create a temporary file
                 for the data.
             binary (bool), default True. Whether tempfile should be binary.
+            max_rows (int), default None. Only load the first max_rows data
+                points from filename.
+            usecols (sequence of ints), default None. Only load these columns
+                from filename.
+            binary_cache (bool), default config 'data_binary_cache' or False.
+                Write a binary cache file next to the data file when it is
+                loaded or closed. An up-to-date cache is always used when
+                loading the full file.
+            durable (bool), default True. Flush the file after every
+                add_data_point(). If False, formatted data is buffered and
+                written when flush_interval or flush_bytes is exceeded, on
+                new_block() and on close_file().
+            flush_interval (float), default 1.0. Max seconds between flushes
+                when not durable.
+            flush_bytes (int), default 1048576. Max buffered bytes when
+                not durable.
         """
 
         # Init SharedGObject a bit lower
@@ -308,12 +420,25 @@ class Data:
         self._options = kwargs
         self._file = None
         self._stop_req_hid = None
+        self._buffer = _DataBuffer()
+
+        # File write buffering
+        self._durable = kwargs.get("durable", True)
+        self._flush_interval = kwargs.get("flush_interval", 1.0)
+        self._flush_bytes = kwargs.get("flush_bytes", 1048576)
+        self._write_buffer = []
+        self._write_buffer_size = 0
+        self._last_flush = time.time()
+        self._binary_cache = kwargs.get(
+            "binary_cache", config.get("data_binary_cache", False)
+        )
 
         # Dimension info
         self._dimensions = []
         self._block_sizes = []
         self._loopdims = None
         self._loopshape = None
+        self._loop_npoints = 0
         self._complete = False
         self._reshaped_data = None
 
@@ -355,7 +480,12 @@ class Data:
         elif filepath is not None and filepath != "":
             if "inmem" not in kwargs:
                 inmem = True
-            self.set_filepath(filepath, inmem)
+            self.set_filepath(
+                filepath,
+                inmem,
+                max_rows=kwargs.get("max_rows", None),
+                usecols=kwargs.get("usecols", None),
+            )
             self._infile = True
         else:
             self._dir = ""
@@ -376,6 +506,15 @@ class Data:
     def __setitem__(self, index, val):
         self._data[index] = val
 
+    def _get_data_array(self):
+        return self._buffer.view()
+
+    def _set_data_array(self, data):
+        self._buffer.set(data)
+
+    # In-memory data, backed by a growable buffer
+    _data = property(_get_data_array, _set_data_array)
+
     # Data info
 
     def get_dimensions(self):
@@ -553,6 +692,14 @@ class Data:
         fn, ext = os.path.splitext(self.get_filepath())
         return fn + ".set"
 
+    def get_cache_filepath(self):
+        fn, ext = os.path.splitext(self.get_filepath())
+        return fn + ".bin"
+
+    def is_inmem(self):
+        """Return whether the data is kept in memory."""
+        return self._inmem
+
     def is_file_open(self):
         """Return whether a file is open or not."""
 
@@ -610,6 +757,7 @@ class Data:
         """Add comment to the Data object."""
         self._comment.append(comment)
         if self._file is not None:
+            self.flush_file()
             self._file.write("# %s\n" % comment)
 
     def get_comment(self):
@@ -665,9 +813,13 @@ class Data:
         """
 
         if self._file is not None:
+            self.flush_file()
             self._file.close()
             self._file = None
 
+            if self._binary_cache and self._inmem and not self._tempfile:
+                self._write_cache()
+
         if self._stop_req_hid is not None and in_qtlab:
             qt.flow.disconnect(self._stop_req_hid)
             self._stop_req_hid = None
@@ -743,6 +895,105 @@ class Data:
         self._file.write(line)
         self._file.flush()
 
+    def _get_column_formats(self, ncols):
+        """Return the format strings used for float values in each column."""
+        precision = config.get("default_precision", 12)
+        formats = []
+        for colnum in range(ncols):
+            opts = {}
+            if colnum < len(self._dimensions):
+                opts = self._dimensions[colnum]
+            if "format" in opts:
+                formats.append(opts["format"])
+            else:
+                formats.append("%%.%de" % opts.get("precision", precision))
+        return formats
+
+    def _format_data_rows(self, rows):
+        """
+        Format a 2d array / list of rows in the same way as
+        _write_data_line(), with a single string formatting operation.
+        """
+        if isinstance(rows, np.ndarray) and rows.dtype.kind in "biuf":
+            rows = np.atleast_2d(rows)
+            if rows.dtype.type in self._INT_TYPES:
+                formats = ["%d"] * rows.shape[1]
+            else:
+                formats = self._get_column_formats(rows.shape[1])
+            rowfmt = "\t".join(formats) + "\n"
+            return (rowfmt * len(rows)) % tuple(rows.ravel().tolist())
+
+        # Sequence of rows, use integer format per value like
+        # _format_data_value().
+        fmts = []
+        vals = []
+        formats = None
+        for row in rows:
+            if not hasattr(row, "__len__"):
+                row = (row,)
+            if formats is None or len(formats) < len(row):
+                formats = self._get_column_formats(len(row))
+            fmts.append(
+                "\t".join(
+                    [
+                        "%d" if type(val) in self._INT_TYPES else formats[i]
+                        for i, val in enumerate(row)
+                    ]
+                )
+            )
+            fmts.append("\n")
+            vals.extend(row)
+        return "".join(fmts) % tuple(vals)
+
+    def _write_data_rows(self, rows):
+        """
+        Write one or more rows of data. In durable mode the file is flushed
+        directly, otherwise the text is buffered until flush_file().
+        """
+
+        if self._file is None:
+            logging.info("File not opened yet, doing now")
+            self.create_file()
+
+        text = self._format_data_rows(rows)
+        if self._durable:
+            self._file.write(text)
+            self._file.flush()
+            return
+
+        self._write_buffer.append(text)
+        self._write_buffer_size += len(text)
+        if (
+            self._write_buffer_size >= self._flush_bytes
+            or time.time() - self._last_flush >= self._flush_interval
+        ):
+            self.flush_file()
+
+    def flush_file(self):
+        """Write buffered data to the data file and flush it."""
+
+        self._last_flush = time.time()
+        if self._file is None:
+            return
+
+        if len(self._write_buffer) > 0:
+            self._file.write("".join(self._write_buffer))
+            self._write_buffer = []
+            self._write_buffer_size = 0
+        self._file.flush()
+
+    def set_durable(self, durable):
+        """
+        Set whether the data file is flushed after every add_data_point()
+        (durable), or written in buffered blocks.
+        """
+        self._durable = durable
+        if durable:
+            self.flush_file()
+
+    def get_durable(self):
+        return self._durable
+
     def _get_block_columns(self):
         blockcols = []
         for i in range(self.get_ncoordinates()):
@@ -908,7 +1159,7 @@ class Data:
                 ncols = len(args)
                 npoints = shapes[0][0]
                 # Transpose args to a single 2-d list
-                args = zip(*args)
+                args = list(zip(*args))
             elif sum(dims != 0) == 0:
                 ncols = len(args)
                 npoints = 1
@@ -943,17 +1194,14 @@ class Data:
         #   - a 1d tuple of numbers, for adding a single data point
         #   - a 2d tuple/list/array, for adding >1 data points
         if self._inmem:
-            if len(self._data) == 0:
-                self._data = np.atleast_2d(args)
-            else:
-                self._data = np.append(self._data, [args], axis=0)
+            self._buffer.append(args)
+            self._reshaped_data = None
 
         if self._infile:
-            if npoints == 1:
-                self._write_data_line(args)
-            elif npoints > 1:
-                for i in range(npoints):
-                    self._write_data_line(args[i])
+            if npoints > 1 or isinstance(args, np.ndarray):
+                self._write_data_rows(args)
+            else:
+                self._write_data_rows([args])
 
         self._npoints += npoints
         self._npoints_last_block += npoints
@@ -969,7 +1217,11 @@ class Data:
         """Start a new data block."""
 
         if self._infile:
-            self._file.write("\n")
+            if self._durable:
+                self._file.write("\n")
+            else:
+                self._write_buffer.append("\n")
+                self.flush_file()
 
         self._block_sizes.append(self._npoints_last_block)
         self._npoints_last_block = 0
@@ -1011,6 +1263,7 @@ class Data:
         self._infile = False
         self._npoints = len(self._data)
         self._block_sizes = []
+        self._reshaped_data = None
 
         # Add dimension information
         if len(data.shape) == 1:
@@ -1053,6 +1306,7 @@ class Data:
         If the data is associated with a temporary file, it will be updated.
         """
         self._data = data
+        self._reshaped_data = None
         if self._tempfile:
             self.rewrite_tempfile()
 
@@ -1070,13 +1324,218 @@ class Data:
             self._nvalues = 1
             self._ncoordinates -= 1
 
-    def _load_file(self):
+    def _classify_lines(self, buf):
+        """
+        Classify the lines in buf (bytes ending with a newline).
+
+        Returns (starts, ends, kinds), with kinds _LINE_BLANK, _LINE_COMMENT,
+        _LINE_DATA or _LINE_OTHER (ignored, e.g. an indented comment).
+        """
+        a = np.frombuffer(buf, dtype=np.uint8)
+        ends = np.flatnonzero(a == 10)
+        starts = np.empty_like(ends)
+        starts[0] = 0
+        starts[1:] = ends[:-1] + 1
+
+        first = a[starts]
+        kinds = np.full(len(ends), self._LINE_DATA, dtype=np.int8)
+        kinds[first == ord("#")] = self._LINE_COMMENT
+        kinds[first == 10] = self._LINE_BLANK
+
+        # Lines starting with whitespace are rare, check those one by one
+        for i in np.flatnonzero(np.isin(first, self._WHITESPACE)):
+            line = buf[starts[i] : ends[i]].strip()
+            if len(line) == 0:
+                kinds[i] = self._LINE_BLANK
+            elif line.startswith(b"#"):
+                kinds[i] = self._LINE_OTHER
+
+        return starts, ends, kinds
+
+    def _scan_file(self, f, max_rows=None, chunk_size=1 << 24):
+        """
+        First pass of loading a file: parse the comment lines (meta data)
+        and determine the block structure, without converting any numbers.
+
+        Returns the number of data lines and the number of bytes up to and
+        including the last data line read.
+        """
+
+        ndata = 0
+        blocksize = 0
+        offset = 0
+        tail = b""
+        while max_rows is None or ndata < max_rows:
+            chunk = f.read(chunk_size)
+            if len(chunk) == 0:
+                if len(tail) == 0:
+                    break
+                chunk = b"\n"
+            buf = tail + chunk
+            lastnl = buf.rfind(b"\n")
+            if lastnl == -1:
+                tail = buf
+                continue
+            tail = buf[lastnl + 1 :]
+            buf = buf[: lastnl + 1]
+
+            starts, ends, kinds = self._classify_lines(buf)
+            isdata = kinds == self._LINE_DATA
+            cumdata = np.cumsum(isdata) + ndata
+
+            if max_rows is not None and cumdata[-1] > max_rows:
+                n = np.searchsorted(cumdata, max_rows) + 1
+                starts, ends, kinds = starts[:n], ends[:n], kinds[:n]
+                cumdata = cumdata[:n]
+                buf = buf[: ends[-1] + 1]
+            offset += len(buf)
+
+            for i in np.flatnonzero(kinds == self._LINE_COMMENT):
+                line = buf[starts[i] : ends[i]].decode("utf-8", "replace")
+                self._parse_meta_data(line.rstrip(" \n\t\r"))
+
+            # A blank line ends a block, once data has been seen
+            blanks = cumdata[kinds == self._LINE_BLANK]
+            blanks = blanks[blanks > 0]
+            if len(blanks) > 0:
+                sizes = np.diff(np.concatenate(([ndata - blocksize], blanks)))
+                self._block_sizes.extend(sizes.tolist())
+                blocksize = 0
+                ndata = int(blanks[-1])
+
+            blocksize += int(cumdata[-1]) - ndata
+            ndata = int(cumdata[-1])
+
+        self._npoints_last_block = blocksize
+        self._npoints_max_block = max(self._block_sizes + [blocksize])
+        return ndata, offset
+
+    def _write_cache(self):
+        """
+        Write the in-memory data to the binary cache file, see
+        get_cache_filepath().
+
+        The file consists of _CACHE_MAGIC, the header length as a
+        little-endian uint64, a JSON header with the meta data and the
+        size / modification time of the data file, and the data as
+        little-endian float64 in C order.
+        """
+
+        data = self._data
+        if data.ndim != 2 or len(data) == 0 or data.dtype.kind not in "biuf":
+            return False
+
+        try:
+            st = os.stat(self.get_filepath())
+        except OSError:
+            return False
+
+        header = {
+            "version": self._CACHE_VERSION,
+            "shape": list(data.shape),
+            "dimensions": self._dimensions,
+            "block_sizes": self._block_sizes,
+            "npoints_last_block": self._npoints_last_block,
+            "npoints_max_block": self._npoints_max_block,
+            "comment": self._comment,
+            "source_size": st.st_size,
+            "source_mtime": st.st_mtime,
+        }
+        header = json.dumps(header, default=str).encode("utf-8")
+        # Pad the header so the data is 8-byte aligned
+        header += b" " * (-(len(self._CACHE_MAGIC) + 8 + len(header)) % 8)
+
+        fn = self.get_cache_filepath()
+        tmpfn = fn + ".tmp"
+        try:
+            with open(tmpfn, "wb") as f:
+                f.write(self._CACHE_MAGIC)
+                f.write(np.array(len(header), dtype="<u8").tobytes())
+                f.write(header)
+                np.ascontiguousarray(data, dtype="<f8").tofile(f)
+            os.replace(tmpfn, fn)
+        except Exception as e:
+            logging.warning("Unable to write cache file %s: %s", fn, e)
+            return False
+
+        return True
+
+    def _load_cache(self):
+        """
+        Load data from the binary cache file, if it exists and is up to
+        date with the data file. The data is memory-mapped, not read.
+        """
+
+        fn = self.get_cache_filepath()
+        try:
+            st = os.stat(self.get_filepath())
+            with open(fn, "rb") as f:
+                if f.read(len(self._CACHE_MAGIC)) != self._CACHE_MAGIC:
+                    return False
+                hdrlen = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+                header = json.loads(f.read(hdrlen).decode("utf-8"))
+        except (OSError, IndexError, ValueError):
+            return False
+
+        if (
+            header.get("version") != self._CACHE_VERSION
+            or header.get("source_size") != st.st_size
+            or header.get("source_mtime") != st.st_mtime
+        ):
+            logging.info("Cache file %s out of date", fn)
+            return False
+
+        try:
+            data = np.memmap(
+                fn,
+                dtype="<f8",
+                mode="c",
+                offset=len(self._CACHE_MAGIC) + 8 + hdrlen,
+                shape=tuple(header["shape"]),
+            )
+        except (OSError, ValueError) as e:
+            logging.warning("Unable to map cache file %s: %s", fn, e)
+            return False
+
+        self._dimensions = header["dimensions"]
+        self._comment = header["comment"]
+        self._block_sizes = header["block_sizes"]
+        self._npoints_last_block = header["npoints_last_block"]
+        self._npoints_max_block = header["npoints_max_block"]
+        self._count_coord_val_dims()
+
+        self._data = data
+        self._npoints = len(data)
+        self._inmem = True
+        self._reshaped_data = None
+
+        try:
+            self._detect_dimensions_size()
+        except Exception as e:
+            logging.warning("Error while detecting dimension size")
+
+        return True
+
+    def _load_file(self, max_rows=None, usecols=None):
         """
         Load data from file and store internally.
+
+        The file is read in two passes: the first parses the header and
+        block structure, the second parses all numbers at once. When loading
+        the complete file an up-to-date binary cache is used instead, if
+        available.
+
+        Input:
+            max_rows (int): only load the first max_rows data points
+            usecols (sequence of ints): only load these columns
         """
 
+        full = max_rows is None and usecols is None
+        if full and self._load_cache():
+            return True
+
         try:
-            f = file(self.get_filepath(), "r")
+            f = open(self.get_filepath(), "rb")
         except:
             logging.warning("Unable to open file %s" % self.get_filepath())
             return False
@@ -1084,55 +1543,53 @@ class Data:
         self._dimensions = []
         self._values = []
         self._comment = []
-        data = []
-        nfields = 0
 
         self._block_sizes = []
         self._npoints = 0
         self._npoints_last_block = 0
         self._npoints_max_block = 0
 
-        blocksize = 0
-
-        for line in f:
-            line = line.rstrip(" \n\t\r")
-
-            # Count blocks
-            if len(line) == 0 and len(data) > 0:
-                self._block_sizes.append(blocksize)
-                if blocksize > self._npoints_max_block:
-                    self._npoints_max_block = blocksize
-                blocksize = 0
-
-            # Strip comment
-            commentpos = line.find("#")
-            if commentpos != -1:
-                self._parse_meta_data(line)
-                line = line[:commentpos]
-
-            fields = line.split()
-            if len(fields) > nfields:
-                nfields = len(fields)
+        try:
+            ndata, nbytes = self._scan_file(f, max_rows=max_rows)
+
+            if ndata > 0:
+                f.seek(0)
+                body = f
+                if max_rows is not None:
+                    body = io.BytesIO(f.read(nbytes))
+                data = np.loadtxt(body, comments="#", usecols=usecols, ndmin=2)
+            else:
+                data = np.array([])
+        except Exception as e:
+            logging.warning("Unable to load file %s: %s", self.get_filepath(), e)
+            return False
+        finally:
+            f.close()
 
-            fields = [float(f) for f in fields]
-            if len(fields) > 0:
-                data.append(fields)
-                blocksize += 1
+        if usecols is not None:
+            self._dimensions = [
+                self._dimensions[i] for i in usecols if i < len(self._dimensions)
+            ]
 
+        nfields = 0
+        if len(data) > 0:
+            nfields = data.shape[1]
         self._add_missing_dimensions(nfields)
         self._count_coord_val_dims()
 
-        self._data = np.array(data)
+        self._data = data
         self._npoints = len(self._data)
         self._inmem = True
-
-        self._npoints_last_block = blocksize
+        self._reshaped_data = None
 
         try:
             self._detect_dimensions_size()
         except Exception as e:
             logging.warning("Error while detecting dimension size")
 
+        if full and self._binary_cache:
+            self._write_cache()
+
         return True
 
     def _type_added(self, name):
@@ -1156,7 +1613,7 @@ class Data:
 
         colnum = len(self._dimensions) - 1
 
-        for tagname, metainfo in self._METADATA_INFO.iteritems():
+        for tagname, metainfo in self._METADATA_INFO.items():
             m = metainfo["re"].match(line)
             if m is not None:
                 if metainfo["type"] == float:
@@ -1182,17 +1639,25 @@ class Data:
         """
         Return a reshaped version of the data. This is not guaranteed to be
         a view to the same data object.
+
+        If the outer loop of the measurement is not complete yet the missing
+        points are filled with NaN, so a running measurement can be shown
+        with its final shape.
         """
 
         if self._reshaped_data is not None:
             return self._reshaped_data
 
-        loopdims = copy.copy(self._loopdims)
-        newshape = copy.copy(self._loopshape)
-        if not self._complete or None in (loopdims, newshape):
-            return None
-
         data = self._data
+        if self._loopdims is None or self._loop_npoints != len(data):
+            if data.ndim != 2 or len(data) < 2:
+                return None
+            self._detect_loops(data)
+
+        loopdims = self._loopdims
+        nexpected = int(np.prod(self._loopshape))
+        if len(loopdims) == 0 or len(data) > nexpected:
+            return None
 
         cshape_ok, fshape_ok = True, True
         for i in range(len(loopdims)):
@@ -1204,11 +1669,16 @@ class Data:
         if not cshape_ok and not fshape_ok:
             logging.warning("Unable to do simple data reshape")
         else:
-            newshape.reverse()
+            if len(data) < nexpected:
+                padded = np.full((nexpected, data.shape[1]), np.nan)
+                padded[: len(data)] = data
+                data = padded
+
+            newshape = list(reversed(self._loopshape))
             newshape.append(-1)
             data = data.reshape(newshape)
 
-            # Swap axes if necessary
+            # Put the axes in coordinate order if necessary
             if fshape_ok:
                 for i in range(self.get_ncoordinates() - 1):
                     data = data.swapaxes(i, i + 1)
@@ -1216,6 +1686,45 @@ class Data:
         self._reshaped_data = data
         return self._reshaped_data
 
+    def _detect_loops(self, data):
+        """
+        Detect the loop structure of the coordinate columns in data.
+
+        Sets _loopdims (the swept columns, from inner to outer loop),
+        _loopshape (the number of steps of each loop) and _complete. If the
+        outer loop is still running, its last step is counted as well, so
+        the product of _loopshape is larger than the number of points.
+        """
+
+        ncoords = self.get_ncoordinates()
+        npoints = len(data)
+        loopdims = []
+        loopshape = []
+        mulsize = 1
+        while len(loopdims) < ncoords and mulsize < npoints:
+            changed = np.flatnonzero(data[0, :ncoords] != data[mulsize, :ncoords])
+            if len(changed) == 0:
+                break
+            loopdim = int(changed[0])
+
+            # Loop size is the first repetition of the start value
+            col = data[::mulsize, loopdim]
+            repeats = np.flatnonzero(col[1:] == col[0])
+            if len(repeats) > 0:
+                size = int(repeats[0]) + 1
+            else:
+                size = len(col)
+
+            loopdims.append(loopdim)
+            loopshape.append(size)
+            mulsize *= size
+
+        self._loopdims = loopdims
+        self._loopshape = loopshape
+        self._loop_npoints = npoints
+        self._complete = npoints == mulsize
+        return self._complete
+
     def _detect_dimensions_size(self):
         data = self._data
         ncoords = self.get_ncoordinates()
@@ -1224,62 +1733,32 @@ class Data:
                 self._dimensions[colnum]["size"] = len(data)
             return
 
-        loopdims = []
-        newshape = []
-        mulsize = 1
-        firstloopdim = None
-        for iter in range(ncoords):
-            loopdim = None
-            for colnum in range(ncoords):
-                if mulsize >= len(data):
-                    continue
-
-                if data[0, colnum] != data[mulsize, colnum]:
-                    loopdim = colnum
-                    loopdims.append(loopdim)
-                    loopstart = data[0, loopdim]
-                    break
-
-            if loopdim is None:
-                break
-
-            if firstloopdim is None:
-                firstloopdim = loopdim
-
-            i = 1
-            while i * mulsize < len(data):
-                if data[i * mulsize, loopdim] == loopstart:
-                    break
-                i += 1
+        complete = self._detect_loops(data)
 
+        mulsize = 1
+        for loopdim, size in zip(self._loopdims, self._loopshape):
             opt = self._dimensions[loopdim]
-            opt["start"] = loopstart
-            opt["size"] = i
-            opt["end"] = data[mulsize * (i - 1), loopdim]
-            newshape.append(i)
-
-            mulsize *= i
-
-        complete = len(self._data) == mulsize
-        self._loopdims = loopdims
-        self._loopshape = newshape
-        self._complete = complete
-
-        # Determine number of blocks
-        bs = self._dimensions[firstloopdim]["size"]
-        if bs > 0:
-            if len(data) % bs == 0:
-                self._block_sizes = [bs] * (len(data) / bs)
-            else:
-                self._block_sizes = [bs] * (int(len(data) / bs) + 1)
+            opt["start"] = data[0, loopdim]
+            opt["size"] = size
+            opt["end"] = data[min(mulsize * (size - 1), len(data) - 1), loopdim]
+            mulsize *= size
+
+        # Determine blocks, if not known from the file
+        if len(self._loopshape) > 0 and len(self._block_sizes) == 0:
+            bs = self._loopshape[0]
+            if self._npoints_last_block == 0:
+                self._block_sizes = [bs] * (len(data) // bs)
+                self._npoints_last_block = len(data) % bs
 
         return complete
 
-    def set_filepath(self, fp, inmem=True):
+    def set_filepath(self, fp, inmem=True, max_rows=None, usecols=None):
         """
         Set the filepath associated with the data.
         If inmem is True it will be loaded directly.
         If fp is a directory, a file with extension .dat will be searched for.
+        max_rows and usecols can be used to load only the first data points
+        or a subset of the columns, e.g. to preview a large file.
         """
 
         if os.path.isdir(fp):
@@ -1301,7 +1780,7 @@ class Data:
             self._dir, self._filename = os.path.split(fp)
 
         if inmem:
-            if self._load_file():
+            if self._load_file(max_rows=max_rows, usecols=usecols):
                 self._inmem = True
             else:
                 self._inmem = False
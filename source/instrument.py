@@ -26,7 +26,9 @@ import numpy as np
 
 import qt
 from source.lib import calltimer
+from source.lib import ramp
 from source.lib.config import get_config
+from source.lib.poller import get_poller
 from source.lib.network.object_sharer import cache_result
 
 config = get_config()
@@ -100,10 +102,13 @@ class Instrument:
             self._options['tags'] = []
 
         self._parameters = {}
+        self._parameter_getters = {}
+        self._parameter_setters = {}
+        self._parameter_ramps = {}
         self._parameter_groups = {}
         self._functions = {}
         self._added_methods = []
-        self._probe_ids = []
+        self._probe_ids = {}
 
         self._default_read_var = None
         self._default_write_var = None
@@ -309,12 +314,8 @@ class Instrument:
         base_name = kwargs.get('base_name', name)
 
         if options['flags'] & Instrument.FLAG_GET:
-            if ch is not None:
-                func = lambda query=True, **lopts: \
-                    self.get(name, query=query, channel=ch, **lopts)
-            else:
-                func = lambda query=True, **lopts: \
-                    self.get(name, query=query, **lopts)
+            func = lambda query=True, fast=False, **lopts: \
+                self._get_parameter(name, query, fast, **lopts)
 
             self._add_options_to_doc(options)
             func.__doc__ = 'Get variable %s' % name
@@ -338,22 +339,16 @@ class Instrument:
                 self._get_not_implemented(base_name)
 
         if options['flags'] & Instrument.FLAG_SOFTGET:
-            if ch is not None:
-                func = lambda query=True, **lopts: \
-                    self.get(name, query=False, channel=ch, **lopts)
-            else:
-                func = lambda query=True, **lopts: \
-                    self.get(name, query=False, **lopts)
+            func = lambda query=True, fast=False, **lopts: \
+                self._get_parameter(name, False, fast, **lopts)
 
             func.__doc__ = 'Get variable %s (internal stored value)' % name
             setattr(self, 'get_%s' % name,  func)
             self._added_methods.append('get_%s' % name)
 
         if options['flags'] & Instrument.FLAG_SET:
-            if ch is not None:
-                func = lambda val, **lopts: self.set(name, val, channel=ch, **lopts)
-            else:
-                func = lambda val, **lopts: self.set(name, val, **lopts)
+            func = lambda val, fast=False, **lopts: \
+                self._set_parameter(name, val, fast, **lopts)
 
             func.__doc__ = 'Set variable %s' % name
             if 'doc' in options:
@@ -383,10 +378,12 @@ class Instrument:
         else:
             options['value'] = None
 
+        self._compile_parameter(name)
+
         if 'probe_interval' in options:
             interval = int(options['probe_interval'])
-            #self._probe_ids.append(gobject.timeout_add(interval,
-            #    lambda: self.get(name)))
+            self._probe_ids[name] = get_poller().subscribe(self._name, name,
+                interval / 1000.0)
 
         if 'listen_to' in options:
             insset = set([])
@@ -412,11 +409,24 @@ class Instrument:
         object can be garbage collected.
         '''
 
+        self._remove_probes()
         for name, opts in self._parameters.items():
             for fname in ('get_%s' % name, 'set_%s' % name):
                 if hasattr(self, fname):
                     delattr(self, fname)
         self._parameters = {}
+        self._parameter_getters = {}
+        self._parameter_setters = {}
+        self._parameter_ramps = {}
+
+    def _remove_probes(self):
+        '''
+        Stop polling the parameters that have a probe_interval.
+        '''
+
+        for sid in self._probe_ids.values():
+            get_poller().unsubscribe(sid)
+        self._probe_ids = {}
 
     def remove_parameter(self, name):
         if name not in self._parameters:
@@ -427,6 +437,11 @@ class Instrument:
                 delattr(self, func)
 
         del self._parameters[name]
+        del self._parameter_getters[name]
+        del self._parameter_setters[name]
+        del self._parameter_ramps[name]
+        if name in self._probe_ids:
+            get_poller().unsubscribe(self._probe_ids.pop(name))
         #self.emit('parameter-removed', name)
 
     def has_parameter(self, name):
@@ -479,6 +494,8 @@ class Instrument:
         for key, val in kwargs.items():
             self._parameters[name][key] = val
 
+        self._compile_parameter(name)
+
         #self.emit('parameter-changed', name)
 
     def get_parameter_tags(self, name):
@@ -671,6 +688,70 @@ class Instrument:
 
         return text
 
+    _GET_CONVERT_MAP = {
+            int: int,
+            float: float,
+            bool: bool,
+            np.ndarray: np.array,
+    }
+
+    def _compile_parameter(self, name):
+        '''
+        Create the functions that get and set parameter 'name', containing
+        only the checks and conversions needed for its options. They are
+        rebuilt when the options change through set_parameter_options().
+
+        Input:  name of parameter (string)
+        Output: None
+        '''
+
+        p = self._parameters[name]
+        self._parameter_getters[name] = self._compile_get(name, p)
+        self._parameter_setters[name], self._parameter_ramps[name] = \
+            self._compile_set(name, p)
+
+    def _compile_get(self, name, p):
+        flags = p['flags']
+        softget = flags & Instrument.FLAG_SOFTGET
+        gettable = flags & Instrument.FLAG_GET
+        is_array = p.get('type') == np.ndarray
+        convert = self._GET_CONVERT_MAP.get(p.get('type'))
+        func = p.get('get_func')
+        has_channel = 'channel' in p
+        channel = p.get('channel')
+
+        def get_value(query=True, **kwargs):
+            if not query or softget:
+                if is_array:
+                    return np.array(p.get('value'))
+                return p.get('value')
+
+            # Check this here; getting of cached values should work
+            if not gettable:
+                print('Instrument does not support getting of %s' % name)
+                return None
+
+            if has_channel and 'channel' not in kwargs:
+                kwargs['channel'] = channel
+
+            return store_value(func(**kwargs))
+
+        def store_value(value):
+            if convert is not None and value is not None:
+                try:
+                    value = convert(value)
+                except:
+                    logging.warning('Unable to cast value "%s" to %s',
+                        value, p['type'])
+
+            p['value'] = value
+            return value
+
+        # Used by _get_many() to store values read by _do_get_many()
+        get_value.bulk = bool(gettable and not softget)
+        get_value.store = store_value
+        return get_value
+
     def _get_value(self, name, query=True, **kwargs):
         '''
         Private wrapper function to get a value.
@@ -682,55 +763,34 @@ class Instrument:
         '''
 
         try:
-            p = self._parameters[name]
-        except:
+            get_value = self._parameter_getters[name]
+        except KeyError:
             print('Could not retrieve options for parameter %s' % name)
             return None
 
-        if 'channel' in p and 'channel' not in kwargs:
-            kwargs['channel'] = p['channel']
+        return get_value(query, **kwargs)
 
-        flags = p['flags']
-        if not query or flags & 8: #self.FLAG_SOFTGET:
-            if 'value' in p:
-                if p['type'] == np.ndarray:
-                    return np.array(p['value'])
-                else:
-                    return p['value']
-            else:
-#                logging.debug('Trying to access cached value, but none available')
-                return None
-
-        # Check this here; getting of cached values should work
-        if not flags & 1: #Instrument.FLAG_GET:
-            print('Instrument does not support getting of %s' % name)
-            return None
+    def _need_access_lock(self):
+        '''
+        Return whether get/set should hold the access lock: always with
+        USE_ACCESS_LOCK, otherwise while a background ramp that steps
+        under this lock is running, so the two cannot interleave.
+        '''
+        return Instrument.USE_ACCESS_LOCK or \
+                ramp.get_ramp_engine().uses_lock(self._access_lock)
 
-        if 'base_name' in p:
-            base_name = p['base_name']
-        else:
-            base_name = name
+    def _get_parameter(self, name, query=True, fast=False, **kwargs):
+        '''
+        Get a single parameter, used by the get_<name> functions.
+        Equivalent to get(name, ...), without handling lists of names.
+        '''
 
-        func = p['get_func']
-        value = func(**kwargs)
-        if 'type' in p and value is not None:
-            try:
-                if p['type'] == int:
-                    value = int(value)
-                elif p['type'] == float:
-                    value = float(value)
-                elif p['type'] == str:
-                    pass
-                elif p['type'] == bool:
-                    value = bool(value)
-                elif p['type'] == type(None):
-                    pass
-                elif p['type'] == np.ndarray:
-                    value = np.array(value)
-            except:
-                logging.warning('Unable to cast value "%s" to %s', value, p['type'])
+        if self._need_access_lock():
+            return self.get(name, query=query, fast=fast, **kwargs)
 
-        p['value'] = value
+        value = self._parameter_getters[name](query, **kwargs)
+        if query and not fast:
+            self._queue_changed({name: value})
         return value
 
     def get(self, name, query=True, fast=False, **kwargs):
@@ -749,38 +809,72 @@ class Instrument:
                 Type is whatever the instrument driver returns.
         '''
 
-        if Instrument.USE_ACCESS_LOCK:
+        locked = self._need_access_lock()
+        if locked:
             if not self._access_lock.acquire():
                 logging.warning(_L('Failed to acquire lock!'))
                 return None
 
-        if fast:
-            ret = self._get_value(name, query, **kwargs)
-            if Instrument.USE_ACCESS_LOCK:
-                self._access_lock.release()
-            return ret
+        try:
+            if fast:
+                return self._get_value(name, query, **kwargs)
 
-        if type(name) in (list, tuple):
-            changed = {}
-            result = {}
-            for key in name:
-                val = self._get_value(key, query, **kwargs)
-                if val is not None:
-                    result[key] = val
-                    changed[key] = val
+            if type(name) in (list, tuple):
+                result = self._get_many(name, query, **kwargs)
+                changed = dict(result)
 
-        else:
-            result = self._get_value(name, query, **kwargs)
-            changed = {name: result}
+            else:
+                result = self._get_value(name, query, **kwargs)
+                changed = {name: result}
 
-        if Instrument.USE_ACCESS_LOCK:
-            self._access_lock.release()
+        finally:
+            if locked:
+                self._access_lock.release()
 
         if len(changed) > 0 and query:
             self._queue_changed(changed)
 
         return result
 
+    def _get_many(self, names, query=True, **kwargs):
+        '''
+        Get several parameters. If the driver implements
+        _do_get_many(names, **kwargs), the gettable parameters are read
+        with a single call to it. It should return a dictionary of
+        parameter name -> value for the parameters it was able to read;
+        other parameters are read one by one.
+
+        Input:  (1) list of parameter names
+                (2) query the instrument or return stored values (Boolean)
+                (3) optional list of extra options
+        Output: dictionary of parameter name -> value, excluding None values
+        '''
+
+        values = {}
+        if query and hasattr(self, '_do_get_many'):
+            bulk = []
+            for key in names:
+                getter = self._parameter_getters.get(key)
+                if getter is not None and getter.bulk and key not in bulk:
+                    bulk.append(key)
+
+            if len(bulk) > 1:
+                raw = self._do_get_many(bulk, **kwargs)
+                for key, val in raw.items():
+                    if key in bulk:
+                        values[key] = self._parameter_getters[key].store(val)
+
+        result = {}
+        for key in names:
+            if key in values:
+                val = values[key]
+            else:
+                val = self._get_value(key, query, **kwargs)
+            if val is not None:
+                result[key] = val
+
+        return result
+
     def get_threaded(self, *args, **kwargs):
         '''
         Perform a get in a separate thread. Run gobject main loop while
@@ -878,6 +972,175 @@ class Instrument:
 
         return value
 
+    def _compile_set(self, name, p):
+        flags = p['flags']
+        settable = flags & Instrument.FLAG_SET
+        get_after_set = flags & Instrument.FLAG_GET_AFTER_SET
+        persist = flags & Instrument.FLAG_PERSIST
+        format_map = p.get('format_map')
+        option_list = p.get('option_list')
+        has_type = 'type' in p
+        ttype = p.get('type')
+        convert = self._CONVERT_MAP.get(ttype)
+        has_minval = 'minval' in p
+        minval = p.get('minval')
+        has_maxval = 'maxval' in p
+        maxval = p.get('maxval')
+        stepped = p.get('maxstep') is not None
+        func = p.get('set_func')
+        has_channel = 'channel' in p
+        channel = p.get('channel')
+        get_value = self._parameter_getters[name]
+
+        def check_value(value):
+            # If a format map is available the key should be found.
+            if format_map is not None:
+                newval = self._val_from_option_dict(format_map, value)
+                if newval is None:
+                    logging.error('Value %s is not a valid option for "%s", valid options: %r',
+                        value, name, repr(format_map))
+                    raise ValueError()
+                value = newval
+
+            # If an option list is available check whether the value is in there
+            if option_list is not None:
+                newval = self._val_from_option_list(option_list, value)
+                if newval is None:
+                    logging.error('Value %s is not a valid option for "%s", valid: %r',
+                        value, name, repr(option_list))
+                    raise ValueError()
+                value = newval
+
+            if convert is not None and (type(value) is not bool or ttype is bool):
+                try:
+                    value = convert(value)
+                except:
+                    logging.warning('Conversion of %r to type %s failed',
+                            value, ttype)
+                    raise ValueError()
+            elif has_type:
+                value = self._convert_value(value, ttype)
+
+            if has_minval and value < minval:
+                print('Trying to set too small value: %s' % value)
+                raise ValueError()
+
+            if has_maxval and value > maxval:
+                print('Trying to set too large value: %s' % value)
+                raise ValueError()
+
+            return value
+
+        def value_set(value, kwargs):
+            if get_after_set:
+                value = get_value(**kwargs)
+
+            if persist:
+                config.set('persist_%s_%s' % (self._name, name), value)
+                config.save()
+
+            p['value'] = value
+            return value
+
+        def set_value(value, **kwargs):
+            if not settable:
+                print('Instrument does not support setting of %s' % name)
+                return None
+
+            if has_channel and 'channel' not in kwargs:
+                kwargs['channel'] = channel
+
+            try:
+                value = check_value(value)
+            except ValueError:
+                return None
+
+            if stepped:
+                self._set_value_stepped(p, func, value, **kwargs)
+            else:
+                func(value, **kwargs)
+
+            return value_set(value, kwargs)
+
+        def ramp_value(value, **kwargs):
+            if not settable:
+                print('Instrument does not support setting of %s' % name)
+                return None
+
+            if has_channel and 'channel' not in kwargs:
+                kwargs['channel'] = channel
+
+            try:
+                value = check_value(value)
+            except ValueError:
+                return None
+
+            maxstep = None
+            curval = p['value']
+            if stepped:
+                maxstep = p['maxstep']
+                if curval is None:
+                    logging.warning('Current value not available, ignoring maxstep')
+                    curval = value + 0.01 * maxstep
+
+            def step_cb(val):
+                p['value'] = val
+
+            def done_cb(val):
+                val = value_set(val, kwargs)
+                self._queue_changed({name: val})
+
+            task = ramp.RampTask('%s.%s' % (self._name, name), func,
+                    curval, value, maxstep=maxstep,
+                    stepdelay=p.get('stepdelay', 50),
+                    step_cb=step_cb, done_cb=done_cb, kwargs=kwargs,
+                    key=(self._name, name), lock=self._access_lock)
+            return ramp.get_ramp_engine().start(task)
+
+        # Used by _set_many() to check / store values for _do_set_many()
+        set_value.bulk = bool(settable)
+        set_value.check = check_value
+        set_value.finish = value_set
+        return set_value, ramp_value
+
+    def _set_value_stepped(self, p, func, value, **kwargs):
+        '''
+        Set a value in steps of at most p['maxstep'], waiting
+        p['stepdelay'] ms between the steps.
+        '''
+
+        curval = p['value']
+        if curval is None:
+            logging.warning('Current value not available, ignoring maxstep')
+            curval = value + 0.01 * p['maxstep']
+
+        delta = curval - value
+        if delta < 0:
+            sign = 1
+        else:
+            sign = -1
+
+        if 'stepdelay' in p:
+            delay = p['stepdelay']
+        else:
+            delay = 50
+
+        ret = None
+        while math.fabs(delta) > 0:
+            if math.fabs(delta) > p['maxstep']:
+                curval += sign * p['maxstep']
+                delta += sign * p['maxstep']
+            else:
+                curval = value
+                delta = 0
+
+            ret = func(curval, **kwargs)
+
+            if delta != 0:
+                time.sleep(delay / 1000.0)
+
+        return ret
+
     def _set_value(self, name, value, **kwargs):
         '''
         Private wrapper function to set a value.
@@ -889,102 +1152,123 @@ class Instrument:
         Output: Value returned by the _do_set_<name> function,
                 or result of get in FLAG_GET_AFTER_SET specified.
         '''
-        #if self._parameters.has_key(name):
-        if name in self._parameters:
-            p = self._parameters[name]
-            
+
+        if name in self._parameter_setters:
+            return self._parameter_setters[name](value, **kwargs)
         else:
             return None
 
-        if not p['flags'] & Instrument.FLAG_SET:
-            print('Instrument does not support setting of %s' % name)
-            return None
+    def _set_parameter(self, name, value, fast=False, **kwargs):
+        '''
+        Set a single parameter, used by the set_<name> functions.
+        Equivalent to set(name, value, ...), without handling dicts.
+        '''
 
-        if 'channel' in p and 'channel' not in kwargs:
-            kwargs['channel'] = p['channel']
-
-        # If a format map is available the key should be found.
-        if 'format_map' in p:
-            newval = self._val_from_option_dict(p['format_map'], value)
-            if newval is None:
-                logging.error('Value %s is not a valid option for "%s", valid options: %r',
-                    value, name, repr(p['format_map']))
-                return
-            value = newval
-
-        # If an option list is available check whether the value is in there
-        if 'option_list' in p:
-            newval = self._val_from_option_list(p['option_list'], value)
-            if newval is None:
-                logging.error('Value %s is not a valid option for "%s", valid: %r',
-                    value, name, repr(p['option_list']))
-                return
-            value = newval
-
-        if 'type' in p:
-            try:
-                value = self._convert_value(value, p['type'])
-            except:
-                
-                return None
+        if self._locked or self._need_access_lock():
+            return self.set(name, value, fast=fast, **kwargs)
 
-        if 'minval' in p and value < p['minval']:
-            print('Trying to set too small value: %s' % value)
-            return None
+        value = self._parameter_setters[name](value, **kwargs)
+        if value is None:
+            return False
 
-        if 'maxval' in p and value > p['maxval']:
-            print('Trying to set too large value: %s' % value)
-            return None
+        if not fast:
+            self._queue_changed({name: value})
+        return True
 
-        if 'base_name' in p:
-            base_name = p['base_name']
-        else:
-            base_name = name
+    def _set_many(self, values, **kwargs):
+        '''
+        Set several parameters. If the driver implements
+        _do_set_many(values, **kwargs), the values of settable parameters
+        are checked first and sent with a single call to it. It should
+        return the names of the parameters it has set; other parameters are
+        set one by one. Parameters with a maxstep are stepped together,
+        calling _do_set_many once per step.
 
-        func = p['set_func']
-        if 'maxstep' in p and p['maxstep'] is not None:
-            curval = p['value']
-            if curval is None:
-                logging.warning('Current value not available, ignoring maxstep')
-                curval = value + 0.01 * p['maxstep']
+        Input:  (1) dictionary of parameter name -> value
+                (2) optional list of extra options
+        Output: tuple (success, dictionary of parameter name -> new value)
+        '''
 
-            delta = curval - value
-            if delta < 0:
-                sign = 1
-            else:
-                sign = -1
+        result = True
+        changed = {}
+        done = ()
+        if hasattr(self, '_do_set_many'):
+            bulk = {}
+            for key, val in values.items():
+                setter = self._parameter_setters.get(key)
+                if setter is None or not setter.bulk:
+                    continue
+                try:
+                    bulk[key] = setter.check(val)
+                except ValueError:
+                    bulk[key] = None
+
+            failed = [key for key, val in bulk.items() if val is None]
+            for key in failed:
+                del bulk[key]
+            if len(failed) > 0:
+                result = False
 
-            if 'stepdelay' in p:
-                delay = p['stepdelay']
+            if len(bulk) > 1:
+                done = self._set_many_stepped(bulk, **kwargs)
+                for key in done:
+                    changed[key] = self._parameter_setters[key].finish(
+                            bulk[key], kwargs)
+            done = set(done) | set(failed)
+
+        for key, val in values.items():
+            if key in done:
+                continue
+            val = self._set_value(key, val, **kwargs)
+            if val is not None:
+                changed[key] = val
             else:
-                delay = 50
-
-            while math.fabs(delta) > 0:
-                if math.fabs(delta) > p['maxstep']:
-                    curval += sign * p['maxstep']
-                    delta += sign * p['maxstep']
-                else:
-                    curval = value
-                    delta = 0
-
-                ret = func(curval, **kwargs)
-
-                if delta != 0:
-                    time.sleep(delay / 1000.0)
-
-        else:
-            ret = func(value, **kwargs)
-
-        if p['flags'] & self.FLAG_GET_AFTER_SET:
-            value = self._get_value(name, **kwargs)
-
-        if p['flags'] & self.FLAG_PERSIST:
-            config.set('persist_%s_%s' % (self._name, name), value)
-            config.save()
+                result = False
 
-        p['value'] = value
-        
-        return value
+        return result, changed
+
+    def _set_many_stepped(self, values, **kwargs):
+        '''
+        Set values through _do_set_many(), moving the parameters that have
+        a maxstep in steps together. The delay between steps is the largest
+        stepdelay of these parameters.
+
+        Input:  (1) dictionary of parameter name -> checked value
+                (2) optional list of extra options
+        Output: names of the parameters set by _do_set_many()
+        '''
+
+        curvals = {}
+        delay = 0
+        for key in values:
+            p = self._parameters[key]
+            if p.get('maxstep') is not None and p['value'] is not None:
+                curvals[key] = p['value']
+                delay = max(delay, p.get('stepdelay', 50))
+
+        done = None
+        while True:
+            finished = True
+            step = {}
+            for key, val in values.items():
+                if done is not None and key not in done:
+                    continue
+                if key in curvals:
+                    maxstep = self._parameters[key]['maxstep']
+                    delta = val - curvals[key]
+                    if math.fabs(delta) > maxstep:
+                        val = curvals[key] + math.copysign(maxstep, delta)
+                        finished = False
+                    curvals[key] = val
+                step[key] = val
+
+            ret = self._do_set_many(step, **kwargs)
+            if done is None:
+                done = list(ret)
+            if finished or len(done) == 0:
+                return done
+
+            time.sleep(delay / 1000.0)
 
     def set(self, name, value=None, fast=False, **kwargs):
         '''
@@ -1010,37 +1294,61 @@ class Instrument:
             self.get_name()
             return False
 
-        if Instrument.USE_ACCESS_LOCK:
+        locked = self._need_access_lock()
+        if locked:
             if not self._access_lock.acquire():
                 logging.warning(_L('Failed to acquire lock!'))
                 return None
 
         result = True
         changed = {}
-        if type(name) == dict:
-            for key, val in name.items():
-                val = self._set_value(key, val, **kwargs)
+        try:
+            if type(name) == dict:
+                result, changed = self._set_many(name, **kwargs)
+
+            else:
+                val = self._set_value(name, value, **kwargs)
                 if val is not None:
-                    changed[key] = val
+                    changed[name] = val
                 else:
                     result = False
 
-        else:
-            val = self._set_value(name, value, **kwargs)
-            if val is not None:
-                changed[name] = val
-            else:
-                
-                result = False
-
-        if Instrument.USE_ACCESS_LOCK:
-            self._access_lock.release()
+        finally:
+            if locked:
+                self._access_lock.release()
 
         if not fast and len(changed) > 0:
             self._queue_changed(changed)
 
         return result
 
+    def ramp(self, name, value, **kwargs):
+        '''
+        Set a parameter like set(), but perform the steps given by the
+        'maxstep' and 'stepdelay' options in the background, so the ramp
+        does not block and ramps on several instruments can run at the same
+        time. A running ramp of the same parameter is aborted.
+
+        Input:
+            name (string): name of parameter
+            value (any): the value to ramp to
+            kwargs: Optional keyword args that will be passed on.
+
+        Output: RampTask handle with join(), wait() and abort() functions,
+                that can also be awaited. None if the value is not valid.
+        '''
+
+        if self._locked:
+            logging.warning('Trying to set value of locked instrument (%s)',
+                self.get_name())
+            return None
+
+        if name not in self._parameter_ramps:
+            print('Parameter %s not defined' % name)
+            return None
+
+        return self._parameter_ramps[name](value, **kwargs)
+
     def update_value(self, name, value):
         '''
         Update a parameter value if new information is obtained.
@@ -1075,7 +1383,7 @@ class Instrument:
         if hasattr(f, '__doc__'):
             options['doc'] = getattr(f, '__doc__')
 
-        options['argspec'] = self.get_argspec_dict(inspect.getargspec(f))
+        options['argspec'] = self.get_argspec_dict(inspect.getfullargspec(f))
 
         self._functions[name] = options
 
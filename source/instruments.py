@@ -21,9 +21,13 @@ import inspect
 import logging
 import os
 import sys
+import threading
+import time
 #import gobject
 import types
 
+from concurrent.futures import ThreadPoolExecutor
+
 import source.instrument as instrument
 from insproxy import Proxy
 from source.lib.config import get_config
@@ -104,6 +108,27 @@ def _get_driver_module(name, do_reload=False):
     return None
 
 
+def _get_bus(kwargs):
+    '''
+    Return a key for the bus an instrument is connected to, derived from
+    its address. Instruments on the same bus are created one after another:
+    a GPIB board, a network host, or the resource itself for serial and USB
+    devices. Returns None if the instrument has no address.
+    '''
+    address = kwargs.get('address', kwargs.get('port'))
+    if not isinstance(address, str):
+        return None
+
+    parts = address.upper().split('::')
+    if parts[0] == 'GPIB':
+        return 'GPIB0'
+    elif parts[0].startswith('GPIB'):
+        return parts[0]
+    elif parts[0].startswith('TCPIP') and len(parts) > 1:
+        return '%s::%s' % (parts[0], parts[1])
+    return address.upper()
+
+
 class Instruments:
 
     '''
@@ -132,6 +157,8 @@ class Instruments:
         self._instruments = {}
         self._instruments_info = {}
         self._tags = []
+        self._create_times = {}
+        self._lock = threading.RLock()
 
     def __getitem__(self, key):
         return self.get(key)
@@ -149,20 +176,21 @@ class Instruments:
         Output: None
         '''
 
-        self._instruments[ins.get_name()] = ins
-
-        info = {'create_args': create_args}
-        #info['changed_hid'] = ins.connect('changed', self._instrument_changed_cb)
-        #info['removed_hid'] = ins.connect('removed', self._instrument_removed_cb)
-        #info['reload_hid'] = ins.connect('reload', self._instrument_reload_cb)
-        info['proxy'] = Proxy(ins.get_name())
-        self._instruments_info[ins.get_name()] = info
-
-        newtags = []
-        for tag in ins.get_tags():
-            if tag not in self._tags:
-                self._tags.append(tag)
-                newtags.append(tag)
+        with self._lock:
+            self._instruments[ins.get_name()] = ins
+
+            info = {'create_args': create_args}
+            #info['changed_hid'] = ins.connect('changed', self._instrument_changed_cb)
+            #info['removed_hid'] = ins.connect('removed', self._instrument_removed_cb)
+            #info['reload_hid'] = ins.connect('reload', self._instrument_reload_cb)
+            info['proxy'] = Proxy(ins.get_name())
+            self._instruments_info[ins.get_name()] = info
+
+            newtags = []
+            for tag in ins.get_tags():
+                if tag not in self._tags:
+                    self._tags.append(tag)
+                    newtags.append(tag)
         # if len(newtags) > 0:
         #    self.emit('tags-added', newtags)
 
@@ -269,7 +297,7 @@ class Instruments:
         if insclass is None:
             return None
 
-        return inspect.getargspec(insclass.__init__)
+        return inspect.getfullargspec(insclass.__init__)
 
     def get_instruments_by_type(self, typename):
         '''
@@ -308,6 +336,14 @@ class Instruments:
         Output: Instrument object (Proxy)
         '''
 
+        return self._create(name, instype, kwargs, True)
+
+    def _create(self, name, instype, kwargs, do_reload):
+        '''
+        Create an instrument, see create(). If 'do_reload' is True an
+        already imported driver is reloaded first.
+        '''
+
         if not self.type_exists(instype):
             logging.error('Instrument type %s not supported', instype)
             return None
@@ -324,11 +360,13 @@ class Instruments:
         import myVisa
         myVisa.set_visa(visa_driver)
         # print(instype)
+        loaded = instype in sys.modules
         module = _get_driver_module(instype)
         if module is None:
             return self._create_invalid_ins(name, instype, **kwargs)
-        # reload(module)
-        importlib.reload(module)
+        # A driver that was just imported does not need a reload
+        if do_reload and loaded:
+            importlib.reload(module)
 
         insclass = getattr(module, instype, None)
         if insclass is None:
@@ -347,6 +385,89 @@ class Instruments:
         #self.emit('instrument-added', name)
         return self.get(name)
 
+    def create_many(self, specs, max_workers=8):
+        '''
+        Create several instruments, in parallel where possible.
+
+        Each driver is imported once and not reloaded, and all instruments
+        share one VISA ResourceManager. Instruments on different buses are
+        created concurrently in a thread pool, those on the same GPIB board,
+        network host or serial port one after another in the given order.
+        The time taken to create each instrument is logged and can be
+        retrieved with get_create_times().
+
+        Input:  (1) specs, list of instruments to create, either tuples of
+                    (name, type, kwargs) or dictionaries with the keys
+                    'name' and 'instype' and the keyword arguments. The
+                    optional keyword 'bus' sets the bus an instrument is on
+                    when it can not be derived from the address.
+                (2) max_workers, maximum number of threads
+
+        Output: dictionary of name -> Instrument object (Proxy)
+        '''
+
+        jobs = []
+        for spec in specs:
+            if isinstance(spec, dict):
+                kwargs = dict(spec)
+                name = kwargs.pop('name')
+                instype = kwargs.pop('instype')
+            else:
+                name, instype, kwargs = spec
+                kwargs = dict(kwargs)
+            bus = kwargs.pop('bus', None)
+            if bus is None:
+                bus = _get_bus(kwargs)
+            jobs.append((name, instype, kwargs, bus))
+
+        import myVisa
+        for name, instype, kwargs, bus in jobs:
+            myVisa.get_resource_manager(kwargs.get('visa', 'pyvisa'))
+            _get_driver_module(instype)
+
+        # Instruments without a bus get a group of their own
+        groups = []
+        bus_groups = {}
+        for job in jobs:
+            bus = job[3]
+            if bus is None:
+                groups.append([job])
+            elif bus in bus_groups:
+                bus_groups[bus].append(job)
+            else:
+                bus_groups[bus] = [job]
+                groups.append(bus_groups[bus])
+
+        def create_group(group):
+            for name, instype, kwargs, bus in group:
+                start = time.time()
+                self._create(name, instype, kwargs, False)
+                elapsed = time.time() - start
+                with self._lock:
+                    self._create_times[name] = elapsed
+                logging.info('Created instrument %s (%s, bus %s) in %.2f s',
+                             name, instype, bus, elapsed)
+
+        start = time.time()
+        nworkers = max(1, min(max_workers, len(groups)))
+        with ThreadPoolExecutor(max_workers=nworkers) as executor:
+            for future in [executor.submit(create_group, g) for g in groups]:
+                future.result()
+        logging.info('Created %d instruments in %.2f s',
+                     len(jobs), time.time() - start)
+
+        ret = {}
+        for name, instype, kwargs, bus in jobs:
+            ret[name] = self.get(name)
+        return ret
+
+    def get_create_times(self):
+        '''
+        Return dictionary of name -> time in seconds it took to create the
+        instrument, for instruments created with create_many().
+        '''
+        return dict(self._create_times)
+
     def reload_module(self, instype):
         module = _get_driver_module(instype, do_reload=True)
         return module is not None
@@ -418,9 +539,11 @@ class Instruments:
         Input:  (1) instrument name
         Output: None
         '''
-        if name in self._instruments:
-            del self._instruments[name]
-            del self._instruments_info[name]
+        with self._lock:
+            if name in self._instruments:
+                self._instruments[name]._remove_probes()
+                del self._instruments[name]
+                del self._instruments_info[name]
 
         #self.emit('instrument-removed', name)
 
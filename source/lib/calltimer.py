@@ -54,17 +54,23 @@ class GObjectThread(threading.Thread, ThreadSafeGObject):
 '''
 
 class TimedLock():
+    '''
+    Lock that gives up after 'delay' seconds. The same thread can acquire
+    it again, so an instrument can call its own get/set while holding it.
+    '''
+
     def __init__(self, delay=1.0):
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
         self._delay = delay
 
-    def acquire(self):
-        n = int(self._delay / 0.01)
-        for i in range(n):
-            if self._lock.acquire(False):
-                return True
-            time.sleep(0.01)
-        return False
+    def acquire(self, blocking=True):
+        '''
+        Acquire the lock, waiting at most 'delay' seconds, or not at all if
+        blocking is False. Returns whether the lock was acquired.
+        '''
+        if not blocking:
+            return self._lock.acquire(False)
+        return self._lock.acquire(True, self._delay)
 
     def release(self):
         self._lock.release()
@@ -18,6 +18,7 @@
 #import gobject
 import os
 import sys
+import threading
 
 '''
 import gi
@@ -54,12 +55,16 @@ class Config:
         self._config = {}
         self._defaults = {}
         self._save_hid = None
+        self._save_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._changes = 0
 
         self.load_defaults()
         self.load()
 
-        # Override exec dir
-        self['execdir'] = get_execdir()
+        # Override exec dir, only a change of it needs to be saved
+        self.set('execdir', get_execdir(), save=False)
 
     def load_userconfig(self):
         filename = os.path.join(get_execdir(), 'userconfig.py')
@@ -117,9 +122,12 @@ class Config:
             remove_list [string] : list of items to remove
         '''
 
-        for item in remove_list:
-            if item in self._config:
-                del self._config[item]
+        with self._save_lock:
+            for item in remove_list:
+                if item in self._config:
+                    del self._config[item]
+            self._dirty = True
+            self._changes += 1
 
         if save:
             self.save()
@@ -129,25 +137,67 @@ class Config:
         Save settings.
 
         'delay' specifies the delay (in seconds) to use to avoid saving
-        too often.
+        too often. Changes made within this time are written together by
+        a background thread. With delay=0 the settings are written
+        immediately.
         '''
 
+        with self._save_lock:
+            self._dirty = True
+            self._changes += 1
+            if delay != 0 and self._save_hid is None:
+                self._save_hid = threading.Timer(delay, self._do_save)
+                self._save_hid.daemon = True
+                self._save_hid.start()
+
         if delay == 0:
-            self._do_save()
-        #elif self._save_hid is None:
-            #self._save_hid = gobject.timeout_add(delay * 1000, self._do_save)
+            self.flush()
+
+    def flush(self):
+        '''
+        Write pending changes to disk now. Registered as an exit handler
+        so no changes are lost when QTLab is closed.
+        '''
+
+        with self._save_lock:
+            if self._save_hid is not None:
+                self._save_hid.cancel()
+        self._do_save()
 
     def _do_save(self):
-        self._save_hid = None
+        with self._write_lock:
+            self._write()
+
+    def _write(self):
+        with self._save_lock:
+            self._save_hid = None
+            if not self._dirty:
+                return
+            changes = self._changes
+            try:
+                data = json.dumps(self._config, indent=4, sort_keys=True)
+            except Exception as e:
+                logging.warning('Unable to save config file: %s', e)
+                return
+
+        # Write to a temporary file and rename it, so the config file
+        # is never left half written.
+        filename = self._get_filename()
+        tmpname = filename + '.tmp'
         try:
-            filename = self._get_filename()
             logging.debug('Saving settings to %s', filename)
-            #f = file(filename, 'w+')
-            f = open(filename)
-            json.dump(self._config, f, indent=4, sort_keys=True)
+            f = open(tmpname, 'w')
+            f.write(data)
             f.close()
+            os.replace(tmpname, filename)
         except Exception as e:
-            logging.warning('Unable to save config file')
+            logging.warning('Unable to save config file: %s', e)
+            return
+
+        # Still dirty if something changed while writing, or on failure
+        with self._save_lock:
+            if self._changes == changes:
+                self._dirty = False
 
     def __getitem__(self, key):
         return self.get(key)
@@ -169,17 +219,19 @@ class Config:
             None
         '''
 
-        if key in self._config:
-            return self._config[key]
-        elif default is not None:
-            self._config[key] = default
-            return default
-        elif key in self._defaults:
-            val = self._defaults[key]
-            self._config[key] = val
-            return val
-        else:
-            return None
+        # A background save may be serializing _config
+        with self._save_lock:
+            if key in self._config:
+                return self._config[key]
+            elif default is not None:
+                self._config[key] = default
+                return default
+            elif key in self._defaults:
+                val = self._defaults[key]
+                self._config[key] = val
+                return val
+            else:
+                return None
 
     def set(self, key, val, save=True):
         '''
@@ -193,7 +245,15 @@ class Config:
             None
         '''
 
-        self._config[key] = val
+        with self._save_lock:
+            # The same object may have been changed in place, so only an
+            # equal copy counts as unchanged.
+            old = self._config.get(key)
+            if key in self._config and old is not val and old == val:
+                return
+            self._config[key] = val
+            self._dirty = True
+            self._changes += 1
         if save:
             self.save()
 
@@ -16,12 +16,37 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import ctypes
-import types
 import numpy
 import logging
+import threading
 import time
 
-nidaq = ctypes.windll.nicaiu
+try:
+    nidaq = ctypes.windll.nicaiu
+except (AttributeError, OSError):
+    logging.warning('NI DAQmx library not available, only simulation possible')
+    nidaq = None
+_have_dll = nidaq is not None
+
+def use_mock(mock=None):
+    '''
+    Replace the DAQmx library by a simulation, see nidaq_mock.MockDAQmx.
+    The library is shared by all devices in this process, so this is
+    refused when the real DAQmx library is loaded. Without 'mock' an
+    existing simulation is kept, so several simulated devices share it.
+    Returns the mock library.
+    '''
+    global nidaq
+    if _have_dll:
+        raise ValueError('NI DAQmx library loaded, cannot simulate')
+    if mock is None:
+        if nidaq is not None:
+            return nidaq
+        from lib.dll_support.nidaq_mock import MockDAQmx
+        mock = MockDAQmx()
+    get_task_pool().clear()
+    nidaq = mock
+    return mock
 
 int32 = ctypes.c_long
 uInt32 = ctypes.c_ulong
@@ -47,6 +72,7 @@ _config_map = {
 DAQmx_Val_Volts             = 10348
 DAQmx_Val_Rising            = 10280
 DAQmx_Val_FiniteSamps       = 10178
+DAQmx_Val_ContSamps         = 10123
 DAQmx_Val_GroupByChannel    = 0
 DAQmx_Val_GroupByScanNumber = 1
 DAQmx_Val_ChanPerLine       = 0
@@ -61,69 +87,63 @@ def CHK(err):
 
     if err < 0:
         buf_size = 100
-        buf = ctypes.create_string_buffer('\000' * buf_size)
+        buf = ctypes.create_string_buffer(buf_size)
         nidaq.DAQmxGetErrorString(err, ctypes.byref(buf), buf_size)
         raise RuntimeError('Nidaq call failed with error %d: %s' % \
-            (err, repr(buf.value)))
+            (err, repr(buf.value.decode('latin-1'))))
 
-def buf_to_list(buf):
-    name = ''
-    namelist = []
-    for ch in buf:
-        if ch in '\000 \t\n':
-            name = name.rstrip(',')
-            if len(name) > 0:
-                namelist.append(name)
-                name = ''
-            if ch == '\000':
-                break
-        else:
-            name += ch
+def _cstr(s):
+    '''Return string 's' as bytes, DAQmx takes char * arguments.'''
+    if isinstance(s, str):
+        return s.encode('ascii')
+    return s
 
-    return namelist
+def buf_to_list(buf):
+    '''Return the names in a comma or space separated string buffer.'''
+    return buf.value.decode('ascii').replace(',', ' ').split()
 
 def get_device_names():
     '''Return a list of available NIDAQ devices.'''
 
     bufsize = 1024
-    buf = ctypes.create_string_buffer('\000' * bufsize)
+    buf = ctypes.create_string_buffer(bufsize)
     nidaq.DAQmxGetSysDevNames(ctypes.byref(buf), bufsize)
     return buf_to_list(buf)
 
 def reset_device(dev):
     '''Reset device "dev"'''
-    nidaq.DAQmxResetDevice(dev)
+    nidaq.DAQmxResetDevice(_cstr(dev))
 
 def get_physical_input_channels(dev):
     '''Return a list of physical input channels on a device.'''
 
     bufsize = 1024
-    buf = ctypes.create_string_buffer('\000' * bufsize)
-    nidaq.DAQmxGetDevAIPhysicalChans(dev, ctypes.byref(buf), bufsize)
+    buf = ctypes.create_string_buffer(bufsize)
+    nidaq.DAQmxGetDevAIPhysicalChans(_cstr(dev), ctypes.byref(buf), bufsize)
     return buf_to_list(buf)
 
 def get_physical_output_channels(dev):
     '''Return a list of physical output channels on a device.'''
 
     bufsize = 1024
-    buf = ctypes.create_string_buffer('\000' * bufsize)
-    nidaq.DAQmxGetDevAOPhysicalChans(dev, ctypes.byref(buf), bufsize)
+    buf = ctypes.create_string_buffer(bufsize)
+    nidaq.DAQmxGetDevAOPhysicalChans(_cstr(dev), ctypes.byref(buf), bufsize)
     return buf_to_list(buf)
 
 def get_digital_output_channels(dev):
     '''Return a list of physical output channels on a device.'''
 
     bufsize = 1024
-    buf = ctypes.create_string_buffer('\000' * bufsize)
-    nidaq.DAQmxGetDevDOLines(dev, ctypes.byref(buf), bufsize)
+    buf = ctypes.create_string_buffer(bufsize)
+    nidaq.DAQmxGetDevDOLines(_cstr(dev), ctypes.byref(buf), bufsize)
     return buf_to_list(buf)
 
 def get_physical_counter_channels(dev):
     '''Return a list of physical counter channels on a device.'''
 
     bufsize = 1024
-    buf = ctypes.create_string_buffer('\000' * bufsize)
-    nidaq.DAQmxGetDevCIPhysicalChans(dev, ctypes.byref(buf), bufsize)
+    buf = ctypes.create_string_buffer(bufsize)
+    nidaq.DAQmxGetDevCIPhysicalChans(_cstr(dev), ctypes.byref(buf), bufsize)
     return buf_to_list(buf)
 
 def read(devchan, samples=1, freq=10000.0, minv=-10.0, maxv=10.0,
@@ -145,12 +165,11 @@ def read(devchan, samples=1, freq=10000.0, minv=-10.0, maxv=10.0,
         A numpy.array with the data on success, None on error
     '''
 
-    if type(config) is types.StringType:
-        if config in _config_map:
-            config = _config_map[config]
-        else:
-            return None
-    if type(config) is not types.IntType:
+    get_task_pool().release(_get_device(devchan))
+
+    try:
+        config = _get_config(config)
+    except (ValueError, TypeError):
         return None
 
     if samples == 1:
@@ -164,14 +183,14 @@ def read(devchan, samples=1, freq=10000.0, minv=-10.0, maxv=10.0,
     taskHandle = TaskHandle(0)
     read = int32()
     try:
-        CHK(nidaq.DAQmxCreateTask("", ctypes.byref(taskHandle)))
-        CHK(nidaq.DAQmxCreateAIVoltageChan(taskHandle, devchan, "",
+        CHK(nidaq.DAQmxCreateTask(b"", ctypes.byref(taskHandle)))
+        CHK(nidaq.DAQmxCreateAIVoltageChan(taskHandle, _cstr(devchan), b"",
             config,
             float64(minv), float64(maxv),
             DAQmx_Val_Volts, None))
 
         if retsamples > 1:
-            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, "", float64(freq),
+            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, b"", float64(freq),
                 DAQmx_Val_Rising, DAQmx_Val_FiniteSamps,
                 uInt64(samples)));
             CHK(nidaq.DAQmxStartTask(taskHandle))
@@ -183,14 +202,14 @@ def read(devchan, samples=1, freq=10000.0, minv=-10.0, maxv=10.0,
                 data.ctypes.data, None))
             read = int32(1)
 
-    except Exception, e:
+    except Exception as e:
         logging.error('NI DAQ call failed: %s', str(e))
     finally:
         if taskHandle.value != 0:
             nidaq.DAQmxStopTask(taskHandle)
             nidaq.DAQmxClearTask(taskHandle)
 
-    if read > 0:
+    if read.value > 0:
         if retsamples == 1:
             return data[0]
         else:
@@ -214,7 +233,9 @@ def write(devchan, data, freq=10000.0, minv=-10.0, maxv=10.0,
         Number of values written
     '''
 
-    if type(data) in (types.IntType, types.FloatType):
+    get_task_pool().release(_get_device(devchan))
+
+    if isinstance(data, (int, float)):
         data = numpy.array([data], dtype=numpy.float64)
     elif isinstance(data, numpy.ndarray):
         if data.dtype is not numpy.float64:
@@ -226,8 +247,8 @@ def write(devchan, data, freq=10000.0, minv=-10.0, maxv=10.0,
     taskHandle = TaskHandle(0)
     written = int32()
     try:
-        CHK(nidaq.DAQmxCreateTask("", ctypes.byref(taskHandle)))
-        CHK(nidaq.DAQmxCreateAOVoltageChan(taskHandle, devchan, "",
+        CHK(nidaq.DAQmxCreateTask(b"", ctypes.byref(taskHandle)))
+        CHK(nidaq.DAQmxCreateAOVoltageChan(taskHandle, _cstr(devchan), b"",
             float64(minv), float64(maxv), DAQmx_Val_Volts, None))
 
         if len(data) == 1:
@@ -235,13 +256,13 @@ def write(devchan, data, freq=10000.0, minv=-10.0, maxv=10.0,
                 float64(data[0]), None))
             written = int32(1)
         else:
-            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, "", float64(freq),
+            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, b"", float64(freq),
                 DAQmx_Val_Rising, DAQmx_Val_FiniteSamps, uInt64(samples)))
             CHK(nidaq.DAQmxWriteAnalogF64(taskHandle, samples, 0, float64(timeout),
                 DAQmx_Val_GroupByChannel, data.ctypes.data,
                 ctypes.byref(written), None))
             CHK(nidaq.DAQmxStartTask(taskHandle))
-    except Exception, e:
+    except Exception as e:
         logging.error('NI DAQ call failed (correct channel configuration selected?): %s', str(e))
     finally:
         if taskHandle.value != 0:
@@ -256,25 +277,28 @@ def read_counter(devchan="/Dev1/ctr0", samples=1, freq=1.0, timeout=1.0, src="")
     Specify source pin with 'src'.
     '''
 
+    get_task_pool().release(_get_device(devchan))
+
     taskHandle = TaskHandle(0)
     try:
-        CHK(nidaq.DAQmxCreateTask("", ctypes.byref(taskHandle)))
+        CHK(nidaq.DAQmxCreateTask(b"", ctypes.byref(taskHandle)))
         initial_count = int32(0)
-        CHK(nidaq.DAQmxCreateCICountEdgesChan(taskHandle, devchan, "",
+        CHK(nidaq.DAQmxCreateCICountEdgesChan(taskHandle, _cstr(devchan), b"",
                 DAQmx_Val_Rising, initial_count, DAQmx_Val_CountUp))
         if src is not None and src != "":
-            CHK(nidaq.DAQmxSetCICountEdgesTerm(taskHandle, devchan, src))
+            CHK(nidaq.DAQmxSetCICountEdgesTerm(taskHandle, _cstr(devchan),
+                _cstr(src)))
 
         nread = int32()
         data = numpy.zeros(samples, dtype=numpy.float64)
         if samples > 1:
-            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, "", float64(freq),
+            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, b"", float64(freq),
                 DAQmx_Val_Rising, DAQmx_Val_FiniteSamps,
                 uInt64(samples)));
             CHK(nidaq.DAQmxStartTask(taskHandle))
             CHK(nidaq.DAQmxReadAnalogF64(taskHandle, int32(samples), float64(timeout),
                DAQmx_Val_GroupByChannel, data.ctypes.data,
-               samples, ctypes.byref(read), None))
+               samples, ctypes.byref(nread), None))
         else:
             CHK(nidaq.DAQmxStartTask(taskHandle))
             time.sleep(1.0 / freq)
@@ -283,7 +307,7 @@ def read_counter(devchan="/Dev1/ctr0", samples=1, freq=1.0, timeout=1.0, src="")
                 data.ctypes.data, int32(samples), ctypes.byref(nread), None))
             nread = int32(1)
 
-    except Exception, e:
+    except Exception as e:
         logging.error('NI DAQ call failed: %s', str(e))
 
     finally:
@@ -300,19 +324,20 @@ def create_counter_task(devchan, samples=1, freq=1, timeout=1, src=""):
     taskHandle = TaskHandle(0)
 
     try:
-        CHK(nidaq.DAQmxCreateTask("", ctypes.byref(taskHandle)))
+        CHK(nidaq.DAQmxCreateTask(b"", ctypes.byref(taskHandle)))
         initial_count = int32(0)
-        CHK(nidaq.DAQmxCreateCICountEdgesChan(taskHandle, devchan, "",
+        CHK(nidaq.DAQmxCreateCICountEdgesChan(taskHandle, _cstr(devchan), b"",
                 DAQmx_Val_Rising, initial_count, DAQmx_Val_CountUp))
         if src is not None and src != "":
-            CHK(nidaq.DAQmxSetCICountEdgesTerm(taskHandle, devchan, src))
+            CHK(nidaq.DAQmxSetCICountEdgesTerm(taskHandle, _cstr(devchan),
+                _cstr(src)))
 
         if samples > 1:
-            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, "", float64(freq),
+            CHK(nidaq.DAQmxCfgSampClkTiming(taskHandle, b"", float64(freq),
                 DAQmx_Val_Rising, DAQmx_Val_FiniteSamps,
                 uInt64(samples)));
 
-    except Exception, e:
+    except Exception as e:
         logging.error('NI DAQ call failed: %s', str(e))
         if taskHandle.value != 0:
             nidaq.DAQmxStopTask(taskHandle)
@@ -324,6 +349,8 @@ def read_counters(devchans=["/Dev1/ctr0","/Dev1/ctr1"], samples=1, freq=1.0, tim
     tasks = []
     devsrc = None
     ret = []
+    for dev in devchans:
+        get_task_pool().release(_get_device(dev))
     for i, dev in enumerate(devchans):
         if src is not None:
             devsrc = src[i]
@@ -337,12 +364,13 @@ def read_counters(devchans=["/Dev1/ctr0","/Dev1/ctr1"], samples=1, freq=1.0, tim
 
         time.sleep(float(samples) / freq)
 
+        nread = int32()
         for task in tasks:
             data = numpy.zeros(samples, dtype=numpy.float64)
             if samples > 1:
                 CHK(nidaq.DAQmxReadAnalogF64(task, int32(samples), float64(timeout),
                         DAQmx_Val_GroupByChannel, data.ctypes.data,
-                        samples, ctypes.byref(read), None))
+                        samples, ctypes.byref(nread), None))
                 ret.append(data)
             else:
                 nread = int32(0)
@@ -351,7 +379,7 @@ def read_counters(devchans=["/Dev1/ctr0","/Dev1/ctr1"], samples=1, freq=1.0, tim
                 nread = int32(1)
                 ret.append(data[0])
 
-    except Exception, e:
+    except Exception as e:
         logging.error('NI DAQ call failed: %s', str(e))
 
     finally:
@@ -370,8 +398,9 @@ def write_dig_port8(channel, val, timeout=1.0):
 
     taskHandle = TaskHandle(0)
     try:
-        CHK(nidaq.DAQmxCreateTask("", ctypes.byref(taskHandle)))
-        CHK(nidaq.DAQmxCreateDOChan(taskHandle, channel, '', DAQmx_Val_ChanForAllLines))
+        CHK(nidaq.DAQmxCreateTask(b"", ctypes.byref(taskHandle)))
+        CHK(nidaq.DAQmxCreateDOChan(taskHandle, _cstr(channel), b"",
+            DAQmx_Val_ChanForAllLines))
 
         nwritten = int32(0)
 
@@ -388,10 +417,410 @@ def write_dig_port8(channel, val, timeout=1.0):
 
         CHK(nidaq.DAQmxStartTask(taskHandle))
 
-    except Exception, e:
+    except Exception as e:
         logging.error('NI DAQ call failed: %s', str(e))
 
     finally:
         if taskHandle.value != 0:
             nidaq.DAQmxStopTask(taskHandle)
             nidaq.DAQmxClearTask(taskHandle)
+
+def _get_config(config):
+    '''Return the DAQmx value for a channel configuration name or value.'''
+    if isinstance(config, str):
+        if config.upper() not in _config_map:
+            raise ValueError('Unknown channel configuration %s' % config)
+        config = _config_map[config.upper()]
+    if isinstance(config, int32):
+        return config.value
+    return int(config)
+
+def _get_device(devchan):
+    '''Return the device name of a channel specifier such as /Dev1/ai0.'''
+    return devchan.strip('/').split('/')[0]
+
+def _create_task():
+    taskHandle = TaskHandle(0)
+    CHK(nidaq.DAQmxCreateTask(b"", ctypes.byref(taskHandle)))
+    return taskHandle
+
+def _clear_task(taskHandle):
+    if taskHandle is not None and taskHandle.value != 0:
+        nidaq.DAQmxStopTask(taskHandle)
+        nidaq.DAQmxClearTask(taskHandle)
+
+class TaskPool():
+    '''
+    Keeps the DAQmx tasks for single point reads and writes configured and
+    running between calls, so that a read costs a single DAQmx call instead
+    of creating, configuring, starting and clearing a task.
+
+    A device gets one analog input task holding all AI channels read so
+    far, because DAQmx allows only one running AI task per device. It is
+    recreated when a channel is added or its configuration changes.
+    Analog outputs and counters get a task per channel.
+
+    Hardware-timed operations need the device for themselves; they call
+    release(dev) before starting.
+    '''
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._ai = {}
+        self._ao = {}
+        self._ctr = {}
+
+    def _release(self, tasks, dev):
+        for key in list(tasks.keys()):
+            if dev is None or _get_device(key) == dev:
+                _clear_task(tasks.pop(key)[0])
+
+    def release(self, dev=None):
+        '''Stop and clear the tasks of device 'dev', or of all devices.'''
+        with self._lock:
+            for tasks in (self._ai, self._ao, self._ctr):
+                self._release(tasks, dev)
+
+    def clear(self):
+        self.release()
+
+    def read_ai(self, devchan, config=DAQmx_Val_Cfg_Default, minv=-10.0,
+            maxv=10.0, timeout=10.0):
+        '''
+        Read a single sample from an analog input.
+
+        Input:
+            devchan (string): device/channel specifier, such as Dev1/ai0
+            config (string or int): the configuration of the channel
+            minv (float): the minimum voltage
+            maxv (float): the maximum voltage
+            timeout (float): the time in seconds to wait for the sample
+
+        Output:
+            The voltage
+        '''
+
+        spec = (devchan, _get_config(config), minv, maxv)
+        dev = _get_device(devchan)
+        with self._lock:
+            taskHandle, specs = self._ai.get(dev, (None, []))
+            if spec not in specs:
+                specs = [s for s in specs if s[0] != devchan] + [spec]
+                self._release(self._ai, dev)
+                taskHandle = _create_task()
+                try:
+                    for chan, cfg, lo, hi in specs:
+                        CHK(nidaq.DAQmxCreateAIVoltageChan(taskHandle, _cstr(chan),
+                            b"", cfg, float64(lo), float64(hi),
+                            DAQmx_Val_Volts, None))
+                    CHK(nidaq.DAQmxStartTask(taskHandle))
+                except:
+                    _clear_task(taskHandle)
+                    raise
+                self._ai[dev] = (taskHandle, specs)
+
+            # One sample of every channel in the task
+            data = numpy.zeros(len(specs), dtype=numpy.float64)
+            read = int32()
+            CHK(nidaq.DAQmxReadAnalogF64(taskHandle, 1, float64(timeout),
+                DAQmx_Val_GroupByScanNumber, data.ctypes.data,
+                len(specs), ctypes.byref(read), None))
+            return data[specs.index(spec)]
+
+    def write_ao(self, devchan, val, minv=-10.0, maxv=10.0, timeout=10.0):
+        '''
+        Set an analog output to value 'val'. Returns the number of values
+        written.
+        '''
+
+        with self._lock:
+            taskHandle, spec = self._ao.get(devchan, (None, None))
+            if taskHandle is None or spec != (minv, maxv):
+                if taskHandle is not None:
+                    _clear_task(self._ao.pop(devchan)[0])
+                taskHandle = _create_task()
+                try:
+                    CHK(nidaq.DAQmxCreateAOVoltageChan(taskHandle,
+                        _cstr(devchan), b"", float64(minv), float64(maxv),
+                        DAQmx_Val_Volts, None))
+                    CHK(nidaq.DAQmxStartTask(taskHandle))
+                except:
+                    _clear_task(taskHandle)
+                    raise
+                self._ao[devchan] = (taskHandle, (minv, maxv))
+
+            CHK(nidaq.DAQmxWriteAnalogScalarF64(taskHandle, 1,
+                float64(timeout), float64(val), None))
+            return 1
+
+    def read_counter(self, devchan, src="", count_time=1.0, timeout=1.0):
+        '''
+        Count the edges on counter 'devchan' during 'count_time' seconds.
+        Specify source pin with 'src'. The counter keeps running between
+        calls, the count is the difference of two readings.
+        '''
+
+        with self._lock:
+            taskHandle, spec = self._ctr.get(devchan, (None, None))
+            if taskHandle is None or spec != src:
+                if taskHandle is not None:
+                    _clear_task(self._ctr.pop(devchan)[0])
+                taskHandle = _create_task()
+                try:
+                    CHK(nidaq.DAQmxCreateCICountEdgesChan(taskHandle,
+                        _cstr(devchan), b"", DAQmx_Val_Rising, int32(0), DAQmx_Val_CountUp))
+                    if src is not None and src != "":
+                        CHK(nidaq.DAQmxSetCICountEdgesTerm(taskHandle,
+                            _cstr(devchan), _cstr(src)))
+                    CHK(nidaq.DAQmxStartTask(taskHandle))
+                except:
+                    _clear_task(taskHandle)
+                    raise
+                self._ctr[devchan] = (taskHandle, src)
+
+            start = uInt32()
+            stop = uInt32()
+            CHK(nidaq.DAQmxReadCounterScalarU32(taskHandle, float64(timeout),
+                ctypes.byref(start), None))
+            time.sleep(count_time)
+            CHK(nidaq.DAQmxReadCounterScalarU32(taskHandle, float64(timeout),
+                ctypes.byref(stop), None))
+            return (stop.value - start.value) % (1 << 32)
+
+try:
+    _task_pool
+except NameError:
+    _task_pool = TaskPool()
+
+def get_task_pool():
+    global _task_pool
+    return _task_pool
+
+class ContinuousAcquisition():
+    '''
+    Continuous, hardware-timed acquisition of one or more analog inputs.
+
+    DAQmx transfers the samples into its own buffer of 'nblocks' blocks.
+    A reader thread copies one block at a time from there straight into
+    a ring buffer, so the device can fill the next block while the
+    previous one is handed over. The last samples, or all new samples
+    since a previous read, can be taken from the ring buffer.
+    '''
+
+    def __init__(self, devchans, freq, config=DAQmx_Val_Cfg_Default,
+            minv=-10.0, maxv=10.0, bufsize=1<<20, blocksize=None, nblocks=4):
+        '''
+        Input:
+            devchans (list of strings): channels, such as Dev1/ai0
+            freq (float): the sampling frequency
+            config (string or int): the configuration of the channels
+            minv (float): the minimum voltage
+            maxv (float): the maximum voltage
+            bufsize (int): ring buffer size in samples per channel
+            blocksize (int): samples per channel per read, default 0.1 s
+            nblocks (int): size of the DAQmx buffer in blocks
+        '''
+
+        if isinstance(devchans, str):
+            devchans = [devchans]
+        self._devchans = list(devchans)
+        self._freq = freq
+        self._config = _get_config(config)
+        self._minv = minv
+        self._maxv = maxv
+        if blocksize is None:
+            blocksize = max(1, int(freq / 10))
+        self._blocksize = blocksize
+        self._nblocks = nblocks
+
+        # Whole blocks, so that a block never wraps around
+        nch = len(self._devchans)
+        self._capacity = max(2, -(-bufsize // blocksize)) * blocksize
+        self._buf = numpy.zeros((self._capacity, nch), dtype=numpy.float64)
+        self._total = 0
+        self._cond = threading.Condition()
+        self._taskHandle = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._error = None
+
+    def start(self):
+        '''Configure the task and start acquiring.'''
+
+        if self._thread is not None:
+            return
+        get_task_pool().release(_get_device(self._devchans[0]))
+        self._taskHandle = _create_task()
+        try:
+            for devchan in self._devchans:
+                CHK(nidaq.DAQmxCreateAIVoltageChan(self._taskHandle,
+                    _cstr(devchan), b"", self._config, float64(self._minv),
+                    float64(self._maxv), DAQmx_Val_Volts, None))
+            CHK(nidaq.DAQmxCfgSampClkTiming(self._taskHandle, b"",
+                float64(self._freq), DAQmx_Val_Rising, DAQmx_Val_ContSamps,
+                uInt64(self._blocksize * self._nblocks)))
+            CHK(nidaq.DAQmxStartTask(self._taskHandle))
+        except:
+            _clear_task(self._taskHandle)
+            self._taskHandle = None
+            raise
+
+        self._total = 0
+        self._error = None
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run,
+                name='NIDAQAcquisition')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        nch = len(self._devchans)
+        read = int32()
+        timeout = 1.0 + 2.0 * self._blocksize / self._freq
+        try:
+            while not self._stop.is_set():
+                pos = self._total % self._capacity
+                block = self._buf[pos:pos+self._blocksize]
+                CHK(nidaq.DAQmxReadAnalogF64(self._taskHandle,
+                    self._blocksize, float64(timeout),
+                    DAQmx_Val_GroupByScanNumber, block.ctypes.data,
+                    block.size, ctypes.byref(read), None))
+                with self._cond:
+                    self._total += read.value
+                    self._cond.notify_all()
+        except Exception as e:
+            if not self._stop.is_set():
+                logging.error('NI DAQ acquisition failed: %s', str(e))
+                self._error = e
+        finally:
+            with self._cond:
+                self._cond.notify_all()
+
+    def stop(self):
+        '''Stop acquiring and clear the task.'''
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        _clear_task(self._taskHandle)
+        self._taskHandle = None
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_error(self):
+        '''Return the exception that stopped the reader thread, if any.'''
+        return self._error
+
+    def _get_range(self, start, stop):
+        idx = numpy.arange(start, stop) % self._capacity
+        return self._buf[idx]
+
+    def _get_oldest(self):
+        # The block after the newest one may be being filled by DAQmx
+        return max(0, self._total - self._capacity + self._blocksize)
+
+    def get_last(self, n):
+        '''
+        Return the last n samples as an array of shape (n, nchannels),
+        fewer if not available.
+        '''
+        with self._cond:
+            start = max(self._total - n, self._get_oldest())
+            return self._get_range(start, self._total)
+
+    def read_new(self, cursor=0, timeout=None):
+        '''
+        Return the samples acquired since 'cursor', waiting at most
+        'timeout' seconds for new samples.
+
+        Input:
+            cursor (int): sample count returned by the previous call
+            timeout (float): time to wait for new data
+
+        Output:
+            (samples, cursor, skipped): array of shape (n, nchannels),
+            the cursor for the next call and the number of samples that
+            were overwritten before they could be read
+        '''
+        with self._cond:
+            if self._total <= cursor and timeout and self.is_running():
+                self._cond.wait(timeout)
+            total = self._total
+            start = max(cursor, self._get_oldest())
+            return self._get_range(start, total), total, start - cursor
+
+    def get_total(self):
+        '''Return the number of samples per channel acquired.'''
+        return self._total
+
+def sweep(ao_devchan, values, ai_devchans, freq=1000.0,
+        config=DAQmx_Val_Cfg_Default, minv=-10.0, maxv=10.0, timeout=None):
+    '''
+    Write 'values' to an analog output and read analog inputs at every
+    point, as one hardware-timed operation. The inputs are sampled on the
+    output sample clock, one clock period after each value was set.
+
+    Input:
+        ao_devchan (string): output channel, such as Dev1/ao0
+        values (numpy.array): the output values
+        ai_devchans (string or list): input channels on the same device
+        freq (float): the point rate
+        config (string or int): the configuration of the input channels
+        minv (float): the minimum voltage
+        maxv (float): the maximum voltage
+        timeout (float): time to wait for completion, default the sweep
+            duration plus 10 seconds
+
+    Output:
+        numpy.array of shape (len(values), len(ai_devchans))
+    '''
+
+    if isinstance(ai_devchans, str):
+        ai_devchans = [ai_devchans]
+    values = numpy.array(values, dtype=numpy.float64)
+    # The last value is repeated to clock in the sample after it
+    npoints = len(values) + 1
+    out = numpy.append(values, values[-1])
+    data = numpy.zeros((npoints, len(ai_devchans)), dtype=numpy.float64)
+    if timeout is None:
+        timeout = npoints / freq + 10.0
+    dev = _get_device(ao_devchan)
+    config = _get_config(config)
+
+    get_task_pool().release(dev)
+    aoTask = None
+    aiTask = None
+    written = int32()
+    read = int32()
+    try:
+        aoTask = _create_task()
+        CHK(nidaq.DAQmxCreateAOVoltageChan(aoTask, _cstr(ao_devchan), b"",
+            float64(minv), float64(maxv), DAQmx_Val_Volts, None))
+        CHK(nidaq.DAQmxCfgSampClkTiming(aoTask, b"", float64(freq),
+            DAQmx_Val_Rising, DAQmx_Val_FiniteSamps, uInt64(npoints)))
+        CHK(nidaq.DAQmxWriteAnalogF64(aoTask, npoints, 0, float64(timeout),
+            DAQmx_Val_GroupByChannel, out.ctypes.data,
+            ctypes.byref(written), None))
+
+        aiTask = _create_task()
+        for devchan in ai_devchans:
+            CHK(nidaq.DAQmxCreateAIVoltageChan(aiTask, _cstr(devchan), b"",
+                config, float64(minv), float64(maxv), DAQmx_Val_Volts, None))
+        CHK(nidaq.DAQmxCfgSampClkTiming(aiTask, _cstr('/%s/ao/SampleClock' % dev),
+            float64(freq), DAQmx_Val_Rising, DAQmx_Val_FiniteSamps,
+            uInt64(npoints)))
+
+        # The input waits for the output clock, so it is started first
+        CHK(nidaq.DAQmxStartTask(aiTask))
+        CHK(nidaq.DAQmxStartTask(aoTask))
+        CHK(nidaq.DAQmxReadAnalogF64(aiTask, npoints, float64(timeout),
+            DAQmx_Val_GroupByScanNumber, data.ctypes.data, data.size,
+            ctypes.byref(read), None))
+        CHK(nidaq.DAQmxWaitUntilTaskDone(aoTask, float64(timeout)))
+    finally:
+        _clear_task(aiTask)
+        _clear_task(aoTask)
+
+    return data[1:read.value]
@@ -0,0 +1,454 @@
+# nidaq_mock.py, simulated NIDAQ DLL for testing without hardware
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import ctypes
+import math
+import time
+
+import numpy
+
+ERR_INVALID_TASK = -200088
+ERR_RESOURCE_RESERVED = -50103
+ERR_TIMEOUT = -200284
+ERR_OVERWRITTEN = -200279
+ERR_INVALID_CHANNEL = -200170
+
+_errors = {
+    ERR_INVALID_TASK: 'Task specified is invalid or does not exist.',
+    ERR_RESOURCE_RESERVED: 'The specified resource is reserved.',
+    ERR_TIMEOUT: 'Some or all of the samples requested have not yet been '
+        'acquired.',
+    ERR_OVERWRITTEN: 'The application is not able to keep up with the '
+        'hardware acquisition.',
+    ERR_INVALID_CHANNEL: 'Physical channel specified does not exist.',
+}
+
+def _val(arg):
+    '''Return the python value of a ctypes argument.'''
+    if hasattr(arg, 'value'):
+        return arg.value
+    return arg
+
+def _str(arg):
+    arg = _val(arg)
+    if isinstance(arg, bytes) and not isinstance(arg, str):
+        arg = arg.decode('ascii')
+    return arg
+
+def _ref(arg):
+    '''Return the object passed with ctypes.byref.'''
+    return arg._obj
+
+def _array(address, n):
+    return numpy.ctypeslib.as_array((ctypes.c_double * n).from_address(address))
+
+class _Task():
+
+    def __init__(self):
+        self.kind = None
+        self.chans = []
+        self.clock = None
+        self.rate = 0
+        self.mode = None
+        self.nsamples = 0
+        self.running = False
+        self.t_start = None
+        self.nread = 0
+        self.waveform = None
+
+class MockDAQmx():
+    '''
+    Simulates the DAQmx functions used by nidaq.py on a single device with
+    8 analog inputs, 2 analog outputs and 2 counters.
+
+    Analog outputs ao0 and ao1 are looped back to inputs ai0 and ai1, the
+    other inputs see a 10 Hz sine. Counters count at 'count_rate' Hz.
+    Hardware-timed tasks produce samples in real time. Only one analog
+    input task and one hardware-timed analog output task can run at a
+    time on the device, as on real hardware.
+
+    'start_delay' emulates the time to reserve and start a task. The
+    number of calls per function is kept in 'calls'.
+    '''
+
+    def __init__(self, dev='Dev1', start_delay=0.0, count_rate=1000.0,
+            noise=0.0, seed=None):
+        self.dev = dev
+        self.start_delay = start_delay
+        self.count_rate = count_rate
+        self.noise = noise
+        self.calls = {}
+        self._rng = numpy.random.RandomState(seed)
+        self._tasks = {}
+        self._next = 1
+        self._ao = [0.0, 0.0]
+
+    def __getattr__(self, name):
+        if not name.startswith('DAQmx'):
+            raise AttributeError(name)
+        func = getattr(self, '_' + name[5:])
+        def call(*args):
+            self.calls[name] = self.calls.get(name, 0) + 1
+            return func(*args)
+        return call
+
+    def reset_calls(self):
+        self.calls = {}
+
+    def get_ncalls(self):
+        return sum(self.calls.values())
+
+    # Signals
+
+    def _chan_index(self, devchan, kind):
+        dev, chan = devchan.strip('/').split('/')
+        n = {'ai': 8, 'ao': 2, 'ctr': 2}[kind]
+        if dev != self.dev or not chan.startswith(kind) or \
+                not chan[len(kind):].isdigit() or int(chan[len(kind):]) >= n:
+            return None
+        return int(chan[len(kind):])
+
+    def _ai_value(self, chan, t):
+        if chan < len(self._ao):
+            v = self._ao[chan]
+        else:
+            v = math.sin(2 * math.pi * 10 * t + chan)
+        if self.noise:
+            v += self.noise * self._rng.randn()
+        return v
+
+    def _ai_samples(self, task, start, n):
+        '''Samples start to start+n of a hardware-timed input task.'''
+        idx = numpy.arange(start, start + n)
+        t = task.t_start + idx / float(task.rate)
+        data = numpy.zeros((n, len(task.chans)))
+        src = self._clock_source(task)
+        for j, chan in enumerate(task.chans):
+            if src is not None and chan in src.chans:
+                # Sampled at the output update: sees the previous value
+                wf = src.waveform.reshape(len(src.chans), -1)
+                wf = wf[src.chans.index(chan)]
+                wf = numpy.concatenate(([src.prev[chan]], wf))
+                data[:,j] = wf[numpy.minimum(idx, len(wf) - 1)]
+            elif chan < 2:
+                data[:,j] = self._ao[chan]
+            else:
+                data[:,j] = numpy.sin(2 * numpy.pi * 10 * t + chan)
+        if self.noise:
+            data += self.noise * self._rng.randn(*data.shape)
+        return data
+
+    def _clock_source(self, task):
+        if task.clock is None or not task.clock.endswith('ao/SampleClock'):
+            return None
+        for other in self._tasks.values():
+            if other.kind == 'ao' and other.mode is not None and \
+                    other.running:
+                return other
+        return None
+
+    def _available(self, task):
+        '''Number of samples acquired so far by a hardware-timed task.'''
+        if not task.running:
+            return 0
+        if task.clock is not None and task.clock.endswith('ao/SampleClock'):
+            src = self._clock_source(task)
+            if src is None:
+                return 0
+            t0 = src.t_start
+        else:
+            t0 = task.t_start
+        n = int((time.time() - t0) * task.rate)
+        if task.mode == 10178:
+            n = min(n, task.nsamples)
+        return max(n, 0)
+
+    # Task functions
+
+    def _task(self, handle):
+        return self._tasks.get(_val(handle))
+
+    def _CreateTask(self, name, handle):
+        _ref(handle).value = self._next
+        self._tasks[self._next] = _Task()
+        self._next += 1
+        return 0
+
+    def _add_chan(self, handle, devchan, kind):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        chans = []
+        for spec in _str(devchan).split(','):
+            chan = self._chan_index(spec.strip(), kind)
+            if chan is None:
+                return ERR_INVALID_CHANNEL
+            chans.append(chan)
+        task.kind = kind
+        task.chans += chans
+        return 0
+
+    def _CreateAIVoltageChan(self, handle, devchan, name, config, minv, maxv,
+            units, scale):
+        return self._add_chan(handle, devchan, 'ai')
+
+    def _CreateAOVoltageChan(self, handle, devchan, name, minv, maxv, units,
+            scale):
+        return self._add_chan(handle, devchan, 'ao')
+
+    def _CreateCICountEdgesChan(self, handle, devchan, name, edge, initial,
+            direction):
+        ret = self._add_chan(handle, devchan, 'ctr')
+        if ret == 0:
+            self._task(handle).count0 = _val(initial)
+        return ret
+
+    def _SetCICountEdgesTerm(self, handle, devchan, src):
+        return 0 if self._task(handle) is not None else ERR_INVALID_TASK
+
+    def _CfgSampClkTiming(self, handle, source, rate, edge, mode, nsamples):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        source = _str(source)
+        task.clock = source if source else None
+        task.rate = _val(rate)
+        task.mode = _val(mode)
+        task.nsamples = _val(nsamples)
+        return 0
+
+    def _conflicts(self, task, other):
+        if task.kind != other.kind:
+            return False
+        if task.kind == 'ai':
+            return True
+        if task.kind == 'ao' and (task.mode is not None or
+                other.mode is not None):
+            return True
+        return bool(set(task.chans) & set(other.chans))
+
+    def _StartTask(self, handle):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        if task.running:
+            return 0
+        for other in self._tasks.values():
+            if other is not task and other.running and \
+                    self._conflicts(task, other):
+                return ERR_RESOURCE_RESERVED
+        if self.start_delay:
+            time.sleep(self.start_delay)
+        task.running = True
+        task.t_start = time.time()
+        task.nread = 0
+        if task.kind == 'ao' and task.mode is not None:
+            task.prev = list(self._ao)
+        return 0
+
+    def _finish_ao(self, task):
+        if task.kind == 'ao' and task.mode is not None and task.running and \
+                task.waveform is not None:
+            for chan in task.chans:
+                self._ao[chan] = task.waveform[-1]
+
+    def _StopTask(self, handle):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        if task.kind == 'ao' and task.mode is not None and task.running:
+            if time.time() - task.t_start >= task.nsamples / task.rate:
+                self._finish_ao(task)
+        task.running = False
+        return 0
+
+    def _ClearTask(self, handle):
+        if self._task(handle) is None:
+            return ERR_INVALID_TASK
+        self._StopTask(handle)
+        del self._tasks[_val(handle)]
+        return 0
+
+    def _WaitUntilTaskDone(self, handle, timeout):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        if task.running and task.mode == 10178:
+            dt = task.t_start + task.nsamples / task.rate - time.time()
+            if dt > _val(timeout):
+                time.sleep(_val(timeout))
+                return ERR_TIMEOUT
+            time.sleep(max(dt, 0))
+            self._finish_ao(task)
+        return 0
+
+    # Reading and writing
+
+    def _ReadAnalogScalarF64(self, handle, timeout, value, reserved):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        implicit = not task.running
+        if implicit:
+            ret = self._StartTask(handle)
+            if ret < 0:
+                return ret
+        _array(value, 1)[0] = self._ai_value(task.chans[0], time.time())
+        if implicit:
+            task.running = False
+        return 0
+
+    def _ReadAnalogF64(self, handle, nsamples, timeout, fillmode, data,
+            size, nread, reserved):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        nsamples = _val(nsamples)
+        nch = len(task.chans)
+        implicit = not task.running
+        if implicit:
+            ret = self._StartTask(handle)
+            if ret < 0:
+                return ret
+
+        if task.mode is None:
+            # On demand
+            t = time.time()
+            samples = numpy.array([[self._ai_value(c, t) for c in task.chans]
+                for i in range(nsamples)])
+        else:
+            deadline = time.time() + _val(timeout)
+            while self._available(task) - task.nread < nsamples:
+                if time.time() > deadline:
+                    _ref(nread).value = 0
+                    return ERR_TIMEOUT
+                time.sleep(0.001)
+            if task.mode == 10123 and \
+                    self._available(task) - task.nread > task.nsamples:
+                return ERR_OVERWRITTEN
+            samples = self._ai_samples(task, task.nread, nsamples)
+            task.nread += nsamples
+
+        out = _array(data, nsamples * nch)
+        if _val(fillmode) == 0:
+            out[:] = samples.T.ravel()
+        else:
+            out[:] = samples.ravel()
+        _ref(nread).value = nsamples
+        if implicit:
+            task.running = False
+        return 0
+
+    def _WriteAnalogScalarF64(self, handle, autostart, timeout, value,
+            reserved):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        if not task.running:
+            ret = self._StartTask(handle)
+            if ret < 0:
+                return ret
+            task.running = False
+        for chan in task.chans:
+            self._ao[chan] = _val(value)
+        return 0
+
+    def _WriteAnalogF64(self, handle, nsamples, autostart, timeout, layout,
+            data, nwritten, reserved):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        nsamples = _val(nsamples)
+        task.waveform = _array(data, nsamples * len(task.chans)).copy()
+        _ref(nwritten).value = nsamples
+        if _val(autostart):
+            return self._StartTask(handle)
+        return 0
+
+    def _ReadCounterScalarU32(self, handle, timeout, value, reserved):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        count = 0
+        if task.running:
+            count = int((time.time() - task.t_start) * self.count_rate)
+        _ref(value).value = (task.count0 + count) % (1 << 32)
+        return 0
+
+    def _ReadCounterF64(self, handle, nsamples, timeout, data, size, nread,
+            reserved):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        count = 0
+        if task.running:
+            count = (time.time() - task.t_start) * self.count_rate
+        _array(data, 1)[0] = int(count)
+        return 0
+
+    # Digital output
+
+    def _CreateDOChan(self, handle, lines, name, grouping):
+        task = self._task(handle)
+        if task is None:
+            return ERR_INVALID_TASK
+        task.kind = 'do'
+        return 0
+
+    def _GetWriteDigitalLinesBytesPerChan(self, handle, nbytes):
+        _ref(nbytes).value = 1
+        return 0
+
+    def _WriteDigitalLines(self, handle, nsamples, autostart, timeout,
+            layout, data, nwritten, reserved):
+        _ref(nwritten).value = _val(nsamples)
+        return 0
+
+    # Device functions
+
+    def _fill(self, buf, names, size):
+        text = ', '.join(names).encode('ascii')
+        ctypes.memmove(_ref(buf), text + b'\0', min(len(text) + 1, _val(size)))
+        return 0
+
+    def _GetSysDevNames(self, buf, size):
+        return self._fill(buf, [self.dev], size)
+
+    def _GetDevAIPhysicalChans(self, dev, buf, size):
+        return self._fill(buf, ['%s/ai%d' % (self.dev, i) for i in range(8)],
+            size)
+
+    def _GetDevAOPhysicalChans(self, dev, buf, size):
+        return self._fill(buf, ['%s/ao%d' % (self.dev, i) for i in range(2)],
+            size)
+
+    def _GetDevCIPhysicalChans(self, dev, buf, size):
+        return self._fill(buf, ['%s/ctr%d' % (self.dev, i) for i in range(2)],
+            size)
+
+    def _GetDevDOLines(self, dev, buf, size):
+        return self._fill(buf, ['%s/port0/line%d' % (self.dev, i)
+            for i in range(8)], size)
+
+    def _ResetDevice(self, dev):
+        for handle in list(self._tasks.keys()):
+            self._ClearTask(handle)
+        self._ao = [0.0, 0.0]
+        return 0
+
+    def _GetErrorString(self, err, buf, size):
+        msg = _errors.get(_val(err), 'Unknown error')
+        return self._fill(buf, [msg], size)
@@ -18,8 +18,13 @@
 import ctypes
 import numpy as np
 import logging
+import time
 
-phlib = ctypes.windll.phlib
+try:
+    phlib = ctypes.windll.phlib
+except (AttributeError, OSError):
+    logging.warning('Picoharp library not available, only simulation possible')
+    phlib = None
 
 MAXDEVNUM = 8
 
@@ -228,3 +233,169 @@ class PHDevice():
         return ph_check(ret)
 
     # FIXME: routing functions not yet wrapped
+
+class SimulatedPHDevice(PHDevice):
+    '''
+    Simulated Picoharp for testing without hardware. In T2 and T3 mode
+    the FIFO produces records in real time for an emitter excited by the
+    sync pulses: photons arrive on channel 1 (T2) or routing channel 1
+    and 2 (T3) with an exponential delay of 'lifetime' ps after a sync.
+    '''
+
+    def __init__(self, devid=0, mode=MODE_HIST, sync_rate=10000000,
+            count_rate=100000, lifetime=2000, seed=None):
+        self._sync_rate = sync_rate
+        self._count_rate = count_rate
+        self._lifetime = lifetime
+        self._rng = np.random.RandomState(seed)
+        self._range = 0
+        self._divider = 1
+        self._t_start = None
+        self._acq_time = 0
+        PHDevice.__init__(self, devid, mode)
+
+    def open(self):
+        self._serial = 'SIMULATED'
+        self._is_open = True
+        return 0
+
+    def close(self):
+        self._is_open = False
+        return 0
+
+    def initialize(self, mode):
+        self._mode = mode
+        self._t_start = None
+        return 0
+
+    def get_base_resolution(self):
+        return 4
+
+    def get_resolution(self):
+        return 4 << self._range
+
+    def set_range(self, range):
+        self._range = range
+        return 0
+
+    def set_sync_div(self, div):
+        self._divider = div
+        return 0
+
+    def set_offset(self, offset):
+        return 0
+
+    def set_cfd_level(self, chan, val):
+        return 0
+
+    def set_cfd_zero_cross(self, chan, val):
+        return 0
+
+    def get_count_rate(self, chan):
+        if chan == 0:
+            return self._sync_rate
+        return self._count_rate
+
+    def clear_hist_mem(self, block=0):
+        return 0
+
+    def get_block(self, block=0, xdata=True):
+        buf = np.zeros((65536,), dtype=np.int32)
+        if xdata:
+            return np.arange(65536) * self.get_resolution() / 1000, buf
+        return buf
+
+    def start(self, acq_time):
+        self._t_start = time.time()
+        self._acq_time = acq_time / 1000.0
+        self._t_done = 0.0
+        self._syncs = 0
+        self._wraps = 0
+        return 0
+
+    def stop(self):
+        if self._t_start is not None:
+            self._acq_time = min(self._acq_time, time.time() - self._t_start)
+        return 0
+
+    def get_status(self):
+        if self._t_start is None:
+            return 1
+        return int(self._t_done >= self._acq_time)
+
+    def get_flags(self):
+        return 0
+
+    def get_elepased_meas_time(self):
+        if self._t_start is None:
+            return 0
+        return int(self._t_done * 1000)
+
+    def _photons(self, s0, s1):
+        '''
+        Return sorted sync numbers and delays in ps of the photons emitted
+        after sync pulses s0 up to s1.
+        '''
+
+        n = self._rng.poisson(self._count_rate * float(s1 - s0) / self._sync_rate)
+        if s1 <= s0:
+            n = 0
+        syncs = np.sort(self._rng.randint(s0, max(s1, s0 + 1), n))
+        delays = self._rng.exponential(self._lifetime, n).astype(np.int64)
+        return syncs.astype(np.int64), delays
+
+    def _pack(self, key, records, wrap, start):
+        '''
+        Insert overflow records (0xf0000000) before each record for every
+        time the 'key' counter passed a multiple of 'wrap'.
+        '''
+
+        wraps = np.maximum(key // wrap, start)
+        out = np.empty(len(records) + int(wraps[-1]) - start, dtype=np.uint32)
+        out[:] = 0xf0000000
+        out[np.arange(len(records)) + wraps - start] = records
+        return out, int(wraps[-1])
+
+    def tt_read_data(self, count):
+        if self._t_start is None or self._mode not in (MODE_T2, MODE_T3):
+            return np.zeros(0, dtype=np.int32)
+
+        t0 = self._t_done
+        t1 = min(time.time() - self._t_start, self._acq_time)
+        rate = self._count_rate
+        if self._mode == MODE_T2:
+            rate += self._sync_rate
+        t1 = min(t1, t0 + 0.9 * count / rate)
+        self._t_done = t1
+        s0 = int(t0 * self._sync_rate)
+        s1 = int(t1 * self._sync_rate)
+        syncs, delays = self._photons(s0, s1)
+        chans = self._rng.randint(1, 3, len(syncs))
+        period = int(1e12 / self._sync_rate)
+
+        if self._mode == MODE_T3:
+            dtime = np.minimum(delays // self.get_resolution(), 4095)
+            records = ((chans.astype(np.uint32) << 28) |
+                    (dtime.astype(np.uint32) << 16) | (syncs & 0xffff))
+            key = syncs
+            wrap = 65536
+        else:
+            # Sync pulses on channel 0, photons on channel 1, in 4 ps units
+            stimes = np.arange(s0, s1, dtype=np.int64) * (period // 4)
+            ptimes = syncs * (period // 4) + delays // 4
+            key = np.concatenate((stimes, ptimes))
+            chans = np.concatenate((np.zeros(len(stimes), dtype=np.int64),
+                    np.ones(len(ptimes), dtype=np.int64)))
+            order = np.argsort(key, kind='mergesort')
+            key, chans = key[order], chans[order]
+            wrap = 210698240
+            records = ((chans.astype(np.uint32) << 28) |
+                    (key % wrap).astype(np.uint32))
+
+        if len(records) == 0:
+            return np.zeros(0, dtype=np.int32)
+        out, self._wraps = self._pack(key, records, wrap, self._wraps)
+        return out.view(np.int32)
+
+    def tt_set_marker_edges(self, me0, me1, me2, me3):
+        return 0
@@ -16,14 +16,83 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import numpy as np
+import os
 import struct
 import sys
 
 from lib.namedstruct import *
 
 _T2WRAPAROUND = 210698240
+_T3WRAPAROUND = 65536
 _RESOLUTION = 4e-12
 
+# Size of the general header and the TTTR header in bytes
+_HEADER_SIZE = 692
+_T2T3_SIZE = 36
+
+def decode_t2(records, ofl=0):
+    '''
+    Decode PicoHarp T2 records.
+
+    Each record holds a 4-bit channel and a 28-bit time tag. Channel 15
+    records are special: markers in the low 4 bits, or an overflow of the
+    time tag if these are 0. Overflow records are removed.
+
+    Input:
+        records (uint32 array): raw records
+        ofl (int): overflow offset at the start of the records
+
+    Output:
+        (chans, times, ofl): channel (uint8) and time tag in units of
+        4 ps (int64) per record, and the overflow offset for the next block
+    '''
+
+    records = np.asarray(records, dtype=np.uint32)
+    chans = (records >> 28).astype(np.uint8)
+    times = (records & 0x0fffffff).astype(np.int64)
+
+    overflow = (chans == 15) & ((times & 0xf) == 0)
+    wraps = np.cumsum(overflow, dtype=np.int64)
+    times += wraps * _T2WRAPAROUND + ofl
+    if len(wraps) > 0:
+        ofl += int(wraps[-1]) * _T2WRAPAROUND
+
+    keep = ~overflow
+    return chans[keep], times[keep], ofl
+
+def decode_t3(records, ofl=0):
+    '''
+    Decode PicoHarp T3 records.
+
+    Each record holds a 4-bit channel, a 12-bit start-stop time (dtime) and
+    a 16-bit sync counter. Channels 1-4 are photons; channel 15 records are
+    a sync counter overflow if dtime is 0, or markers in the low 4 bits of
+    dtime otherwise. Overflow records are removed.
+
+    Input:
+        records (uint32 array): raw records
+        ofl (int): sync counter offset at the start of the records
+
+    Output:
+        (chans, nsync, dtime, ofl): channel (uint8), sync counter (int64)
+        and dtime in resolution units (uint16) per record, and the sync
+        counter offset for the next block
+    '''
+
+    records = np.asarray(records, dtype=np.uint32)
+    chans = (records >> 28).astype(np.uint8)
+    dtime = ((records >> 16) & 0x0fff).astype(np.uint16)
+    nsync = (records & 0xffff).astype(np.int64)
+
+    overflow = (chans == 15) & (dtime == 0)
+    wraps = np.cumsum(overflow, dtype=np.int64)
+    nsync += wraps * _T3WRAPAROUND + ofl
+    if len(wraps) > 0:
+        ofl += int(wraps[-1]) * _T3WRAPAROUND
+
+    keep = ~overflow
+    return chans[keep], nsync[keep], dtime[keep], ofl
+
 GENERAL_HEADER_INFO = (
         ('Ident', S, 16),
         ('FormatVersion', S, 6),
@@ -189,7 +258,7 @@ class PHDFile:
         for curve in self._curve_info:
             f.seek(curve['DataOffset'])
             if self._header['BitsPerHistogBin'] != 32:
-                print 'Can only read 32 bit data'
+                print('Can only read 32 bit data')
 
             ar = np.zeros(curve['Channels'])
             for i in range(curve['Channels']):
@@ -213,6 +282,10 @@ class PHDFile:
            return y
 
 class PT2File:
+    '''
+    PicoHarp T2 mode file. The records are memory-mapped, so large files
+    can be processed in chunks with iter_chunks().
+    '''
 
     _HEADERINFO = GENERAL_HEADER_INFO
 
@@ -228,6 +301,8 @@ class PT2File:
         ('ImgHdrSize', U32, 1),
     )
 
+    _CHUNKSIZE = 1 << 22
+
     def __init__(self, filename=None):
         self._info = {}
         self._filename = ''
@@ -242,38 +317,58 @@ class PT2File:
 
     def load(self, filename, progress=0):
         f = open(filename, 'rb')
-        data = f.read(692)
+        data = f.read(_HEADER_SIZE)
         self._header = self._header_struct.unpack(data)
 
-        data = f.read(36)
+        data = f.read(_T2T3_SIZE)
         self._t2t3 = self._t2t3_struct.unpack(data)
+        f.close()
+
+        # The image header size is in 32-bit words
+        offset = _HEADER_SIZE + _T2T3_SIZE + 4 * self._t2t3['ImgHdrSize']
+        nrecords = (os.path.getsize(filename) - offset) // 4
+        self._filename = filename
+        if nrecords > 0:
+            self._data = np.memmap(filename, dtype='<u4', mode='r',
+                    offset=offset, shape=(nrecords,))
+        else:
+            self._data = np.zeros(0, dtype=np.uint32)
+
+    def _decode(self, records, ofl):
+        return decode_t2(records, ofl)
+
+    def iter_chunks(self, chunksize=None):
+        '''
+        Decode the records in chunks, keeping track of the overflows.
 
-        data = f.read(self._t2t3['ImgHdrSize'])
+        Input:
+            chunksize (int): number of records per chunk
 
-        self._data = np.fromfile(f, np.uint32, -1)
+        Output:
+            generator yielding (chans, times) per chunk, the times in
+            units of 4 ps
+        '''
+
+        if chunksize is None:
+            chunksize = self._CHUNKSIZE
+        ofl = 0
+        for start in range(0, len(self._data), chunksize):
+            ret = self._decode(self._data[start:start+chunksize], ofl)
+            ofl = ret[-1]
+            yield ret[:-1]
 
     def get_data(self):
         return self._data
 
     def get_ch_data(self, ch, progress=0):
-        chs = (self._data >> 28)
-        d = self._data.astype(np.float64)
-
-        # Add overflows
-        idx = np.where(d == 0xf0000000)[0]
-        add = 0
-        starti = 0
-        for endi in idx:
-            d[starti:endi] += add
-            starti = endi + 1
-            add += _T2WRAPAROUND
-        d[starti:] += add
-
-        # Convert to time
-        mask = (chs == ch)
-        d = d[mask] * _RESOLUTION
+        '''
+        Return the arrival times in seconds of the events on channel ch.
+        '''
 
-        return d
+        parts = [times[chans == ch] for chans, times in self.iter_chunks()]
+        if len(parts) == 0:
+            return np.zeros(0)
+        return np.concatenate(parts) * _RESOLUTION
 
     def get_header(self):
         return self._header
@@ -281,30 +376,82 @@ class PT2File:
     def get_t2t3(self):
         return self._t2t3
 
-    def get_data(self):
-        return self._data
-
 class PT3File(PT2File):
-    def __init__(self, filename=None):
-        PT2File.__init__(self, filename)
+    '''
+    PicoHarp T3 mode file: records contain a sync counter and the time
+    since the last sync pulse (dtime).
+    '''
+
+    def _decode(self, records, ofl):
+        return decode_t3(records, ofl)
+
+    def iter_chunks(self, chunksize=None):
+        '''
+        Decode the records in chunks, keeping track of the overflows.
+
+        Input:
+            chunksize (int): number of records per chunk
+
+        Output:
+            generator yielding (chans, nsync, dtime) per chunk
+        '''
+        return PT2File.iter_chunks(self, chunksize)
+
+    def get_sync_period(self):
+        '''Return the sync period in seconds.'''
+        rate = self._t2t3['InpRate0']
+        if rate == 0:
+            return 0
+        return 1.0 / rate
+
+    def get_resolution(self):
+        '''Return the dtime resolution in seconds.'''
+        return self._header['Resolution'] * 1e-9
+
+    def get_ch_data(self, ch, progress=0):
+        '''
+        Return the arrival times in seconds of the photons on channel ch,
+        as sync period * sync count + dtime * resolution.
+        '''
+
+        period = self.get_sync_period()
+        res = self.get_resolution()
+        parts = []
+        for chans, nsync, dtime in self.iter_chunks():
+            mask = (chans == ch)
+            parts.append(nsync[mask] * period + dtime[mask] * res)
+        if len(parts) == 0:
+            return np.zeros(0)
+        return np.concatenate(parts)
+
+    def get_lifetime_histogram(self, ch, nbins=4096):
+        '''
+        Return the histogram of dtime for channel ch, accumulated per chunk.
+        '''
+
+        hist = np.zeros(nbins, dtype=np.int64)
+        for chans, nsync, dtime in self.iter_chunks():
+            d = dtime[(chans == ch) & (dtime < nbins)]
+            hist += np.bincount(d, minlength=nbins)
+        return hist
 
 def test_phd(fname):
     phd = PHDFile(fname)
 
-    print 'Info:'
+    print('Info:')
     info = phd.get_header()
     for line in phd._HEADERINFO:
         key = line[0]
         val = info[key]
-        print '  %s => %r' % (key, val)
+        print('  %s => %r' % (key, val))
 
     for i in range(info['NumberOfCurves']):
-        print 'Curve %d:' % (i, )
+        print('Curve %d:' % (i, ))
         cinfo = phd.get_curve_info(i)
         for line in phd._CURVEINFO:
             key = line[0]
             val = cinfo[key]
-            print '  %s => %r' % (key, val)
+            print('  %s => %r' % (key, val))
 
         import matplotlib.pyplot as plt
         xys = phd.get_curve(i)
@@ -316,42 +463,42 @@ def test_phd(fname):
 def test_pt2(fname):
     t2 = PT2File(fname)
 
-    print 'Header info:'
+    print('Header info:')
     info = t2.get_header()
     for line in t2._HEADERINFO:
         key = line[0]
         val = info[key]
-        print '  %s => %r' % (key, val)
+        print('  %s => %r' % (key, val))
 
-    print 'PT2/PT3 info:'
+    print('PT2/PT3 info:')
     info = t2.get_t2t3()
     for line in t2._T2T3INFO:
         key = line[0]
         val = info[key]
-        print '  %s => %r' % (key, val)
+        print('  %s => %r' % (key, val))
 
     data = t2.get_data()
-    print 'Data size: %s, type: %s' % (data.size, data.dtype)
+    print('Data size: %s, type: %s' % (data.size, data.dtype))
 
     data = t2.get_ch_data(0, progress=1000)
-    print 'Channel data: %s, type: %s' % (data.size, data.size)
+    print('Channel data: %s, type: %s' % (data.size, data.size))
 
     avgdt = data[-1] / data.size
-    print 'Average dt: %.03f us' % (avgdt * 1e6, )
+    print('Average dt: %.03f us' % (avgdt * 1e6, ))
 
     import matplotlib.pyplot as plt
 
-    print 'Time-trace construction...'
+    print('Time-trace construction...')
     binsize = 5e-3
     plt.figure()
-    n, bins, patches = plt.hist(data, bins=(120/binsize), range=(0,120), histtype='step')
+    n, bins, patches = plt.hist(data, bins=int(120/binsize), range=(0,120), histtype='step')
     plt.xlabel('Time (s)')
     plt.ylabel('Counts / %.03f ms bin' % (binsize*1e3))
     plt.savefig('timebins.pdf')
 
-    print 'Start-stop construction'
+    print('Start-stop construction')
     NDELTAS = 10
-    print 'NDELTAS = %s --> ok to %.03f us' % (NDELTAS, NDELTAS*avgdt*1e6)
+    print('NDELTAS = %s --> ok to %.03f us' % (NDELTAS, NDELTAS*avgdt*1e6))
     deltas = np.array([])
     for i in range(1, NDELTAS):
         newdeltas = data[i:]-data[:-i]
@@ -359,14 +506,12 @@ def test_pt2(fname):
 
     plt.figure()
     binsize = 0.05      # us
-    n, bins, patches = plt.hist(deltas*1e6, bins=10/binsize, range=(0,10), histtype='step')
+    n, bins, patches = plt.hist(deltas*1e6, bins=int(10/binsize), range=(0,10), histtype='step')
     plt.xlabel('dt (us)')
     plt.ylabel('Events / %.03f us (start - %d stops)' % (binsize, NDELTAS))
     plt.savefig('dtbins.pdf')
 
 if __name__ == '__main__':
-    import os
-
     if len(sys.argv) == 2:
         fname = sys.argv[1]
     else:
@@ -21,6 +21,8 @@ from scipy.optimize import leastsq
 from numpy.random import rand
 import code
 import copy
+import logging
+import multiprocessing
 
 WEIGHT_EQUAL    = 0
 WEIGHT_10PCT    = 1
@@ -35,7 +37,31 @@ def eval_func(codestr, **kwargs):
     ret = eval(codestr, kwargs)
     return ret
 
+def _stack(derivs):
+    '''Stack partial derivatives, broadcasting them to the same shape.'''
+    return np.array(np.broadcast_arrays(*derivs))
+
+def _solve_many(A, b):
+    '''Solve the stack of linear systems A x = b.'''
+    try:
+        return np.linalg.solve(A, b[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        return np.array([np.linalg.lstsq(Ai, bi, rcond=-1)[0] \
+                for Ai, bi in zip(A, b)])
+
+def _fit_chunk(args):
+    '''Process pool worker for Function.fit_many().'''
+    f, x, Y, W, P0, free, maxiter = args
+    return f._fit_batch(x, Y, W, P0, free, maxiter)
+
 class Function:
+
+    # Number of traces fitted at the same time by fit_many(seed=True)
+    SEED_CHUNK = 32
+    # A converged trace is only used as seed if its chi-square is at most
+    # this factor above the median chi-square of the traces so far
+    SEED_CHISQ = 10.0
+
     def __init__(self, xdata=None, ydata=None, xerr=None, yerr=None,
                     weight=WEIGHT_EQUAL, minerr=None, nparams=None):
         '''
@@ -68,24 +94,36 @@ class Function:
             self._yerr = yerr
         elif self._xdata is None or self._ydata is None:
             self._yerr = None
-        elif self._weight == WEIGHT_EQUAL:
-            self._yerr = np.ones_like(self._xdata)
+        else:
+            self._yerr = self._calc_yerr(self._ydata)
+
+    def _calc_yerr(self, y):
+        '''
+        Return error vector (or array) for y data according to the
+        weighting mechanism.
+        '''
+
+        yerr = None
+        if self._weight == WEIGHT_EQUAL:
+            yerr = np.ones(np.shape(y))
         elif self._weight == WEIGHT_10PCT:
-            self._yerr = 0.10 * np.abs(self._ydata)
+            yerr = 0.10 * np.abs(y)
         elif self._weight == WEIGHT_20PCT:
-            self._yerr = 0.20 * np.abs(self._ydata)
+            yerr = 0.20 * np.abs(y)
         elif self._weight == WEIGHT_SQRTN:
-            self._yerr = np.sqrt(np.abs(self._ydata))
+            yerr = np.sqrt(np.abs(y))
         elif self._weight == WEIGHT_SQRTN2:
-            self._yerr = 0.5 * np.sqrt(np.abs(self._ydata))
+            yerr = 0.5 * np.sqrt(np.abs(y))
         elif self._weight == WEIGHT_N:
-            self._yerr = np.abs(self._ydata)
+            yerr = np.abs(y)
         elif self._weight == WEIGHT_LOGN:
-            self._yerr = np.log(np.abs(self._ydata))
+            yerr = np.log(np.abs(y))
 
         # Set minimum errors
-        if self._yerr is not None and self._minerr is not None:
-            self._yerr[self._yerr < self._minerr] = self._minerr
+        if yerr is not None and self._minerr is not None:
+            yerr[yerr < self._minerr] = self._minerr
+
+        return yerr
 
     def set_nparams(self, n):
         if self._nparams not in (n, None):
@@ -100,10 +138,9 @@ class Function:
         if len(p) == self._nparams:
             return p
 
-        p = copy.copy(p)
-        for i, v in self._fixed.iteritems():
-            p = np.insert(p, i, v)
-        return p
+        pfull = self._pfixed.copy()
+        pfull[self._free] = p
+        return pfull
 
     def get_px(self, p, x=None):
         '''
@@ -120,6 +157,18 @@ class Function:
         '''
         pass
 
+    def jacobian(self, p, x=None):
+        '''
+        Return the partial derivatives of func to each of the parameters,
+        stacked along the first axis. May be implemented in derived classes,
+        otherwise fit_many() uses finite differences.
+
+        Like func, this is also called with p[i] an array of values for
+        parameter i (one per trace, shape (ntraces, 1)) to evaluate many
+        parameter sets at once.
+        '''
+        return None
+
     def err_func(self, p):
         residuals = np.abs(self._ydata - self.func(p)) / self._yerr
         return residuals
@@ -142,6 +191,7 @@ class Function:
         # Store fixed parameters
         for i in fixed:
             self._fixed[i] = p0[i]
+        self._set_fixed(p0, fixed)
 
         out = leastsq(self.err_func, p1, full_output=1)
         params = out[0]
@@ -161,6 +211,222 @@ class Function:
 
         return self._fit_params
 
+    def _set_fixed(self, p0, fixed):
+        '''Store the fixed parameter values and indices of free ones.'''
+        self._pfixed = np.array(p0, dtype=float)
+        self._free = np.array([i for i in range(len(p0)) if i not in fixed],
+                dtype=int)
+
+    def _eval_many(self, P, x):
+        '''Evaluate func for each row of parameter array P.'''
+        ret = self.func(P.T[:, :, np.newaxis], x)
+        if np.shape(ret) != (len(P), len(x)):
+            ret = np.array([self.func(p, x) for p in P])
+        return ret
+
+    def _jacobian_many(self, P, x, free, F):
+        '''
+        Return the Jacobian of func for each row of parameter array P
+        with respect to the free parameters, shape (ntraces, nx, nfree).
+        F is func evaluated at P, used for finite differences.
+        '''
+
+        J = self.jacobian(P.T[:, :, np.newaxis], x)
+        if J is not None and np.shape(J)[1:] == (len(P), len(x)):
+            return np.asarray(J)[free].transpose(1, 2, 0)
+
+        J = np.empty((len(P), len(x), len(free)))
+        for j, k in enumerate(free):
+            h = 1.49012e-8 * np.maximum(np.abs(P[:, k]), 1)
+            P2 = P.copy()
+            P2[:, k] += h
+            J[:, :, j] = (self._eval_many(P2, x) - F) / h[:, np.newaxis]
+        return J
+
+    def _fit_batch(self, x, Y, W, P0, free, maxiter=100, tol=1.49012e-8):
+        '''
+        Levenberg-Marquardt fit of all rows of Y at the same time.
+
+        Input:
+            x: x data vector
+            Y: y data, one trace per row
+            W: weights (1 / yerr) for Y
+            P0: starting parameters, one set per row
+            free: indices of free parameters
+        Output:
+            parameters, errors, converged flags, chi-square
+        '''
+
+        n = len(Y)
+        P = np.array(P0, dtype=float)
+        F = self._eval_many(P, x)
+        R = (Y - F) * W
+        chisq = np.sum(R**2, axis=1)
+        lam = np.ones(n) * 1e-3
+        active = np.ones(n, dtype=bool)
+        converged = np.zeros(n, dtype=bool)
+        eye = np.eye(len(free))
+
+        for it in range(maxiter):
+            idx = np.nonzero(active)[0]
+            if len(idx) == 0:
+                break
+
+            J = -self._jacobian_many(P[idx], x, free, F[idx]) * \
+                    W[idx, :, np.newaxis]
+            A = np.einsum('ijk,ijl->ikl', J, J)
+            g = np.einsum('ijk,ij->ik', J, R[idx])
+            d = np.einsum('ikk->ik', A)
+            d = np.maximum(d, 1e-12 * np.max(d, axis=1)[:, np.newaxis] + 1e-300)
+            delta = _solve_many(A + lam[idx, np.newaxis, np.newaxis] * \
+                    d[:, :, np.newaxis] * eye, -g)
+
+            Pn = P[idx]
+            Pn[:, free] += delta
+            Fn = self._eval_many(Pn, x)
+            Rn = (Y[idx] - Fn) * W[idx]
+            chin = np.sum(Rn**2, axis=1)
+
+            better = chin <= chisq[idx]
+            done = better & ((chisq[idx] - chin <= tol * chin) | \
+                np.all(np.abs(delta) <= tol * (np.abs(P[idx][:, free]) + tol), axis=1))
+
+            ib = idx[better]
+            P[ib] = Pn[better]
+            F[ib] = Fn[better]
+            R[ib] = Rn[better]
+            chisq[ib] = chin[better]
+            lam[ib] /= 10
+            lam[idx[~better]] *= 10
+
+            # No further improvement possible
+            done |= lam[idx] > 1e10
+            converged[idx[done]] = True
+            active[idx[done]] = False
+
+        # Error estimate from the covariance matrix, as in fit()
+        err = np.zeros_like(P)
+        J = self._jacobian_many(P, x, free, F) * W[:, :, np.newaxis]
+        A = np.einsum('ijk,ijl->ikl', J, J)
+        try:
+            covar = np.linalg.inv(A)
+        except np.linalg.LinAlgError:
+            covar = np.linalg.pinv(A)
+        dof = max(len(x) - len(free), 1)
+        var = np.einsum('ikk->ik', covar) * (chisq / dof)[:, np.newaxis]
+        err[:, free] = np.sqrt(np.abs(var))
+
+        return P, err, converged, chisq
+
+    def _fit_seeded(self, x, Y, W, P0, free, maxiter=100):
+        '''
+        Fit the rows of Y in chunks of SEED_CHUNK traces, each chunk
+        starting from the last good result of the traces before it.
+        Traces that do not converge from the seed are fitted again from
+        P0, keeping the result with the lowest chi-square.
+        '''
+
+        n = len(Y)
+        P = np.array(P0, dtype=float)
+        err = np.zeros_like(P)
+        converged = np.zeros(n, dtype=bool)
+        chisq = np.zeros(n)
+        good = np.zeros(n, dtype=bool)
+
+        for start in range(0, n, self.SEED_CHUNK):
+            c = np.arange(start, min(start + self.SEED_CHUNK, n))
+            p = P0[c].copy()
+            prev = np.nonzero(good[:start])[0]
+            if len(prev) > 0:
+                p[:, free] = P[prev[-1], free]
+            P[c], err[c], converged[c], chisq[c] = \
+                    self._fit_batch(x, Y[c], W[c], p, free, maxiter)
+
+            bad = c[~converged[c]]
+            if len(prev) > 0 and len(bad) > 0:
+                Pb, eb, cb, chib = self._fit_batch(x, Y[bad], W[bad],
+                        P0[bad], free, maxiter)
+                better = np.isnan(chisq[bad]) | (chib < chisq[bad])
+                ib = bad[better]
+                P[ib] = Pb[better]
+                err[ib] = eb[better]
+                converged[ib] = cb[better]
+                chisq[ib] = chib[better]
+
+            # Sanity bound: do not seed from fits that ended up in a
+            # clearly worse minimum than the others
+            median = np.median(chisq[:c[-1]+1][converged[:c[-1]+1]]) \
+                    if np.any(converged[:c[-1]+1]) else np.inf
+            good[c] = converged[c] & np.all(np.isfinite(P[c]), axis=1) & \
+                    (chisq[c] <= self.SEED_CHISQ * median)
+
+        return P, err, converged
+
+    def fit_many(self, x, Y, p0, fixed=[], yerr=None, seed=False,
+            processes=None, maxiter=100):
+        '''
+        Fit the function to each row of the 2D array Y, e.g. the lines of
+        a 2D map. All traces are fitted at the same time with a vectorized
+        Levenberg-Marquardt algorithm, using the analytic Jacobian if the
+        function provides one.
+
+        Input:
+            x: x data vector, shared by all traces
+            Y: y data, one trace per row
+            p0: starting parameters, either a single set or one per trace
+            fixed: list of numbers specifying which parameters to keep fixed
+            yerr: error vector or array, if None use the weight mechanism
+            seed: if True fit the traces in chunks of SEED_CHUNK, starting
+                each chunk from the last converged result before it, for
+                features that move across the traces
+            processes: number of processes to spread the traces over, None
+                to fit in this process
+            maxiter: maximum number of iterations
+
+        Output:
+            (params, errors), arrays of shape (ntraces, nparams)
+        '''
+
+        x = np.asarray(x, dtype=float)
+        Y = np.atleast_2d(np.asarray(Y, dtype=float))
+        n = len(Y)
+        P0 = np.array(p0, dtype=float)
+        if P0.ndim == 1:
+            P0 = np.tile(P0, (n, 1))
+        self.set_nparams(P0.shape[1])
+
+        if yerr is None:
+            yerr = self._calc_yerr(Y)
+        W = 1.0 / np.broadcast_to(yerr, Y.shape)
+        free = np.array([i for i in range(P0.shape[1]) if i not in fixed],
+                dtype=int)
+
+        if seed:
+            P, err, converged = self._fit_seeded(x, Y, W, P0, free, maxiter)
+
+        elif processes is not None and processes > 1 and n > 1:
+            chunks = np.array_split(np.arange(n), min(processes, n))
+            args = [(self, x, Y[c], W[c], P0[c], free, maxiter) for c in chunks]
+            pool = multiprocessing.Pool(processes)
+            try:
+                results = pool.map(_fit_chunk, args)
+            finally:
+                pool.close()
+                pool.join()
+            P = np.concatenate([r[0] for r in results])
+            err = np.concatenate([r[1] for r in results])
+            converged = np.concatenate([r[2] for r in results])
+
+        else:
+            P, err, converged = self._fit_batch(x, Y, W, P0, free,
+                    maxiter)[:3]
+
+        if not np.all(converged):
+            logging.warning('Fit did not converge for %d of %d traces',
+                    n - np.sum(converged), n)
+
+        return P, err
+
     def fit_odr(self, p0):
         from scipy import odr
         model = odr.Model(self.func)
@@ -202,11 +468,11 @@ class Function:
         self.set_data(x, y, yerr=yerr)
         p = self.fit(p0)
             
-        print '\tRandom par: %s' % (pr, )
+        print('\tRandom par: %s' % (pr, ))
         s = ''
         for val, err in zip(p, self.get_fit_errors()):
             s += ' %f (+-%f)' % (val, err)
-        print '\tResult:%s' % (s, )
+        print('\tResult:%s' % (s, ))
 
         yfit = self.func(p, x)
         plt.errorbar(x, y, yerr=self._yerr, fmt='ks')
@@ -256,6 +522,13 @@ class Polynomial(Function):
 
         return ret
 
+    def jacobian(self, p, x=None):
+        p, x = self.get_px(p, x)
+        derivs = [np.ones_like(x) + 0 * p[0]]
+        for n in range(1, self._order + 1):
+            derivs.append(x**n)
+        return _stack(derivs)
+
 class Linear(Polynomial):
     '''
     Linear fit function a + bx
@@ -301,6 +574,16 @@ class Gaussian(Function):
         ret = p[0] + p[1] / p[3] / np.sqrt(np.pi / 2) * np.exp(-2*(x - p[2])**2 / p[3]**2)
         return ret
 
+    def jacobian(self, p, x=None):
+        p, x = self.get_px(p, x)
+        e = np.exp(-2*(x - p[2])**2 / p[3]**2) / np.sqrt(np.pi / 2)
+        return _stack([
+            np.ones_like(e),
+            e / p[3],
+            4 * p[1] * e * (x - p[2]) / p[3]**3,
+            p[1] * e / p[3]**2 * (4 * (x - p[2])**2 / p[3]**2 - 1),
+        ])
+
 class GaussianPlain(Function):
     '''
     Gaussian fit function: a + b * exp(-4ln(2)(x - c)**2 / d**2)
@@ -337,6 +620,17 @@ class GaussianPlain(Function):
         ret = p[0] + p[1] * np.exp(-4 * np.log(2) * (x - p[2])**2 / p[3]**2)
         return ret
 
+    def jacobian(self, p, x=None):
+        p, x = self.get_px(p, x)
+        k = 4 * np.log(2)
+        e = np.exp(-k * (x - p[2])**2 / p[3]**2)
+        return _stack([
+            np.ones_like(e),
+            e,
+            2 * k * p[1] * e * (x - p[2]) / p[3]**2,
+            2 * k * p[1] * e * (x - p[2])**2 / p[3]**3,
+        ])
+
 class Lorentzian(Function):
     '''
     Lorentzian fit function: a + 2bd / pi / (4(x - c)**2 + d**2)
@@ -373,6 +667,16 @@ class Lorentzian(Function):
         ret = np.ones_like(x) * p[0] + 2 * p[1] / np.pi * p[3] / (4*(x - p[2])**2 + p[3]**2)
         return ret
 
+    def jacobian(self, p, x=None):
+        p, x = self.get_px(p, x)
+        d = 4*(x - p[2])**2 + p[3]**2
+        return _stack([
+            np.ones_like(d),
+            2 / np.pi * p[3] / d,
+            16 / np.pi * p[1] * p[3] * (x - p[2]) / d**2,
+            2 / np.pi * p[1] * (d - 2 * p[3]**2) / d**2,
+        ])
+
 class Exponential(Function):
     '''
     Exponential fit function: a + b * exp((x - c) * d)
@@ -394,6 +698,16 @@ class Exponential(Function):
         ret = np.ones_like(x) * p[0] + p[1] * np.exp(-(x - p[2]) * p[3])
         return ret
 
+    def jacobian(self, p, x=None):
+        p, x = self.get_px(p, x)
+        e = np.exp(-(x - p[2]) * p[3])
+        return _stack([
+            np.ones_like(e),
+            e,
+            p[1] * p[3] * e,
+            -p[1] * (x - p[2]) * e,
+        ])
+
 class Sine(Function):
     '''
     Sine fit function: a + b * sin(x * c + d)
@@ -415,6 +729,16 @@ class Sine(Function):
         ret = np.ones_like(x) * p[0] + p[1] * np.sin(x * p[2] + p[3])
         return ret
 
+    def jacobian(self, p, x=None):
+        p, x = self.get_px(p, x)
+        c = p[1] * np.cos(x * p[2] + p[3])
+        return _stack([
+            np.ones_like(c),
+            np.sin(x * p[2] + p[3]),
+            c * x,
+            c,
+        ])
+
 class NISTRationalHahn(Function):
     def func(self, p, x=None):
         p, x = self.get_px(p, x)
@@ -461,48 +785,48 @@ if __name__ == "__main__":
     plt.figure()
     lin = Linear()
     pr = [rand(), (rand() - 0.5) * 5]
-    print 'Linear fit:'
+    print('Linear fit:')
     lin.test_random(-10, 10, 20, pr, 2, [0, 1])
 
     plt.figure()
     gauss = Gaussian()
     # BG, height, pos, width
     pr = [rand(), 5 * (rand() + 0.1), 10 * (rand() - 0.5), 3 * (rand() + 0.1)]
-    print 'Gaussian fit:'
+    print('Gaussian fit:')
     gauss.test_random(-10, 10, 50, pr, 1)
 
     plt.figure()
     exp = Exponential()
     # BG, height, pos, exponent
     pr = [rand(), 5 * (rand() + 0.1), 10 * (rand() - 0.5), 2 * (rand() + 0.1)]
-    print 'Exponential fit:'
+    print('Exponential fit:')
     exp.test_random(-10, 10, 50, pr, 1, logy=True)
 
     plt.figure()
     sine = Sine()
     # BG, amplitude, frequency, phi0
     pr = [rand(), 3 * (rand() + 0.5), 0.5 * np.pi * (rand() + 0.1), 2 * np.pi * rand()]
-    print 'Sine fit:'
+    print('Sine fit:')
     sine.test_random(-10, 10, 50, pr, 2)
 
     plt.figure()
     data = np.loadtxt('data/gauss_ref.dat')
-    print 'Gauss ref:'
+    print('Gauss ref:')
     gauss = Gaussian(data[:,0], data[:,1], weight=WEIGHT_EQUAL)
     p0 = [-1, 10, 2, 0.7]
     p = gauss.fit(p0, fixed=(0,))
-    print '\tStart par: %s' % (p0, )
+    print('\tStart par: %s' % (p0, ))
     s = ''
     for val, err in zip(p, gauss.get_fit_errors()):
-        print '\t\t%e (+-%e)' % (val, err)
+        print('\t\t%e (+-%e)' % (val, err))
 
     f = lambda p, x: p[0] + p[1] / p[3] / np.sqrt(np.pi / 2) * np.exp(-2*(x - p[2])**2 / p[3]**2)
     fc = fit(f, data[:,0], data[:,1], p0)
     p = fc.get_fit_params()
-    print '\tStart par: %s' % (p0, )
+    print('\tStart par: %s' % (p0, ))
     s = ''
     for val, err in zip(p, gauss.get_fit_errors()):
-        print '\t\t%e (+-%e)' % (val, err)
+        print('\t\t%e (+-%e)' % (val, err))
 
     plt.errorbar(data[:,0], data[:,1], yerr=gauss._yerr, fmt='ks')
     plt.plot(data[:,0], gauss.func(p))
@@ -511,29 +835,29 @@ if __name__ == "__main__":
     # http://www.itl.nist.gov/div898/strd/nls/nls_main.shtml
     plt.figure()
     data = np.loadtxt('data/Hahn1.dat')
-    print 'NIST Hahn:'
+    print('NIST Hahn:')
     hahn = NISTRationalHahn(data[:,1], data[:,0])
     p0 = [1e1, -1e-1, 5e-3, -1e-6, -5e-3, 1e-4, -1e-7]
     pa = [1.08e0,-1.23e-1,4.09e-3,-1.43e-6,-5.76e-3,2.41e-4,-1.23e-7]
     p = hahn.fit(p0)
-    print '\tStart par: %s' % (p0, )
+    print('\tStart par: %s' % (p0, ))
     s = ''
     for val, err in zip(p, hahn.get_fit_errors()):
-        print '\t\t%e (+-%e)' % (val, err)
+        print('\t\t%e (+-%e)' % (val, err))
 
     plt.plot(data[:,1], data[:,0], 'ks')
     plt.plot(data[:,1], hahn.func(p), 'r+')
 
     plt.figure()
     data = np.loadtxt('data/Gauss1.dat')
-    print 'NIST Gauss:'
+    print('NIST Gauss:')
     gauss = NISTGauss(data[:,1], data[:,0])
     p0 = [9.7e1,9e-3,1e2,6.5e1,2e1,7e1,1.78e2,1.65e1]
     p = gauss.fit(p0)
-    print '\tStart par: %s' % (p0, )
+    print('\tStart par: %s' % (p0, ))
     s = ''
     for val, err in zip(p, gauss.get_fit_errors()):
-        print '\t\t%e (+-%e)' % (val, err)
+        print('\t\t%e (+-%e)' % (val, err))
 
     plt.plot(data[:,1], data[:,0], 'ks')
     plt.plot(data[:,1], gauss.func(p), 'r+')
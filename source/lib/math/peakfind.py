@@ -16,7 +16,7 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import numpy as np
-import fit
+from lib.math import fit
 
 FIT_LORENTZIAN = 1
 FIT_GAUSSIAN = 2
@@ -41,11 +41,20 @@ class PeakFinder(PeakFinderBase):
         - fit: fitting function, FIT_LORENTZIAN or FIT_GAUSSIAN
         - fitwidth: number of data points around maximum to use for fit
         - threshold: the threshold for detecting a peak (# of standard dev.)
+        - prominence: minimum prominence of a peak for find_all()
+        (# of standard dev.), default equal to threshold
+        - bgwidth: number of data points for the rolling baseline used by
+        find_all(), default 10 * fitwidth
+        - smooth: number of data points to average before detecting peaks
+        in find_all(), default fitwidth / 10
         '''
 
         self._fit = kwargs.get('fit', FIT_LORENTZIAN)
         self._fitwidth = kwargs.get('fitwidth', 30)
         self._threshold = kwargs.get('threshold', 3)
+        self._prominence = kwargs.get('prominence', self._threshold)
+        self._bgwidth = kwargs.get('bgwidth', 10 * self._fitwidth)
+        self._smooth = kwargs.get('smooth', max(1, self._fitwidth // 10))
         PeakFinderBase.__init__(self, *args, **kwargs)
 
     def _fit_bg(self, order):
@@ -84,8 +93,8 @@ class PeakFinder(PeakFinderBase):
                 if maxval > avg - self._threshold * std:
                     break
 
-            mini = max(0, maxloc - self._fitwidth / 2)
-            maxi = min(len(self._xdata) - 1, maxloc + self._fitwidth / 2)
+            mini = max(0, maxloc - self._fitwidth // 2)
+            maxi = min(len(self._xdata) - 1, maxloc + self._fitwidth // 2)
             dx = abs((self._xdata[maxi] - self._xdata[mini]) / (maxi - mini))
 
             if self._fit == FIT_LORENTZIAN:
@@ -93,14 +102,14 @@ class PeakFinder(PeakFinderBase):
             elif self._fit == FIT_GAUSSIAN:
                 f = fit.Gaussian(self._xdata[mini:maxi], self._ydata[mini:maxi])
             else:
-                print 'Unknown fit requested'
+                print('Unknown fit requested')
                 return
 
             p = f.fit([avg, sign*3*std, self._xdata[maxloc], 3 * dx])
             pos = p[2]
             w = f.get_fwhm()
             if sign * p[1] < 0:
-                print 'Peak of wrong sign found'
+                print('Peak of wrong sign found')
             h = f.get_height() + sign * p[0]   # Height including background
             peaks.append([pos, h, w])
 
@@ -116,6 +125,145 @@ class PeakFinder(PeakFinderBase):
 
         return peaks
 
+    def get_baseline(self):
+        '''
+        Return a robust rolling baseline: the median of blocks of bgwidth/4
+        points, smoothed with a running median over 5 blocks and linearly
+        interpolated. This takes linear time.
+        '''
+
+        from scipy.ndimage import median_filter
+
+        y = np.asarray(self._ydata, dtype=float)
+        n = len(y)
+        block = max(1, int(self._bgwidth) // 4)
+        nblocks = n // block
+        if nblocks < 2:
+            return np.ones(n) * np.median(y)
+
+        med = np.median(y[:nblocks*block].reshape(nblocks, block), axis=1)
+        med = median_filter(med, size=5, mode='nearest')
+        centers = np.arange(nblocks) * block + (block - 1) / 2.0
+        return np.interp(np.arange(n), centers, med)
+
+    def _smoothed(self, y):
+        '''
+        Return the moving average of y over 'smooth' points, which avoids
+        detecting noise on the flanks of peaks.
+        '''
+
+        m = self._smooth
+        if m <= 1 or m > len(y):
+            return y
+
+        c = np.cumsum(np.concatenate(([0], y)))
+        avg = (c[m:] - c[:-m]) / m
+        return np.concatenate((np.ones(m // 2) * avg[0], avg,
+            np.ones((m - 1) // 2) * avg[-1]))
+
+    def detect(self, sign=1):
+        '''
+        Find peak candidates in a single pass. A candidate is a local
+        maximum (or minimum if sign is -1) of the smoothed data that is
+        both higher and more prominent than the threshold / prominence
+        times the noise level.
+
+        Returns a tuple (indices, baseline, noise) with the indices of at
+        most maxpeaks candidates, most prominent first.
+        '''
+
+        from scipy.signal import find_peaks
+
+        y = np.asarray(self._ydata, dtype=float)
+        bg = self.get_baseline()
+        r = sign * (y - bg)
+
+        r = self._smoothed(r)
+
+        # Robust noise estimate from the median absolute deviation
+        noise = 1.4826 * np.median(np.abs(r - np.median(r)))
+        if noise == 0:
+            noise = np.std(r)
+
+        peaks, props = find_peaks(r, height=self._threshold * noise,
+                prominence=self._prominence * noise,
+                distance=max(1, self._fitwidth // 2))
+        order = np.argsort(props['prominences'])[::-1][:self._maxpeaks]
+        return peaks[order], bg, noise
+
+    def find_all(self, sign=1, fast=False, processes=None):
+        '''
+        Return a list of (position, height, width) tuples for all peaks that
+        are located, with height measured from the baseline. As for find(),
+        the height of a valley is negative.
+
+        Candidates are found with detect(), after which they are all fitted
+        at the same time (see fit.Function.fit_many). If fast is True no
+        fits are performed, and the position is the centroid and the width
+        the full width at half maximum of each candidate.
+
+        sign should be 1 to find peaks, -1 to find valleys
+        processes is the number of processes to use for fitting
+        '''
+
+        from scipy.signal import peak_widths
+
+        peaks, bg, noise = self.detect(sign)
+        if len(peaks) == 0:
+            return []
+
+        x = np.asarray(self._xdata, dtype=float)
+        n = len(x)
+        r = sign * (np.asarray(self._ydata, dtype=float) - bg)
+        widths, halfmax, left, right = peak_widths(self._smoothed(r), peaks,
+                rel_height=0.5)
+
+        # Windows of fitwidth points around each candidate, in index units
+        hw = max(2, self._fitwidth // 2)
+        offsets = np.arange(-hw, hw + 1)
+        win = peaks[:, np.newaxis] + offsets
+        valid = (win >= 0) & (win < n)
+        win = np.clip(win, 0, n - 1)
+        Y = r[win]
+
+        if fast:
+            w = np.where(valid & (Y >= halfmax[:, np.newaxis]), Y, 0)
+            pos = np.sum(w * win, axis=1) / np.sum(w, axis=1)
+            height = r[peaks]
+            width = widths
+
+        else:
+            if self._fit == FIT_LORENTZIAN:
+                f = fit.Lorentzian()
+                d = widths
+                area = r[peaks] * np.pi * d / 2
+            elif self._fit == FIT_GAUSSIAN:
+                f = fit.Gaussian()
+                d = widths / np.sqrt(2 * np.log(2))
+                area = r[peaks] * d * np.sqrt(np.pi / 2)
+            else:
+                raise ValueError('Unknown fit requested')
+
+            p0 = np.column_stack((np.zeros(len(peaks)), area,
+                np.zeros(len(peaks)), d))
+            # Only use points within a few widths, to keep neighbouring
+            # peaks out of the fit
+            near = np.abs(offsets) <= np.maximum(3 * widths, 5)[:, np.newaxis]
+            yerr = np.where(valid & near, 1.0, np.inf)
+            P, err = f.fit_many(offsets, Y, p0, yerr=yerr, processes=processes)
+            pos = peaks + P[:, 2]
+            height = f.get_height(P.T)
+            width = np.abs(f.get_fwhm(P.T))
+
+        # Fitted on sign * (y - baseline), restore the sign of the height
+        height = sign * height
+
+        # Convert from index units to x units
+        idx = np.arange(n)
+        dx = np.abs(np.interp(pos, idx, np.gradient(x)))
+        pos = np.interp(pos, idx, x)
+        return [[p, h, w] for p, h, w in zip(pos, height, width * dx)]
+
 if __name__ == "__main__":
     maxx = 20
     xdata = np.arange(0, maxx, 0.1)
@@ -124,7 +272,7 @@ if __name__ == "__main__":
         ydata += -0.05 * (xdata - maxx * np.random.rand())**2
         for i in range(3):
             xpos = maxx * np.random.random()
-            print 'Putting peak at %r' % (xpos, )
+            print('Putting peak at %r' % (xpos, ))
             ydata += sign * 5 * np.exp(-(xdata - xpos)**2 / 0.5**2)
 
         import matplotlib.pyplot as plt
@@ -133,5 +281,5 @@ if __name__ == "__main__":
 
         p = PeakFinder(xdata, ydata, maxpeaks=3)
         peaks = p.find(sign=sign, bgorder=2)
-        print 'Peaks at: %r' % (peaks, )
+        print('Peaks at: %r' % (peaks, ))
 
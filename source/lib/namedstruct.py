@@ -16,7 +16,6 @@
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
 import struct
-import types
 
 S8 = 'b'        # Signed byte, unpacked as list of ints
 U8 = 'B'        # Unsigned byts, unpacked as list of ints
@@ -26,9 +25,9 @@ S32 = 'i'       # Signed int, unpacked as list of ints
 U32 = 'I'       # Unsigned int, unpacked as list of ints
 S64 = 'q'       # Signed long long, unpacked as list of longs
 U64 = 'Q'       # Unsigned long long, unpacked as list of longs
-S = 's'         # String, unpacked as string with exact length 
-STRING = 's2'   # String, unpacked as string chopped at terminating 0-byte
-C = 'c'         # List of characters
+S = 's'         # String, unpacked as bytes with exact length
+STRING = 's2'   # String, unpacked as str chopped at terminating 0-byte
+C = 'c'         # List of characters (bytes of length 1)
 FLOAT = 'f'     # Float
 DOUBLE = 'd'    # Double
 
@@ -90,10 +89,7 @@ def unpack(buf, format, alignment='='):
     for line in format:
         name, dtype, dlen = line
         if dtype == STRING:
-            ret[name] = str(list[i])
-            zeropos = ret[name].find('\x00')
-            if zeropos != -1:
-                ret[name] = ret[name][:zeropos]
+            ret[name] = list[i].split(b'\x00')[0].decode('latin-1')
             i += 1
         elif dtype == S:
             ret[name] = list[i]
@@ -107,35 +103,45 @@ def unpack(buf, format, alignment='='):
 
     return ret
 
-# FIXME: add alignment flag in a proper way
-def pack(format, **kwargs):
-    list = []
+def _pack_values(format, kwargs):
+    '''Return the list of values to pack for a format array.'''
+
+    values = []
     for line in format:
         name, dtype, dlen = line
         if name in kwargs:
-            if type(kwargs[name]) in (types.TupleType, types.ListType):
+            if type(kwargs[name]) in (tuple, list):
                 for element in kwargs[name]:
-                    list.append(element)
+                    values.append(element)
+            elif dtype in [S, STRING] and isinstance(kwargs[name], str):
+                values.append(kwargs[name].encode('latin-1'))
             else:
-                list.append(kwargs[name])
+                values.append(kwargs[name])
             del kwargs[name]
         elif dtype in [S, STRING]:
-            list.append('')
+            values.append(b'')
         elif dtype in (U8, S8, U16, S16, U32, S32, U64, S64):
             for i in range(dlen):
-                list.append(0)
+                values.append(0)
+        elif dtype in (FLOAT, DOUBLE):
+            for i in range(dlen):
+                values.append(0.0)
+        elif dtype == C:
+            for i in range(dlen):
+                values.append(b'\x00')
         else:
             for i in range(dlen):
-                list.append(None)
+                values.append(None)
 
     if len(kwargs.keys()) > 0:
-        print 'namedstruct.pack(): arguments not converted: %r' % kwargs.keys()
+        print('namedstruct.pack(): arguments not converted: %r' % list(kwargs.keys()))
 
-    if isinstance(format, struct.Struct):
-        return format.pack(*list)
-    else:
-        structstr = format_to_structstr(format)
-        return struct.pack(structstr, *list)
+    return values
+
+# FIXME: add alignment flag in a proper way
+def pack(format, **kwargs):
+    structstr = format_to_structstr(format)
+    return struct.pack(structstr, *_pack_values(format, kwargs))
 
 def calcsize(format, alignment='='):
     structstr = format_to_structstr(format, alignment=alignment)
@@ -151,7 +157,7 @@ class NamedStruct:
         self.size = self.struct.size
 
     def pack(self, **kwargs):
-        return pack(self.struct, **kwargs)
+        return self.struct.pack(*_pack_values(self._format, kwargs))
 
     def unpack(self, buf):
         return unpack(buf, self._format, alignment=self._alignment)
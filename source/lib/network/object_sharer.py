@@ -15,12 +15,14 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
 
+import errno
 import logging
 try:
     import cPickle as pickle
 except:
     import pickle
 import socket
+import struct
 import copy
 import random
 import inspect
@@ -34,9 +36,122 @@ import types
 PORT = 12002
 BUFSIZE = 8192
 
+# Protocol 1: 'QT', 32 bit data length, pickled data.
+# Protocol 2: 'QB', 16 bit number of buffers, 32 bit pickle length and a
+# 64 bit length for each buffer, followed by a protocol 5 pickle and the
+# raw out-of-band buffers (e.g. numpy array data).
+# Packets are sent with protocol 2 after the peer announced it in the info
+# of its root object, or sent a protocol 2 packet itself.
+if pickle.HIGHEST_PROTOCOL >= 5:
+    PROTOCOL_VERSION = 2
+else:
+    PROTOCOL_VERSION = 1
+
+_HEADER1 = struct.Struct('>2sI')
+_HEADER2 = struct.Struct('>2sHI')
+
 class RemoteException(Exception):
     pass
 
+class _PacketReader():
+    '''
+    Collects the data received on a connection and splits it into packets.
+    The body of a packet is stored in a bytearray that is allocated once
+    the header is known, and can be filled directly with recv_into().
+    '''
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._magic = None
+        self._sizes = None
+        self._body = None
+        self._nbody = 0
+
+    def _parse_header(self):
+        '''Parse a header from the buffer, returns whether it succeeded.'''
+
+        b = self._buf
+        if len(b) < _HEADER1.size:
+            return False
+
+        magic = bytes(b[:2])
+        if magic == b'QT':
+            magic, dlen = _HEADER1.unpack_from(b)
+            hlen = _HEADER1.size
+            sizes = (dlen, )
+        elif magic == b'QB':
+            if len(b) < _HEADER2.size:
+                return False
+            magic, nbuf, plen = _HEADER2.unpack_from(b)
+            hlen = _HEADER2.size + 8 * nbuf
+            if len(b) < hlen:
+                return False
+            sizes = (plen, ) + struct.unpack_from('>%dQ' % nbuf, b, _HEADER2.size)
+        else:
+            raise ValueError('Packet magic missing')
+
+        self._magic = magic
+        self._sizes = sizes
+        self._body = bytearray(sum(sizes))
+        self._nbody = 0
+        del self._buf[:hlen]
+        return True
+
+    def _pop_packet(self):
+        packet = (self._magic, self._sizes, self._body)
+        self._body = None
+        return packet
+
+    def feed(self, data):
+        '''
+        Add received data, returns a list of complete packets as tuples
+        (magic, sizes, body).
+        '''
+
+        packets = []
+        self._buf += data
+        while True:
+            if self._body is None:
+                try:
+                    if not self._parse_header():
+                        break
+                except ValueError:
+                    logging.warning('Packet magic missing, dumping data')
+                    self._buf = bytearray()
+                    break
+
+            n = min(len(self._buf), len(self._body) - self._nbody)
+            self._body[self._nbody:self._nbody+n] = self._buf[:n]
+            del self._buf[:n]
+            self._nbody += n
+            if self._nbody < len(self._body):
+                break
+            packets.append(self._pop_packet())
+
+        return packets
+
+    def recv(self, conn):
+        '''
+        Receive data from socket conn. The remainder of a packet body is
+        received in place. Returns a list of complete packets, or None if
+        the connection was closed.
+        '''
+
+        if self._body is not None and len(self._buf) == 0:
+            view = memoryview(self._body)[self._nbody:]
+            n = conn.recv_into(view)
+            if n == 0:
+                return None
+            self._nbody += n
+            if self._nbody < len(self._body):
+                return []
+            return [self._pop_packet()]
+
+        data = conn.recv(BUFSIZE)
+        if len(data) == 0:
+            return None
+        return self.feed(data)
+
 class ObjectSharer():
     '''
     The object sharer containing both client and server functions.
@@ -65,10 +180,27 @@ class ObjectSharer():
         self._callbacks_name = {}
         self._event_callbacks = {}
 
-        # Buffers to store partly received packets
-        self._buffers = {}
+        # Readers to store partly received packets
+        self._readers = {}
         self._send_queue = {}
 
+        # Protocol version used to send to each connection
+        self._max_protocol = PROTOCOL_VERSION
+        self._protocols = {}
+
+    def set_max_protocol(self, version):
+        '''
+        Set the highest protocol version to use (and announce to new
+        connections), e.g. 1 to always send plain pickles.
+        '''
+        self._max_protocol = min(version, PROTOCOL_VERSION)
+
+    def get_max_protocol(self):
+        return self._max_protocol
+
+    def _set_protocol(self, conn, version):
+        self._protocols[conn] = min(version, self._max_protocol)
+
     def set_client_timeout(self, timeout):
         '''
         Set time to wait for client interaction after connection.
@@ -84,6 +216,7 @@ class ObjectSharer():
         if info is None:
             logging.warning('Unable to get client root object')
             return None
+        self._set_protocol(conn, info.get('protocol', 1))
         client = ObjectProxy(conn, info)
         self._clients.append(client)
         name = client.get_instance_name()
@@ -130,6 +263,10 @@ class ObjectSharer():
 
         if conn in self._send_queue:
             del self._send_queue[conn]
+        if conn in self._readers:
+            del self._readers[conn]
+        if conn in self._protocols:
+            del self._protocols[conn]
 
     def get_clients(self):
         return self._clients
@@ -154,7 +291,7 @@ class ObjectSharer():
                 logging.info('Object with name %s exists, replacing', objname)
 
         self._objects[objname] = object
-        if objname is not 'root':
+        if objname != 'root':
             self._objects['root'].emit('object-added', objname)
 
         return True
@@ -199,7 +336,7 @@ class ObjectSharer():
             objname = parts[1]
 
         # Cached names of objects on remote clients
-        for client, object_names in self._client_cache.iteritems():
+        for client, object_names in self._client_cache.items():
 
             # Request from any client or specific one
             if hostname is not None and hostname != client.get_instance_name():
@@ -257,63 +394,99 @@ class ObjectSharer():
 
         return self.find_remote_object(objname)
 
-    def _pickle_packet(self, info, data):
+    def _pickle_packet(self, info, data, conn=None):
+        '''
+        Pickle a packet for connection conn. Returns a tuple with the
+        pickled data and a list of out-of-band buffers, or None if the
+        connection uses protocol 1.
+        '''
+
+        if self._protocols.get(conn, 1) < 2:
+            try:
+                retdata = pickle.dumps((info, data))
+            except Exception as e:
+                msg = 'Unable to encode object: %s' % str(e)
+                retdata = pickle.dumps((info, msg))
+            return retdata, None
+
+        buffers = []
         try:
-            retdata = pickle.dumps((info, data))
+            retdata = pickle.dumps((info, data), protocol=5,
+                    buffer_callback=lambda b: buffers.append(b.raw()))
         except Exception as e:
             msg = 'Unable to encode object: %s' % str(e)
-            retdata = pickle.dumps((info, msg))
-        return retdata
+            retdata = pickle.dumps((info, msg), protocol=5)
+            buffers = []
+
+        if len(buffers) > 0xffff:
+            retdata = pickle.dumps((info, data), protocol=5)
+            buffers = []
+        return retdata, buffers
 
-    def _unpickle_packet(self, data):
+    def _unpickle_packet(self, magic, sizes, body):
         try:
-            return pickle.loads(data)
+            if magic == b'QT':
+                return pickle.loads(body)
+
+            view = memoryview(body)
+            ofs = sizes[0]
+            buffers = []
+            for size in sizes[1:]:
+                buffers.append(view[ofs:ofs+size])
+                ofs += size
+            return pickle.loads(view[:sizes[0]], buffers=buffers)
         except Exception as e:
-            logging.warning('Unable to decode object: %s [%r]', str(e), data)
+            logging.warning('Unable to decode object: %s', str(e))
             raise e
 
     def _send_return(self, conn, callid, retval):
         logging.debug('Returning for call %d: %r', callid, retval)
         retinfo = ('return', callid)
-        retdata = self._pickle_packet(retinfo, retval)
-        self.send_packet(conn, retdata)
+        retdata, buffers = self._pickle_packet(retinfo, retval, conn)
+        self.send_packet(conn, retdata, buffers)
 
-    def handle_data(self, conn, data):
-        '''
-        Handle incoming data from a connection and produce packets in the
-        packet queue. If a response is not expected, process the packet
-        immediately.
-        '''
+    def _handle_packets(self, conn, packets):
+        for magic, sizes, body in packets:
+            if magic == b'QB' and conn not in self._protocols:
+                self._set_protocol(conn, 2)
 
-        if conn not in self._buffers:
-            self._buffers[conn] = ''
+            try:
+                packet = self._unpickle_packet(magic, sizes, body)
+            except Exception as e:
+                logging.warning('Unable to unpickle packet')
+                continue
 
-        self._buffers[conn] = self._buffers[conn] + data
+            self.handle_packet(conn, packet)
 
-        # Decode complete packets
-        while len(self._buffers[conn]) >= 6:
-            b = self._buffers[conn]
+    def _get_reader(self, conn):
+        reader = self._readers.get(conn)
+        if reader is None:
+            reader = self._readers[conn] = _PacketReader()
+        return reader
 
-            if b[0] != 'Q' or b[1] != 'T':
-                self._buffers[conn] = ''
-                logging.warning('Packet magic missing, dumping data')
-                return None
+    def handle_data(self, conn, data):
+        '''
+        Handle incoming data from a connection and process the complete
+        packets.
+        '''
 
-            datalen = (ord(b[2]) << 24) + (ord(b[3]) << 16) + (ord(b[4]) << 8)  + ord(b[5])
-            if len(b) < datalen + 6:
-                logging.debug('Incomplete packet received')
-                return None
+        packets = self._get_reader(conn).feed(data)
+        self._handle_packets(conn, packets)
 
-            packet = b[6:6+datalen]
-            self._buffers[conn] = b[6+datalen:]
+    def receive(self, conn):
+        '''
+        Receive data from connection conn and process the complete packets.
+        Large packets are received directly into their final buffer.
+        Returns False if the connection was closed.
+        '''
 
-            try:
-                packet = self._unpickle_packet(packet)
-            except Exception as e:
-                logging.warning('Unable to unpickle packet')
-                return
+        packets = self._get_reader(conn).recv(conn)
+        if packets is None:
+            self._client_disconnected(conn)
+            return False
 
-            self.handle_packet(conn, packet)
+        self._handle_packets(conn, packets)
+        return True
 
     def handle_packet(self, conn, packet):
         '''
@@ -333,7 +506,7 @@ class ObjectSharer():
             func = self._return_cbs[callid]
             del self._return_cbs[callid]
 
-            if type(callinfo) == types.StringType and callinfo.startswith('sharedname:'):
+            if isinstance(callinfo, str) and callinfo.startswith('sharedname:'):
                 sn = callinfo[11:]
                 logging.debug('Received shared object reference, finding %s', sn)
                 callinfo = helper.find_object(sn)
@@ -378,7 +551,7 @@ class ObjectSharer():
         try:
             ret = conn.send(data)
         except socket.error as e:
-            if e.errno not in (10035, ):
+            if e.errno not in (10035, errno.EAGAIN, errno.EWOULDBLOCK):
                 logging.warning('Send exception (%s), assuming client disconnected', e)
                 self._client_disconnected(conn)
                 return -1
@@ -391,7 +564,7 @@ class ObjectSharer():
         Process send queue on a per connection basis.
         '''
 
-        for conn in self._send_queue.keys():
+        for conn in list(self._send_queue.keys()):
             datalist = self._send_queue[conn]
             while len(datalist) > 0:
                 nsent = self._do_send_raw(conn, datalist[0])
@@ -406,14 +579,21 @@ class ObjectSharer():
                         del self._send_queue[conn]
                     break
 
-                # Partially sent
+                # Partially sent, keep going until the socket is full
                 else:
                     datalist[0] = datalist[0][nsent:]
-                    break
+                    if nsent == 0:
+                        break
 
         return True
 
-    def send_packet(self, conn, data):
+    def send_packet(self, conn, data, buffers=None):
+        '''
+        Send pickled data through connection conn. If buffers is not None
+        a protocol 2 packet is sent, with the buffers as out-of-band data.
+        The buffers are not copied.
+        '''
+
         dlen = len(data)
         #if dlen > 0xffffffffL: - doesn't work in python3
         if dlen > 0xffffffff:
@@ -421,13 +601,26 @@ class ObjectSharer():
             logging.error('Trying to send too long packet: %d', dlen)
             return -1
 
-        tosend = 'QT%c%c%c%c' % ((dlen&0xff000000)>>24, \
-            (dlen&0x00ff0000)>>16, (dlen&0x0000ff00)>>8, (dlen&0x000000ff))
-        tosend += data
+        if buffers is None:
+            header = _HEADER1.pack(b'QT', dlen)
+            buffers = []
+        else:
+            buffers = [memoryview(b) for b in buffers]
+            sizes = [b.nbytes for b in buffers]
+            header = _HEADER2.pack(b'QB', len(buffers), dlen) + \
+                struct.pack('>%dQ' % len(sizes), *sizes)
+
+        # Small packets are sent in one piece to avoid delays by Nagle's
+        # algorithm, large buffers are sent without copying.
+        tosend = [header, data] + buffers
+        if sum(len(d) for d in tosend) < 8 * BUFSIZE:
+            tosend = [b''.join(tosend)]
+        elif dlen < BUFSIZE:
+            tosend = [header + data] + buffers
 
         if conn not in self._send_queue:
             self._send_queue[conn] = []
-        self._send_queue[conn].append(tosend)
+        self._send_queue[conn].extend(memoryview(d) for d in tosend)
         self._process_send_queue()
 
     def _call_cb(self, callid, val):
@@ -463,9 +656,9 @@ class ObjectSharer():
         logging.debug('Calling %s.%s(%r, %r), info=%r, blocking=%r', objname, funcname, args, kwargs, info, blocking)
 
         callinfo = (objname, funcname, args, kwargs)
-        cmd = self._pickle_packet(info, callinfo)
+        cmd, buffers = self._pickle_packet(info, callinfo, conn)
         start_time = time.time()
-        self.send_packet(conn, cmd)
+        self.send_packet(conn, cmd, buffers)
 
         if not blocking:
             return
@@ -480,16 +673,14 @@ class ObjectSharer():
             lists = select.select([conn], [], [], 0.1)
             if len(lists[0]) > 0:
                 try:
-                    data = conn.recv(BUFSIZE)
-                except:
+                    connected = self.receive(conn)
+                except socket.error:
                     # Cope with strange windows errors?
                     time.sleep(0.002)
                     continue
 
-                if len(data) == 0:
-                    self._client_disconnected(conn)
+                if not connected:
                     return
-                self.handle_data(conn, data)
             else:
                 time.sleep(0.002)
 
@@ -532,7 +723,7 @@ class ObjectSharer():
         if hid in self._callbacks_hid:
             del self._callbacks_hid[hid]
 
-        for name, info_list in self._callbacks_name.iteritems():
+        for name, info_list in self._callbacks_name.items():
             for index, info in enumerate(info_list):
                 if info['hid'] == hid:
                     del self._callbacks_name[name][index]
@@ -797,6 +988,7 @@ class RootObject(SharedObject):
             'name': objname,
             'properties': props,
             'functions': funcs,
+            'protocol': helper.get_max_protocol(),
         }
         return info
 
@@ -804,7 +996,7 @@ class RootObject(SharedObject):
         helper.receive_signal(objname, signame, *args, **kwargs)
 
     def list_objects(self):
-        return self._objects.keys()
+        return list(self._objects.keys())
 
     @cache_result
     def get_id(self):
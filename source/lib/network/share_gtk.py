@@ -17,6 +17,18 @@ class Handler(tcpservergtk.GlibTCPHandler):
                 packet_len=True)
         self.client = objsh.helper.add_client(self.socket, self)
 
+    def _handle_recv(self, sock, number):
+        # Let the object sharer receive large packets in place
+        try:
+            connected = objsh.helper.receive(sock)
+        except socket.error:
+            return True
+
+        if not connected:
+            self._handle_hup()
+            return False
+        return True
+
     def handle(self, data):
         if len(data) > 0:
             data = objsh.helper.handle_data(self.socket, data)
@@ -0,0 +1,307 @@
+# poller.py, central scheduler to poll instrument parameters
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import logging
+import threading
+import time
+
+import qt
+from lib.network.object_sharer import SharedObject
+
+
+class Poller(SharedObject):
+    '''
+    Poll instrument parameters periodically in a background thread and
+    pass the values to the subscribers.
+
+    The poller is shared as 'poller', so clients can subscribe and fetch
+    the values with get_values().
+
+    Each parameter is polled at the shortest interval requested by its
+    subscribers, so adding subscribers does not add instrument reads.
+    Parameters of one instrument that are due at about the same time are
+    read with a single get([...]) call. While a measurement is running
+    polls are skipped, unless a subscriber asked for while_measuring=True.
+    '''
+
+    # Parameters due within this fraction of their interval are read
+    # together with other parameters of the same instrument.
+    COALESCE = 0.25
+
+    def __init__(self):
+        SharedObject.__init__(self, 'poller', replace=True)
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._running = False
+
+        self._last_sid = 0
+        self._subscriptions = {}
+        self._params = {}
+        self._stats = {'gets': 0, 'values': 0, 'skipped': 0, 'errors': 0}
+
+    def subscribe(self, ins, param, interval, callback=None,
+                  while_measuring=False):
+        '''
+        Poll a parameter every 'interval' seconds.
+
+        Input:
+            ins (Instrument or string): instrument or instrument name
+            param (string): parameter name
+            interval (float): time between polls in seconds
+            callback (function): called as callback(insname, param, value)
+                from the polling thread for every new value. If None the
+                values are only available from get_values().
+            while_measuring (bool): keep polling while a measurement runs
+
+        Output:
+            subscription id, to be used with unsubscribe()
+        '''
+
+        if interval <= 0:
+            raise ValueError('Polling interval should be positive')
+        if not isinstance(ins, str):
+            ins = ins.get_name()
+
+        with self._lock:
+            self._last_sid += 1
+            sid = self._last_sid
+            key = (ins, param)
+            self._subscriptions[sid] = {
+                'key': key,
+                'interval': float(interval),
+                'callback': callback,
+                'while_measuring': while_measuring,
+            }
+            if key not in self._params:
+                self._params[key] = {
+                    'sids': set(),
+                    'next': time.time(),
+                    'value': None,
+                    'time': None,
+                }
+            self._params[key]['sids'].add(sid)
+            self._update_param(key)
+            self.start()
+
+        self._wake.set()
+        return sid
+
+    def unsubscribe(self, sid):
+        '''
+        Remove subscription 'sid'. A parameter is no longer polled when its
+        last subscription is removed.
+
+        Output: True if the subscription existed
+        '''
+
+        with self._lock:
+            if sid not in self._subscriptions:
+                return False
+            key = self._subscriptions.pop(sid)['key']
+            entry = self._params[key]
+            entry['sids'].discard(sid)
+            if len(entry['sids']) == 0:
+                del self._params[key]
+            else:
+                self._update_param(key)
+            return True
+
+    def set_interval(self, sid, interval):
+        '''
+        Change the polling interval of subscription 'sid' (in seconds).
+        '''
+
+        if interval <= 0:
+            raise ValueError('Polling interval should be positive')
+        with self._lock:
+            if sid not in self._subscriptions:
+                return False
+            sub = self._subscriptions[sid]
+            sub['interval'] = float(interval)
+            self._update_param(sub['key'])
+
+        self._wake.set()
+        return True
+
+    def get_values(self, names=None):
+        '''
+        Return the last polled values without accessing the instruments.
+
+        Input:
+            names (list): names as 'instrument.parameter', default all
+                polled parameters
+        Output:
+            dictionary of 'instrument.parameter' -> (time, value) for the
+            parameters that have been polled
+        '''
+
+        ret = {}
+        with self._lock:
+            for (ins, param), entry in self._params.items():
+                name = '%s.%s' % (ins, param)
+                if entry['time'] is None:
+                    continue
+                if names is None or name in names:
+                    ret[name] = (entry['time'], entry['value'])
+        return ret
+
+    def get_stats(self):
+        '''
+        Return dictionary with the number of get() calls, values read,
+        polls skipped during measurements and failed gets.
+        '''
+        with self._lock:
+            return dict(self._stats)
+
+    def start(self):
+        '''Start the polling thread, if it is not running.'''
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='poller')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def stop(self):
+        '''Stop the polling thread; subscriptions are kept.'''
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            thread = self._thread
+            self._thread = None
+
+        self._wake.set()
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _update_param(self, key):
+        entry = self._params[key]
+        subs = [self._subscriptions[sid] for sid in entry['sids']]
+        entry['interval'] = min(sub['interval'] for sub in subs)
+        entry['while_measuring'] = any(sub['while_measuring'] for sub in subs)
+        entry['next'] = min(entry['next'], time.time() + entry['interval'])
+
+    def _run(self):
+        while True:
+            self._wake.clear()
+            with self._lock:
+                if not self._running:
+                    return
+                if len(self._params) > 0:
+                    wait = min(e['next'] for e in self._params.values())
+                    wait -= time.time()
+                else:
+                    wait = None
+
+            if wait is None or wait > 0:
+                self._wake.wait(wait)
+                continue
+
+            try:
+                self._poll_due()
+            except Exception as e:
+                logging.error('Poller: %s', e)
+
+    def _poll_due(self):
+        '''
+        Read all parameters that are due, one get() call per instrument.
+        '''
+
+        now = time.time()
+        measuring = qt.flow.is_measuring()
+
+        batches = {}
+        with self._lock:
+            due = set([ins for (ins, param), entry in self._params.items()
+                if entry['next'] <= now])
+            for (ins, param), entry in self._params.items():
+                if ins not in due:
+                    continue
+                if entry['next'] > now + entry['interval'] * self.COALESCE:
+                    continue
+                entry['next'] = now + entry['interval']
+                if measuring and not entry['while_measuring']:
+                    self._stats['skipped'] += 1
+                    continue
+                batches.setdefault(ins, []).append(param)
+
+        for insname, params in batches.items():
+            ins = qt.instruments.get(insname, proxy=False)
+            if ins is None:
+                continue
+
+            # Skip instead of waiting when a ramp or another thread is
+            # using the instrument, so one busy instrument does not delay
+            # all other polls. The lock is reentrant, get() can take it too.
+            lock = ins._access_lock
+            if not lock.acquire(blocking=False):
+                logging.warning('Poller: %s busy, poll skipped', insname)
+                with self._lock:
+                    self._stats['skipped'] += 1
+                continue
+
+            try:
+                if len(params) == 1:
+                    values = {params[0]: ins.get(params[0])}
+                else:
+                    values = ins.get(params)
+            except Exception as e:
+                logging.warning('Poller: failed to get %s %s: %s',
+                                insname, params, e)
+                with self._lock:
+                    self._stats['errors'] += 1
+                continue
+            finally:
+                lock.release()
+
+            calls = []
+            with self._lock:
+                self._stats['gets'] += 1
+                t = time.time()
+                for param, value in values.items():
+                    entry = self._params.get((insname, param))
+                    if entry is None:
+                        continue
+                    entry['value'] = value
+                    entry['time'] = t
+                    self._stats['values'] += 1
+                    for sid in entry['sids']:
+                        callback = self._subscriptions[sid]['callback']
+                        if callback is not None:
+                            calls.append((callback, param, value))
+
+            for callback, param, value in calls:
+                try:
+                    callback(insname, param, value)
+                except Exception as e:
+                    logging.warning('Poller: callback failed: %s', e)
+
+
+try:
+    _poller
+except NameError:
+    _poller = None
+
+
+def get_poller():
+    '''Return the Poller instance shared by the whole environment.'''
+    global _poller
+    if _poller is None:
+        _poller = Poller()
+    return _poller
@@ -0,0 +1,276 @@
+# ramp.py, run parameter ramps in the background
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import asyncio
+import heapq
+import logging
+import math
+import threading
+import time
+
+class RampTask():
+    '''
+    A ramp of a single parameter, in steps of at most 'maxstep' with a delay
+    of 'stepdelay' ms between steps. Created by Instrument.ramp() and
+    executed by the RampEngine.
+    '''
+
+    def __init__(self, name, func, start, stop, maxstep=None, stepdelay=50,
+                 step_cb=None, done_cb=None, kwargs=None, key=None,
+                 lock=None):
+        '''
+        Input:
+            name (string): name for log messages
+            func (function): called as func(value, **kwargs) for each step
+            start: current value
+            stop: final value
+            maxstep (float): maximum step size, None for a single step
+            stepdelay (float): delay between steps in ms
+            step_cb (function): called with the value after each step
+            done_cb (function): called with the final value when finished
+            kwargs (dict): extra arguments for func
+            key: ramps with the same key replace each other
+            lock: held while calling func, e.g. the instrument access lock
+        '''
+
+        self._name = name
+        self._func = func
+        self._stop = stop
+        self._maxstep = maxstep
+        self._delay = stepdelay / 1000.0
+        self._step_cb = step_cb
+        self._done_cb = done_cb
+        self._kwargs = kwargs or {}
+        self.key = key
+        self._lock = lock
+
+        self._curval = start
+        if self._maxstep is None:
+            self._delta = None
+        else:
+            self._delta = start - stop
+
+        self._done = threading.Event()
+        self._aborted = False
+        self._error = None
+
+    def __repr__(self):
+        return 'RampTask %s: %s -> %s' % (self._name, self._curval, self._stop)
+
+    def _step(self):
+        '''
+        Perform the next step. Returns the time to wait before the next step
+        in seconds, or None if the ramp is finished.
+        '''
+
+        if self._delta is None:
+            curval, delta = self._stop, 0
+        elif math.fabs(self._delta) > self._maxstep:
+            sign = 1 if self._delta < 0 else -1
+            curval = self._curval + sign * self._maxstep
+            delta = self._delta + sign * self._maxstep
+        else:
+            curval, delta = self._stop, 0
+
+        # Already at the final value: no steps, like the blocking version
+        if self._delta != 0:
+            if self._lock is not None and not self._lock.acquire():
+                logging.warning('Ramp %s: instrument busy, retrying',
+                        self._name)
+                return self._delay
+            try:
+                self._func(curval, **self._kwargs)
+            finally:
+                if self._lock is not None:
+                    self._lock.release()
+        self._curval, self._delta = curval, delta
+        if self._step_cb is not None:
+            self._step_cb(curval)
+
+        if delta != 0:
+            return self._delay
+
+        if self._done_cb is not None:
+            self._done_cb(curval)
+        self._done.set()
+        return None
+
+    def run_step(self):
+        '''Run a step, catching errors. Used by the RampEngine.'''
+        try:
+            return self._step()
+        except Exception as e:
+            logging.error('Ramp %s failed: %s', self._name, e)
+            self._error = e
+            self._done.set()
+            return None
+
+    def abort(self):
+        '''Stop the ramp after the current step.'''
+        if not self._done.is_set():
+            logging.info('Aborting ramp %s at %s', self._name, self._curval)
+            self._aborted = True
+            self._done.set()
+
+    def is_done(self):
+        '''Return whether the ramp finished, failed or was aborted.'''
+        return self._done.is_set()
+
+    def is_aborted(self):
+        return self._aborted
+
+    def get_value(self):
+        '''Return the last value that was set.'''
+        return self._curval
+
+    def join(self, timeout=None):
+        '''
+        Block until the ramp is done, or timeout seconds have passed.
+        Returns whether the ramp is done.
+        '''
+        return self._done.wait(timeout)
+
+    def wait(self, interval=0.01):
+        '''
+        Wait for the ramp to finish while handling events through qt.msleep.
+        If an abort is requested (qt.flow.check_abort), the ramp is aborted
+        as well. Returns the final value.
+        '''
+
+        import qt
+        try:
+            while not self._done.is_set():
+                qt.msleep(interval)
+        except:
+            self.abort()
+            raise
+
+        if self._error is not None:
+            raise self._error
+        return self._curval
+
+    def __await__(self):
+        while not self._done.is_set():
+            yield from asyncio.sleep(0.01).__await__()
+        if self._error is not None:
+            raise self._error
+        return self._curval
+
+class RampEngine():
+    '''
+    Execute RampTasks in a background thread. Steps of different ramps are
+    scheduled by time, so ramps on several instruments run at the same time,
+    each with its own step size and delay.
+    '''
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queue = []
+        self._counter = 0
+        self._active = {}
+        self._current = None
+        self._thread = None
+
+    def _push(self, task, t):
+        self._counter += 1
+        heapq.heappush(self._queue, (t, self._counter, task))
+
+    def start(self, task):
+        '''
+        Schedule a RampTask; a running ramp with the same key is aborted.
+        Returns the task.
+        '''
+
+        with self._cond:
+            if task.key is not None:
+                old = self._active.get(task.key)
+                if old is not None:
+                    old.abort()
+                self._active[task.key] = task
+
+            self._push(task, time.time())
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run,
+                        name='RampEngine')
+                self._thread.daemon = True
+                self._thread.start()
+            self._cond.notify()
+
+        return task
+
+    def abort_all(self):
+        '''Abort all running ramps, including the one taking a step.'''
+        with self._cond:
+            for t, i, task in self._queue:
+                task.abort()
+            if self._current is not None:
+                self._current.abort()
+
+    def get_active(self):
+        '''Return the ramps that are not done yet.'''
+        with self._cond:
+            tasks = [task for t, i, task in self._queue]
+            if self._current is not None:
+                tasks.append(self._current)
+            return [task for task in tasks if not task.is_done()]
+
+    def uses_lock(self, lock):
+        '''Return whether a ramp that is not done yet holds 'lock' in steps.'''
+        return any(task._lock is lock for task in self.get_active())
+
+    def _abort_requested(self):
+        try:
+            import qt
+            return qt.flow.is_abort_requested()
+        except Exception:
+            return False
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while len(self._queue) == 0:
+                    self._cond.wait()
+
+                t, i, task = self._queue[0]
+                dt = t - time.time()
+                if dt > 0:
+                    self._cond.wait(dt)
+                    continue
+                heapq.heappop(self._queue)
+                self._current = task
+
+            if not task.is_done() and self._abort_requested():
+                task.abort()
+
+            delay = None
+            if not task.is_done():
+                delay = task.run_step()
+
+            with self._cond:
+                self._current = None
+                if delay is not None:
+                    self._push(task, time.time() + delay)
+                elif self._active.get(task.key) is task:
+                    del self._active[task.key]
+
+try:
+    _ramp_engine
+except NameError:
+    _ramp_engine = RampEngine()
+
+def get_ramp_engine():
+    global _ramp_engine
+    return _ramp_engine
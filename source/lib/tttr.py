@@ -0,0 +1,268 @@
+# tttr.py, live processing of time-tagged (TTTR) photon records
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin St, Fifth Floor, Boston, MA  02110-1301  USA
+
+import logging
+import threading
+import time
+
+import numpy as np
+
+from lib.file_support.picoharp import decode_t2, decode_t3
+
+MODE_T2 = 2
+MODE_T3 = 3
+
+class RingBuffer():
+    '''
+    Fixed-size ring buffer of uint32 records, written by one thread and
+    read by another. If the reader falls behind, new records are dropped
+    and counted, so the writer never blocks.
+    '''
+
+    def __init__(self, size):
+        self._buf = np.zeros(size, dtype=np.uint32)
+        self._size = size
+        self._start = 0
+        self._count = 0
+        self._dropped = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def write(self, records):
+        '''Append records; returns the number of records stored.'''
+
+        records = np.asarray(records).view(np.uint32)
+        with self._cond:
+            n = min(len(records), self._size - self._count)
+            if n < len(records):
+                self._dropped += len(records) - n
+            end = (self._start + self._count) % self._size
+            first = min(n, self._size - end)
+            self._buf[end:end+first] = records[:first]
+            self._buf[:n-first] = records[first:n]
+            self._count += n
+            self._cond.notify()
+        return n
+
+    def read(self, maxcount, timeout=None):
+        '''
+        Remove and return up to maxcount records, waiting at most timeout
+        seconds for data. Returns an empty array on timeout or when the
+        buffer is closed and empty.
+        '''
+
+        with self._cond:
+            if self._count == 0 and not self._closed:
+                self._cond.wait(timeout)
+            n = min(maxcount, self._count)
+            first = min(n, self._size - self._start)
+            ret = np.concatenate((self._buf[self._start:self._start+first],
+                    self._buf[:n-first]))
+            self._start = (self._start + n) % self._size
+            self._count -= n
+            return ret
+
+    def close(self):
+        '''Signal that no more data will be written.'''
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def is_closed(self):
+        return self._closed
+
+    def __len__(self):
+        return self._count
+
+    def get_dropped(self):
+        return self._dropped
+
+class Histogrammer():
+    '''
+    Incrementally build a lifetime histogram (T3 mode) and a g2 cross-
+    correlation histogram between two channels from decoded records.
+
+    Times are handled in integer ps. In T2 mode the g2 is calculated
+    between channels 0 and 1, in T3 mode between routing channels 1 and 2.
+    '''
+
+    def __init__(self, mode, binwidth=1000, nbins=1001,
+            sync_period=0, resolution=4, channels=None):
+        '''
+        Input:
+            mode (int): MODE_T2 or MODE_T3
+            binwidth (int): g2 bin width in ps
+            nbins (int): number of g2 bins, centered around zero delay
+            sync_period (int): sync period in ps (T3 mode)
+            resolution (int): dtime resolution in ps (T3 mode)
+            channels (tuple): the two channels to correlate
+        '''
+
+        self._mode = mode
+        self._binwidth = int(binwidth)
+        self._nbins = int(nbins)
+        self._range = self._nbins * self._binwidth // 2
+        self._sync_period = int(sync_period)
+        self._resolution = int(resolution)
+        if channels is None:
+            channels = (0, 1) if mode == MODE_T2 else (1, 2)
+        self._channels = channels
+
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._ofl = 0
+            self._lifetime = np.zeros(4096, dtype=np.int64)
+            self._g2 = np.zeros(self._nbins, dtype=np.int64)
+            self._tails = [np.zeros(0, dtype=np.int64)] * 2
+            self._nrecords = 0
+
+    def _correlate(self, ta, tb):
+        '''Histogram tb - ta for all pairs within the g2 range.'''
+
+        if len(ta) == 0 or len(tb) == 0:
+            return
+        lo = np.searchsorted(tb, ta - self._range)
+        hi = np.searchsorted(tb, ta + self._range)
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            return
+
+        # Index pairs (a, b) for all b in [lo[a], hi[a])
+        ia = np.repeat(np.arange(len(ta)), counts)
+        ib = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        ib += np.repeat(lo, counts)
+        bins = (tb[ib] - ta[ia] + self._range) // self._binwidth
+        bins = bins[(bins >= 0) & (bins < self._nbins)]
+        self._g2 += np.bincount(bins, minlength=self._nbins)
+
+    def process(self, records):
+        '''Decode a block of raw records and update the histograms.'''
+
+        with self._lock:
+            if self._mode == MODE_T2:
+                chans, times, self._ofl = decode_t2(records, self._ofl)
+                times *= 4
+            else:
+                chans, nsync, dtime, self._ofl = decode_t3(records, self._ofl)
+                photons = (chans != 15)
+                self._lifetime += np.bincount(dtime[photons], minlength=4096)
+                times = nsync * self._sync_period + dtime * self._resolution
+            self._nrecords += len(chans)
+            if len(times) == 0:
+                return
+
+            # New events are correlated with the new and remaining old
+            # events of the other channel; old pairs were already counted.
+            new = [times[chans == ch] for ch in self._channels]
+            if self._mode == MODE_T3:
+                new = [np.sort(t) for t in new]
+            both = [np.concatenate((old, t)) for old, t in zip(self._tails, new)]
+            self._correlate(new[0], both[1])
+            self._correlate(self._tails[0], new[1])
+
+            tmin = times.max() - self._range
+            self._tails = [t[t >= tmin] for t in both]
+
+    def get_lifetime(self):
+        with self._lock:
+            return self._lifetime.copy()
+
+    def get_g2(self):
+        with self._lock:
+            return self._g2.copy()
+
+    def get_g2_delays(self):
+        '''Return the bin centers of the g2 histogram in ps.'''
+        return (np.arange(self._nbins) + 0.5) * self._binwidth - self._range
+
+    def get_nrecords(self):
+        return self._nrecords
+
+class Acquisition():
+    '''
+    Run a TTTR measurement: a reader thread drains the device FIFO into a
+    RingBuffer, a consumer thread feeds the records to a Histogrammer.
+
+    The device should provide tt_read_data(count), get_status() and
+    get_flags(), like picoquant_ph.PHDevice.
+    '''
+
+    def __init__(self, dev, histogrammer, bufsize=1<<24, readsize=131072):
+        self._dev = dev
+        self._hist = histogrammer
+        self._ring = RingBuffer(bufsize)
+        self._readsize = readsize
+        self._stop = threading.Event()
+        self._threads = []
+        self._fifo_overflow = False
+
+    def start(self):
+        self._threads = [
+            threading.Thread(target=self._read_loop, name='TTTRReader'),
+            threading.Thread(target=self._process_loop, name='TTTRConsumer'),
+        ]
+        for t in self._threads:
+            t.daemon = True
+            t.start()
+
+    def _read_loop(self):
+        try:
+            while not self._stop.is_set():
+                data = self._dev.tt_read_data(self._readsize)
+                if len(data) > 0:
+                    self._ring.write(data)
+                if self._dev.get_flags() & 0x0003 and not self._fifo_overflow:
+                    logging.warning('TTTR FIFO overflow, records lost')
+                    self._fifo_overflow = True
+                if len(data) < self._readsize:
+                    if self._dev.get_status() > 0:
+                        break
+                    time.sleep(0.01)
+        except Exception as e:
+            logging.error('TTTR reading failed: %s', e)
+        finally:
+            self._ring.close()
+
+    def _process_loop(self):
+        while True:
+            data = self._ring.read(self._readsize, timeout=0.1)
+            if len(data) > 0:
+                self._hist.process(data)
+            elif self._ring.is_closed() and len(self._ring) == 0:
+                break
+
+        if self._ring.get_dropped() > 0:
+            logging.warning('TTTR ring buffer full, %d records dropped',
+                    self._ring.get_dropped())
+
+    def stop(self):
+        '''Stop reading and wait for the queued records to be processed.'''
+        self._stop.set()
+        self.join()
+
+    def join(self, timeout=None):
+        for t in self._threads:
+            t.join(timeout)
+
+    def is_running(self):
+        return any(t.is_alive() for t in self._threads)
+
+    def get_dropped(self):
+        return self._ring.get_dropped()
@@ -21,6 +21,7 @@ import sys
 import logging
 import socket
 import select
+import threading
 
 try:
     from pyvisa import SerialInstrument
@@ -32,6 +33,9 @@ _drivers = (
     'prologix_ethernet'
 )
 
+_resource_managers = {}
+_rm_lock = threading.Lock()
+
 def set_visa(name):
     if name not in _drivers:
         raise ValueError('Unknown VISA provider: %s', name)
@@ -49,18 +53,29 @@ def set_visa(name):
         print(e)
     '''
     
-    if name == "pyvisa":
-            #from pyvisa import visa as module
-            import visa as module
-    else:
-            module = __import__(name)
     global instrument
     #instrument = module.instrument
-    rm = module.ResourceManager()
+    rm = get_resource_manager(name)
     #instrument = rm.get_instrument()
-    
-    
-    
+
+def get_resource_manager(name='pyvisa'):
+    '''
+    Return the ResourceManager of VISA provider 'name'. It is created on
+    first use and shared by all instruments, opening a new one for every
+    instrument is slow.
+    '''
+    if name not in _drivers:
+        raise ValueError('Unknown VISA provider: %s', name)
+
+    with _rm_lock:
+        if name not in _resource_managers:
+            if name == "pyvisa":
+                import visa as module
+            else:
+                module = __import__(name)
+            _resource_managers[name] = module.ResourceManager()
+        return _resource_managers[name]
+
 set_visa('pyvisa')
 
 class TcpIpInstrument:
@@ -59,6 +59,106 @@ class _GnuPlotList(NamedList):
 
         return item
 
+class _DatablockFeed():
+    '''
+    Keeps a gnuplot datablock up to date with the columns of a Data object
+    that are used in a plot. New rows are appended with 'print' commands,
+    so an update costs time proportional to the number of new points
+    instead of the size of the data file. Once the rows that are no longer
+    shown (because of maxtraces / maxpoints) outnumber the ones that are,
+    the datablock is rebuilt from the visible part only.
+    '''
+
+    _counter = 0
+
+    def __init__(self, data, columns):
+        _DatablockFeed._counter += 1
+        self.name = '$qtdata%d' % _DatablockFeed._counter
+        self._data = data
+        self._columns = list(columns)
+        self._fmt = '\t'.join(['%.10g'] * len(self._columns))
+        self.invalidate()
+
+    def invalidate(self):
+        '''Rebuild the datablock on the next update.'''
+        self._start = None
+        self._startblock = 0
+        self._block = 0
+        self._npoints = 0
+
+    def get_start(self):
+        '''
+        Return (first block, offset of first point within that block) of
+        the data in the datablock.
+        '''
+        return self._startblock, self._start - self._block_start
+
+    def _format_rows(self, data, ends, pos, stop):
+        '''
+        Format rows pos..stop of data, with empty lines at block ends.
+        Returns a list of lines and updates the current block.
+        '''
+
+        lines = []
+        fmt = self._fmt
+        while True:
+            if self._block < len(ends):
+                end = min(ends[self._block], stop)
+            else:
+                end = stop
+            rows = data[pos:end, self._columns].tolist()
+            lines.extend([fmt % tuple(row) for row in rows])
+            pos = end
+            if self._block < len(ends) and pos == ends[self._block]:
+                lines.append('')
+                self._block += 1
+            else:
+                return lines
+
+    def update(self, startblock, startpoint):
+        '''
+        Return the gnuplot commands to bring the datablock up to date. The
+        plot will show blocks from 'startblock' and points from
+        'startpoint' within the last block if that is the only one shown.
+        '''
+
+        data = self._data.get_data()
+        npoints = self._data.get_npoints()
+        nblocks = self._data.get_nblocks_complete()
+        sizes = [self._data.get_block_size(i) for i in range(nblocks)]
+        ends = np.cumsum(sizes, dtype=int).tolist()
+        starts = [0] + ends
+
+        window = starts[startblock]
+        if startblock >= nblocks:
+            window += startpoint
+
+        rebuild = self._start is None or npoints < self._npoints or \
+            window < self._start or \
+            window - self._start > npoints - window
+
+        if rebuild:
+            self._start = window
+            self._startblock = startblock
+            self._block_start = starts[startblock]
+            self._block = startblock
+            lines = self._format_rows(data, ends, window, npoints)
+            cmd = '%s << EOD\n' % self.name
+            if len(lines) > 0:
+                cmd += '\n'.join(lines) + '\n'
+            cmd += 'EOD\n'
+
+        else:
+            lines = self._format_rows(data, ends, self._npoints, npoints)
+            if len(lines) == 0:
+                return ''
+            cmd = 'set print %s append\n' % self.name
+            cmd += ''.join(['print "%s"\n' % line for line in lines])
+            cmd += 'set print\n'
+
+        self._npoints = npoints
+        return cmd
+
 class _QTGnuPlot():
     """
     Base class for 2D/3D QT gnuplot classes.
@@ -182,6 +282,11 @@ class _QTGnuPlot():
         return cmd
 
     def reset(self):
+        # Datablocks are lost if gnuplot was restarted
+        for datadict in self._data:
+            if 'feed' in datadict:
+                datadict['feed'].invalidate()
+
         self.cmd('reset')
         self.cmd('clear')
         self.cmd(self.get_commands())
@@ -351,12 +456,28 @@ class _QTGnuPlot():
 
     def _do_update(self):
         '''
-        Perform an update of the plot.
+        Perform an update of the plot, using datablocks for data in memory.
         '''
-        cmd = self.create_plot_command()
+        cmd = self.create_plot_command(feed=config.get('gnuplot_datablock', True))
         self.cmd(cmd)
         return True
 
+    def _get_feed(self, datadict, columns):
+        '''
+        Return the datablock feed for a data item, or None if the data
+        should be read from file.
+        '''
+
+        if 'feed' in datadict:
+            return datadict['feed']
+
+        data = datadict['data']
+        if not data.is_inmem() or datadict.get('binary', False):
+            return None
+
+        datadict['feed'] = _DatablockFeed(data, columns)
+        return datadict['feed']
+
     def cmd(self, cmdstr):
         '''Send command to gnuplot instance directly.'''
         if self._gnuplot is not None:
@@ -546,14 +667,17 @@ class Plot2D(plot.Plot2DBase, _QTGnuPlot):
             self.set_property(k, v, update=False)
         self.set_property('style', style, update=update)
 
-    def create_plot_command(self, fullpath=True, data_entry=None):
+    def create_plot_command(self, fullpath=True, data_entry=None, feed=False):
         '''
         Create a gnuplot plot command.
         If data_entry is given only that item will be used, otherwise
         all items are included.
+        If feed is True, data kept in memory is sent to gnuplot as
+        datablocks, and the commands to update these are included.
         '''
 
         s = 'plot '
+        feedcmd = ''
         first = True
 
         if data_entry is not None:
@@ -587,15 +711,22 @@ class Plot2D(plot.Plot2DBase, _QTGnuPlot):
                 filepath = data.get_filename()
             filepath = filepath.replace('\\','/')
 
-            if len(coorddims) == 0:
-                using = '($%d+%f+%f*column(-1))' % (valdim + 1, ofs, traceofs)
-            elif len(coorddims) == 1:
-                using = '%d:($%d+%f+%f*column(-1))' % (coorddims[0] + 1, valdim + 1, ofs, traceofs)
-            else:
+            if len(coorddims) > 1:
                 logging.error('Need 0 or 1 coordinate dimensions!')
                 continue
+
+            columns = list(coorddims) + [valdim]
             if yerrdim is not None:
-                using += ':%d' % (yerrdim+1)
+                columns.append(yerrdim)
+
+            datafeed = None
+            if feed:
+                datafeed = self._get_feed(datadict, columns)
+            if datafeed is not None:
+                # Columns are numbered in the order they are sent
+                cols = list(range(1, len(columns) + 1))
+            else:
+                cols = [col + 1 for col in columns]
 
             npoints = data.get_npoints()
             if datadict.get('with', None) in ['lines']:
@@ -613,6 +744,24 @@ class Plot2D(plot.Plot2DBase, _QTGnuPlot):
 
             startpoint = max(0, npoints_last_block - self._maxpoints)
             startblock = max(0, nblocks - self._maxtraces)
+
+            # Make the block / point offsets relative to the datablock
+            if datafeed is not None:
+                feedcmd += datafeed.update(startblock, startpoint)
+                feedblock, feedpoint = datafeed.get_start()
+                ofs += traceofs * feedblock
+                startblock -= feedblock
+                if startblock == 0:
+                    startpoint = max(0, startpoint - feedpoint)
+                filepath = datafeed.name
+
+            if len(coorddims) == 0:
+                using = '($%d+%f+%f*column(-1))' % (cols[0], ofs, traceofs)
+            else:
+                using = '%d:($%d+%f+%f*column(-1))' % (cols[0], cols[1], ofs, traceofs)
+            if yerrdim is not None:
+                using += ':%d' % cols[-1]
+
             if len(coorddims) == 0:
                 every = "::%d" % (startpoint)
             else:
@@ -632,15 +781,18 @@ class Plot2D(plot.Plot2DBase, _QTGnuPlot):
             else:
                 first = False
 
-            s += '"%s" using %s every %s' % \
-                (str(filepath), using, every)
+            if datafeed is not None:
+                s += '%s using %s every %s' % (filepath, using, every)
+            else:
+                s += '"%s" using %s every %s' % \
+                    (str(filepath), using, every)
             s += self._get_trace_options(datadict)
             s += ' axes %s' % axes
 
         if first:
             return ''
         else:
-            return s
+            return feedcmd + s
 
     def save_gp(self, filepath=None, **kwargs):
         '''Save file that can be opened with gnuplot.'''
@@ -855,14 +1007,17 @@ class Plot3D(plot.Plot3DBase, _QTGnuPlot):
         self.set_property('palette', dict(name=pal, gamma=gamma), \
                 update=update)
 
-    def create_plot_command(self, fullpath=True, data_entry=None):
+    def create_plot_command(self, fullpath=True, data_entry=None, feed=False):
         '''
         Create a gnuplot splot command.
         If data_entry is given only that item will be used, otherwise
         all items are included.
+        If feed is True, data kept in memory is sent to gnuplot as
+        datablocks, and the commands to update these are included.
         '''
 
         s = 'splot '
+        feedcmd = ''
         first = True
 
         if data_entry is not None:
@@ -897,7 +1052,20 @@ class Plot3D(plot.Plot3DBase, _QTGnuPlot):
                 filepath = data.get_filename()
             filepath = filepath.replace('\\','/')
 
-            using = '%d:%d:($%d+%f+%f*column(-1)+%f*column(-2))' % (coorddims[0] + 1, coorddims[1] + 1, valdim + 1, ofs, traceofs, surfofs)
+            # All blocks are shown, so the datablock only grows
+            columns = [coorddims[0], coorddims[1], valdim]
+            datafeed = None
+            if feed:
+                datafeed = self._get_feed(datadict, columns)
+            if datafeed is not None:
+                feedcmd += datafeed.update(0, 0)
+                datasrc = datafeed.name
+                cols = [1, 2, 3]
+            else:
+                datasrc = '"%s"' % str(filepath)
+                cols = [col + 1 for col in columns]
+
+            using = '%d:%d:($%d+%f+%f*column(-1)+%f*column(-2))' % (cols[0], cols[1], cols[2], ofs, traceofs, surfofs)
 
             style = self.get_property('style')
             if style == self.STYLE_IMAGE:
@@ -914,7 +1082,7 @@ class Plot3D(plot.Plot3DBase, _QTGnuPlot):
                 s += ', '
             else:
                 first = False
-            s += '"%s" using %s %s' % (str(filepath), using, everystr)
+            s += '%s using %s %s' % (datasrc, using, everystr)
 
             defaults = {
                 'with': self._default_with
@@ -930,7 +1098,7 @@ class Plot3D(plot.Plot3DBase, _QTGnuPlot):
         if first:
             return ''
         else:
-            return s
+            return feedcmd + s
 
     def save_gp(self, filepath=None, **kwargs):
         '''Save file that can be opened with gnuplot.'''
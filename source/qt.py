@@ -4,6 +4,7 @@ import os
 import sys
 from qtflow import get_flowcontrol
 from instruments import get_instruments
+from source.lib.poller import get_poller
 from lib import config as _config
 from data import Data
 from plot import Plot, plot, plot3, replot_all
@@ -13,6 +14,7 @@ config = _config.get_config()
 
 data = Data.get_named_list()
 instruments = get_instruments()
+poller = get_poller()
 frontpanels = {}
 sliders = {}
 scripts = Scripts()
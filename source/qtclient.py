@@ -5,7 +5,6 @@
 
 from lib.network.object_sharer import helper
 import time
-import types
 
 from lib import config
 config = config.get_config()
@@ -24,19 +23,20 @@ if flow is None:
 	if flow is None:
 		raise ValueError('Unable to locate qt.flow object (%s), client failed to start' % config['instance_name'])
 	else:
-		print 'Connected to undefined qtlab instance'
+		print('Connected to undefined qtlab instance')
 
 for i in range(100):
 	status = flow.get_status()
 	if not (status is None or status == "starting"):
 		break
-	print 'Status: %r, waiting...' % status
+	print('Status: %r, waiting...' % status)
 	time.sleep(2)
 
 instruments = helper.find_object('%s:instruments1' % config['instance_name'])
 plots = helper.find_object('%s:namedlist_plot' % config['instance_name'])
 data = helper.find_object('%s:namedlist_data' % config['instance_name'])
 interpreter = helper.find_object('%s:python_server' % config['instance_name'])
+poller = helper.find_object('%s:poller' % config['instance_name'])
 frontpanels = {}
 sliders = {}
 
@@ -71,10 +71,10 @@ def format_parameter_value(opt, val):
 			else:
 				format = '%s'
 
-			if type(val) in (types.ListType, types.TupleType):
+			if type(val) in (list, tuple):
 				val = tuple(val)
 
-			elif type(val) is types.DictType:
+			elif type(val) is dict:
 				fmt = ""
 				first = True
 				for k in val.keys():
@@ -91,7 +91,7 @@ def format_parameter_value(opt, val):
 
 			valstr = format % (val)
 
-	except Exception, e:
+	except Exception as e:
 		valstr = str(val)
 
 	if 'units' in opt:
@@ -263,6 +263,10 @@ class FlowControl:
 		'''Request an abort.'''
 		self._abort = True
 
+	def is_abort_requested(self):
+		'''Return whether an abort was requested, without handling it.'''
+		return self._abort
+
 	def is_paused(self):
 		return self._pause
 